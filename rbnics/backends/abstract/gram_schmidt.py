@@ -23,7 +23,7 @@ class GramSchmidt(object, metaclass=ABCMeta):
     def __init__(self, inner_product):
         pass
         
-    # Apply Gram Schmidt on the provided basis functions matrix
+    # Apply Gram Schmidt on the provided basis functions matrix, orthonormalizing its last N_new basis functions
     @abstractmethod
-    def apply(self, basis_functions, N_bc):
+    def apply(self, basis_functions, N_bc, N_new=1):
         pass
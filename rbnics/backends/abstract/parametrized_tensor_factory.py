@@ -61,3 +61,7 @@ class ParametrizedTensorFactory(object, metaclass=ABCMeta):
     @abstractmethod
     def is_time_dependent(self):
         pass
+        
+    @abstractmethod
+    def is_solution_dependent(self):
+        pass
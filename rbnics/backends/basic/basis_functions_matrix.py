@@ -37,6 +37,7 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
             self._components_name = list() # filled in by init
             self._component_name_to_basis_component_index = ComponentNameToBasisComponentIndexDict() # filled in by init
             self._component_name_to_basis_component_length = OnlineSizeDict()
+            self._dense_storage = None # storage of all basis functions in a dense matrix, prepared on demand by the backend
 
         def init(self, components_name):
             if self._components_name != components_name: # Do nothing if it was already initialized with the same dicts
@@ -58,6 +59,8 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
                 self._precomputed_sub_components.clear()
                 # Reset precomputed slices
                 self._precomputed_slices.clear()
+                # Reset dense storage
+                self._dense_storage = None
                 # Patch FunctionsList.enrich() to update internal attributes
                 def patch_functions_list_enrich(component_name, functions_list):
                     original_functions_list_enrich = functions_list.enrich
@@ -74,6 +77,8 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
                         self._precomputed_slices.clear()
                         # Prepare trivial precomputed slice
                         self._prepare_trivial_precomputed_slice()
+                        # Reset dense storage
+                        self._dense_storage = None
                     functions_list.enrich_patch = PatchInstanceMethod(functions_list, "enrich", patched_functions_list_enrich)
                     functions_list.enrich_patch.patch()
                 for component_name in components_name:
@@ -244,6 +249,8 @@ def BasisFunctionsMatrix(backend, wrapping, online_backend, online_wrapping):
             assert len(self._components) == 1, "Cannot set components, only single functions. Did you mean to call __getitem__ to extract a component and __setitem__ of a single function on that component?"
             assert len(self._components_name) == 1
             self._components[self._components_name[0]][key] = item
+            # Reset dense storage
+            self._dense_storage = None
         
         @overload(int)
         def _precompute_slice(self, N):
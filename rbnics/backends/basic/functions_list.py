@@ -36,6 +36,8 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping, Additional
         ConvertAdditionalFunctionTypes = _ConvertAdditionalFunctionTypes
                 
     class _FunctionsList(AbstractFunctionsList):
+        _keep_dense_storage = True # whether the dense storage prepared on demand by the backend is kept for later use
+        
         def __init__(self, space, component):
             if component is None:
                 self.space = space
@@ -44,12 +46,14 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping, Additional
             self.mpi_comm = wrapping.get_mpi_comm(space)
             self._list = list() # of functions
             self._precomputed_slices = Cache() # from tuple to FunctionsList
+            self._dense_storage = None # storage of all functions in a dense matrix, prepared on demand by the backend
         
         def enrich(self, functions, component=None, weights=None, copy=True):
             # Append to storage
             self._enrich(functions, component, weights, copy)
-            # Reset precomputed slices
+            # Reset precomputed slices and dense storage
             self._precomputed_slices = Cache()
+            self._dense_storage = None
             # Prepare trivial precomputed slice
             self._precomputed_slices[len(self._list)] = self
         
@@ -69,7 +73,7 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping, Additional
                     
         @overload(TimeSeries, (None, str, dict_of(str, str)), (None, list_of(Number)), bool)
         def _enrich(self, functions, component, weights, copy):
-            self._enrich(functions._list, component, weights, copy)
+            self._enrich(list(functions), component, weights, copy)
         
         @overload(object, (None, str, dict_of(str, str)), (None, Number, list_of(Number)), bool)
         def _enrich(self, function, component, weight, copy):
@@ -102,8 +106,9 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping, Additional
             
         def clear(self):
             self._list = list()
-            # Reset precomputed slices
+            # Reset precomputed slices and dense storage
             self._precomputed_slices.clear()
+            self._dense_storage = None
             
         def save(self, directory, filename):
             self._save_Nmax(directory, filename)
@@ -169,12 +174,14 @@ def FunctionsList(backend, wrapping, online_backend, online_wrapping, Additional
         @overload(int, backend.Function.Type())
         def __setitem__(self, key, item):
             self._list[key] = item
+            # Reset dense storage
+            self._dense_storage = None
             
         @overload(int, object)
         def __setitem__(self, key, item):
             if AdditionalIsFunction(item):
                 item = ConvertAdditionalFunctionTypes(item)
-                self._list[key] = item
+                self.__setitem__(key, item)
             else:
                 raise RuntimeError("Invalid function provided to FunctionsList.__setitem__()")
                 
@@ -25,17 +25,24 @@ def GramSchmidt(backend, wrapping):
             # Inner product
             self.inner_product = inner_product
             
-        def apply(self, basis_functions, N_bc):
+        def apply(self, basis_functions, N_bc, N_new=1):
+            n_basis = len(basis_functions)
+            for n in range(n_basis - N_new, n_basis):
+                self._apply(basis_functions, N_bc, n)
+                
+        def _apply(self, basis_functions, N_bc, n):
             inner_product = self.inner_product
             
             transpose = backend.transpose
-
-            n_basis = len(basis_functions)
-            b = basis_functions[n_basis - 1]
-            for i in range(N_bc, n_basis - 1):
-                b = wrapping.gram_schmidt_projection_step(b, inner_product, basis_functions[i], transpose)
+            
+            b = basis_functions[n]
+            if n > N_bc:
+                # Classical Gram-Schmidt with one reorthogonalization pass, each pass projecting
+                # on all previous basis functions at once
+                for _ in range(2):
+                    b = wrapping.gram_schmidt_projection_step(b, inner_product, basis_functions[:n], transpose, N_bc)
             norm_b = sqrt(transpose(b)*inner_product*b)
             if norm_b != 0.:
                 b /= norm_b
-            basis_functions[n_basis - 1] = b
+            basis_functions[n] = b
     return _GramSchmidt
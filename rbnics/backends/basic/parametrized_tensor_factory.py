@@ -107,6 +107,9 @@ def ParametrizedTensorFactory(backend, wrapping):
         def is_time_dependent(self):
             return wrapping.is_time_dependent(self._form, wrapping.form_iterator)
             
+        def is_solution_dependent(self):
+            return wrapping.is_solution_dependent(self._form, wrapping.form_iterator)
+            
         @overload(lambda cls: cls)
         def __add__(self, other):
             form_sum = self._form + other._form
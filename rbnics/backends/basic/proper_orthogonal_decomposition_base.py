@@ -17,34 +17,61 @@
 #
 
 from math import sqrt
-from numpy import abs, cumsum as compute_retained_energy, isclose, sum as compute_total_energy
+from numpy import abs, cumsum as compute_retained_energy, finfo, isclose, sum as compute_total_energy
+from numpy.random import RandomState
 from rbnics.utils.io import ExportableList
 
 # Class containing the implementation of the POD
 def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_wrapping, ParentProperOrthogonalDecomposition, SnapshotsContainerType, BasisContainerType):
     class _ProperOrthogonalDecompositionBase(ParentProperOrthogonalDecomposition):
+        
+        # Relative tolerance to detect linearly dependent snapshots in the randomized and incremental algorithms
+        _orthogonality_tolerance = sqrt(finfo(float).eps)
 
         def __init__(self, space, inner_product, *args):
             self.inner_product = inner_product
             self.space = space
             self.args = args
+            
+            # Read in the algorithm to be used for the decomposition
+            from rbnics.utils.config import config # cannot import at global scope
+            self.method = config.get("POD", "method")
+            assert self.method in ("eigensolver", "randomized", "incremental")
+            self.oversampling = int(config.get("POD", "randomized oversampling"))
                         
             # Declare a matrix to store the snapshots
             self.snapshots_matrix = SnapshotsContainerType(self.space, *args)
             # Declare a list to store eigenvalues
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            # Declare storage for the incremental decomposition, updated as snapshots are stored
+            self._incremental_basis = BasisContainerType(self.space, *args)
+            self._incremental_eigenvalues = list()
+            self._incremental_total_energy = 0.
             
         def clear(self):
             self.snapshots_matrix.clear()
             self.eigenvalues = ExportableList("text")
             self.retained_energy = ExportableList("text")
+            self._incremental_basis = BasisContainerType(self.space, *self.args)
+            self._incremental_eigenvalues = list()
+            self._incremental_total_energy = 0.
             
         # No implementation is provided for store_snapshot, because
         # it has different interface for the standard POD and
         # the tensor one.
                 
         def apply(self, Nmax, tol):
+            if self.method == "eigensolver":
+                return self._apply_eigensolver(Nmax, tol)
+            elif self.method == "randomized":
+                return self._apply_randomized(Nmax, tol)
+            elif self.method == "incremental":
+                return self._apply_incremental(Nmax, tol)
+            else:
+                raise ValueError("Invalid POD method")
+                
+        def _apply_eigensolver(self, Nmax, tol):
             inner_product = self.inner_product
             snapshots_matrix = self.snapshots_matrix
             transpose = backend.transpose
@@ -56,29 +83,16 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             
             basis_functions = BasisContainerType(self.space, *self.args)
             
-            eigensolver = online_backend.OnlineEigenSolver(basis_functions, correlation)
-            parameters = {
-                "problem_type": "hermitian",
-                "spectrum": "largest real"
-            }
-            eigensolver.set_parameters(parameters)
-            eigensolver.solve()
+            eigensolver = self._solve_eigenproblem(basis_functions, correlation)
             
             Neigs = len(self.snapshots_matrix)
             Nmax = min(Nmax, Neigs)
-            assert len(self.eigenvalues) is 0
+            eigenvalues = list()
             for i in range(Neigs):
                 (eig_i_real, eig_i_complex) = eigensolver.get_eigenvalue(i)
                 assert isclose(eig_i_complex, 0.)
-                self.eigenvalues.append(eig_i_real)
-            
-            total_energy = compute_total_energy([abs(e) for e in self.eigenvalues])
-            retained_energy = compute_retained_energy([abs(e) for e in self.eigenvalues])
-            assert len(self.retained_energy) is 0
-            if total_energy > 0.:
-                self.retained_energy.extend([retained_energy_i/total_energy for retained_energy_i in retained_energy])
-            else:
-                self.retained_energy.extend([1. for _ in range(Neigs)]) # trivial case, all snapshots are zero
+                eigenvalues.append(eig_i_real)
+            self._store_eigenvalues(eigenvalues, compute_total_energy([abs(e) for e in eigenvalues]))
             
             eigenvectors = list()
             for N in range(Nmax):
@@ -97,10 +111,201 @@ def ProperOrthogonalDecompositionBase(backend, wrapping, online_backend, online_
             N += 1
             
             return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
+            
+        def _apply_randomized(self, Nmax, tol):
+            # Randomized range finder: the correlation matrix is only projected onto an orthonormal basis Q
+            # of the (approximate) range of the snapshots, which is enlarged until the energy tolerance is met
+            inner_product = self.inner_product
+            snapshots_matrix = self.snapshots_matrix
+            transpose = backend.transpose
+            assert inner_product is not None
+            
+            Ns = len(snapshots_matrix)
+            Nmax = min(Nmax, Ns)
+            total_energy = compute_total_energy([transpose(snapshot)*inner_product*snapshot for snapshot in snapshots_matrix])
+            
+            range_basis = BasisContainerType(self.space, *self.args) # Q
+            range_image = BasisContainerType(self.space, *self.args) # S S^T X Q
+            random = RandomState(0) # same sketch on every process
+            k = min(self.oversampling, Ns)
+            while True:
+                range_exhausted = False
+                while len(range_basis) < k:
+                    omega = online_backend.OnlineVector(Ns)
+                    for (i, omega_i) in enumerate(random.standard_normal(Ns)):
+                        omega[i] = omega_i
+                    sketch = snapshots_matrix*omega
+                    sketch = snapshots_matrix*(transpose(snapshots_matrix)*inner_product*sketch) # one power iteration
+                    (sketch, _) = self._project_out(sketch, range_basis)
+                    norm_sketch = sqrt(transpose(sketch)*inner_product*sketch)
+                    if norm_sketch <= self._orthogonality_tolerance*sqrt(total_energy):
+                        range_exhausted = True
+                        break
+                    q = self._linear_combination([sketch], [1./norm_sketch])
+                    range_basis.enrich(q, copy=False)
+                    range_image.enrich(snapshots_matrix*(transpose(snapshots_matrix)*inner_product*q), copy=False)
+                if len(range_basis) == 0: # trivial case, all snapshots are zero
+                    eigensolver = None
+                    eigenvalues = list()
+                    break
+                projected_correlation = transpose(range_basis)*inner_product*range_image
+                eigensolver = self._solve_eigenproblem(range_basis, projected_correlation)
+                eigenvalues = [eigensolver.get_eigenvalue(i)[0] for i in range(len(range_basis))]
+                retained_energy = compute_retained_energy(eigenvalues)
+                if (
+                    range_exhausted
+                        or
+                    k >= min(Nmax + self.oversampling, Ns)
+                        or
+                    any(retained_energy_i > (1. - tol)*total_energy for retained_energy_i in retained_energy[:Nmax])
+                ):
+                    break
+                k = min(2*k, Nmax + self.oversampling, Ns)
+            
+            self._store_eigenvalues(eigenvalues, total_energy)
+            
+            eigenvectors = list()
+            basis_functions = BasisContainerType(self.space, *self.args)
+            N = self._truncation(min(Nmax, len(eigenvalues)), tol)
+            for n in range(N):
+                (eigvector, _) = eigensolver.get_eigenvector(n)
+                b = self._normalize(range_basis*eigvector)
+                basis_functions.enrich(b)
+                # Recover the eigenvector of the correlation matrix S^T X S from the left singular vector
+                eigvector = transpose(snapshots_matrix)*inner_product*b
+                if eigenvalues[n] > 0.:
+                    eigvector /= sqrt(eigenvalues[n])
+                eigenvectors.append(online_backend.OnlineFunction(eigvector))
+            
+            return (self.eigenvalues[:N], eigenvectors, basis_functions, N)
+            
+        def _apply_incremental(self, Nmax, tol):
+            # Account for snapshots that have been stored but not yet processed
+            self._update_incremental_decomposition()
+            
+            eigenvalues = self._incremental_eigenvalues
+            self._store_eigenvalues(eigenvalues, self._incremental_total_energy)
+            
+            basis_functions = BasisContainerType(self.space, *self.args)
+            N = self._truncation(min(Nmax, len(eigenvalues)), tol)
+            if N > 0:
+                basis_functions.enrich(self._incremental_basis[:N])
+            
+            # Snapshots are discarded after each update, hence eigenvectors of the correlation matrix are not available
+            return (self.eigenvalues[:N], list(), basis_functions, N)
+            
+        def _update_incremental_decomposition(self):
+            # Update the X-orthonormal basis U and the eigenvalues Sigma^2 of the decomposition S = U Sigma V^T
+            # for each snapshot s which has been stored since the last update, i.e. decompose
+            #     [U Sigma, s] = [U, r/rho] K, with p = U^T X s, r = s - U p, rho = ||r||_X and K = [[Sigma, p], [0, rho]]
+            # so that only the eigenproblem for the small matrix K K^T needs to be solved
+            inner_product = self.inner_product
+            transpose = backend.transpose
+            assert inner_product is not None
+            
+            for snapshot in self.snapshots_matrix:
+                norm_snapshot_squared = transpose(snapshot)*inner_product*snapshot
+                self._incremental_total_energy += norm_snapshot_squared
+                if norm_snapshot_squared == 0.:
+                    continue
+                
+                basis = self._incremental_basis
+                eigenvalues = self._incremental_eigenvalues
+                k = len(basis)
+                (residual, p) = self._project_out(snapshot, basis)
+                rho = sqrt(transpose(residual)*inner_product*residual)
+                augmented_basis = BasisContainerType(self.space, *self.args)
+                augmented_basis.enrich(basis, copy=False)
+                if rho > self._orthogonality_tolerance*sqrt(norm_snapshot_squared):
+                    augmented_basis.enrich(self._linear_combination([residual], [1./rho]), copy=False)
+                n = len(augmented_basis)
+                
+                K_K_T = online_backend.OnlineMatrix(n, n)
+                for i in range(k):
+                    for j in range(k):
+                        K_K_T[i, j] = p[i]*p[j]
+                    K_K_T[i, i] += eigenvalues[i]
+                if n > k:
+                    for i in range(k):
+                        K_K_T[i, k] = rho*p[i]
+                        K_K_T[k, i] = rho*p[i]
+                    K_K_T[k, k] = rho**2
+                eigensolver = self._solve_eigenproblem(augmented_basis, K_K_T)
+                
+                self._incremental_basis = BasisContainerType(self.space, *self.args)
+                self._incremental_eigenvalues = list()
+                for i in range(n):
+                    (eig_i_real, _) = eigensolver.get_eigenvalue(i)
+                    if eig_i_real <= self._orthogonality_tolerance**2*self._incremental_total_energy:
+                        break # discard modes carrying a negligible amount of energy
+                    (eigvector, _) = eigensolver.get_eigenvector(i)
+                    self._incremental_basis.enrich(self._normalize(augmented_basis*eigvector), copy=False)
+                    self._incremental_eigenvalues.append(eig_i_real)
+                    
+            self.snapshots_matrix.clear()
+            
+        def _project_out(self, function, basis):
+            # Classical Gram-Schmidt with one reorthogonalization step, returning the residual
+            # of the orthogonal projection on the (orthonormal) basis and the projection coefficients
+            inner_product = self.inner_product
+            transpose = backend.transpose
+            
+            coefficients = [0. for _ in basis]
+            for _ in range(2):
+                projection_coefficients = [transpose(b)*inner_product*function for b in basis]
+                for (i, c) in enumerate(projection_coefficients):
+                    coefficients[i] += c
+                function = self._linear_combination(list(basis) + [function], [- c for c in projection_coefficients] + [1.])
+            return (function, coefficients)
+            
+        def _linear_combination(self, functions, coefficients):
+            functions_list = BasisContainerType(self.space, *self.args)
+            functions_list.enrich(functions, copy=False)
+            coefficients_vector = online_backend.OnlineVector(len(coefficients))
+            for (i, c) in enumerate(coefficients):
+                coefficients_vector[i] = c
+            return functions_list*coefficients_vector
+            
+        def _normalize(self, b):
+            inner_product = self.inner_product
+            transpose = backend.transpose
+            
+            norm_b = sqrt(transpose(b)*inner_product*b)
+            if norm_b != 0.:
+                b /= norm_b
+            return b
+            
+        def _solve_eigenproblem(self, basis_functions, A):
+            eigensolver = online_backend.OnlineEigenSolver(basis_functions, A)
+            parameters = {
+                "problem_type": "hermitian",
+                "spectrum": "largest real"
+            }
+            eigensolver.set_parameters(parameters)
+            eigensolver.solve()
+            return eigensolver
+            
+        def _store_eigenvalues(self, eigenvalues, total_energy):
+            assert len(self.eigenvalues) is 0
+            self.eigenvalues.extend(eigenvalues)
+            retained_energy = compute_retained_energy([abs(e) for e in eigenvalues])
+            assert len(self.retained_energy) is 0
+            if total_energy > 0.:
+                self.retained_energy.extend([retained_energy_i/total_energy for retained_energy_i in retained_energy])
+            else:
+                self.retained_energy.extend([1. for _ in eigenvalues]) # trivial case, all snapshots are zero
+                
+        def _truncation(self, Nmax, tol):
+            N = 0
+            while N < Nmax:
+                N += 1
+                if self.retained_energy[N - 1] > 1. - tol:
+                    break
+            return N
                 
         def print_eigenvalues(self, N=None):
             if N is None:
-                N = len(self.snapshots_matrix)
+                N = len(self.eigenvalues)
             for i in range(N):
                 print("lambda_" + str(i) + " = " + str(self.eigenvalues[i]))
             
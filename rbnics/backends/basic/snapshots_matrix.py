@@ -21,6 +21,9 @@ from rbnics.utils.decorators import dict_of, list_of, overload
 
 def SnapshotsMatrix(FunctionsList):
     class _SnapshotsMatrix(FunctionsList):
+        # Snapshots are usually many more than basis functions, and are multiplied only once (e.g. by POD eigenvectors):
+        # do not keep a dense copy of them, which would double their memory footprint
+        _keep_dense_storage = False
         
         @overload(FunctionsList, (None, str, dict_of(str, str)), (None, list_of(Number)), bool)
         def _enrich(self, functions, component, weights, copy):
@@ -46,6 +46,7 @@ from rbnics.backends.basic.wrapping.get_function_subspace import get_function_su
 from rbnics.backends.basic.wrapping.get_mpi_comm import get_mpi_comm
 from rbnics.backends.basic.wrapping.gram_schmidt_projection_step import gram_schmidt_projection_step
 from rbnics.backends.basic.wrapping.is_parametrized import is_parametrized
+from rbnics.backends.basic.wrapping.is_solution_dependent import is_solution_dependent
 from rbnics.backends.basic.wrapping.is_time_dependent import is_time_dependent
 from rbnics.backends.basic.wrapping.matrix_mul import matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix
 from rbnics.backends.basic.wrapping.tensor_copy import tensor_copy
@@ -87,6 +88,7 @@ __all__ = [
     'get_mpi_comm',
     'gram_schmidt_projection_step',
     'is_parametrized',
+    'is_solution_dependent',
     'is_time_dependent',
     'matrix_mul_vector',
     'tensor_copy',
@@ -16,5 +16,5 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-def gram_schmidt_projection_step(new_basis, inner_product, old_basis):
+def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose, N_bc):
     pass
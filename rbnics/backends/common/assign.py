@@ -27,8 +27,18 @@ def assign(object_to, object_from):
 @overload
 def _assign(object_to: TimeSeries, object_from: TimeSeries):
     if object_from is not object_to:
-        from rbnics.backends import assign
-        assign(object_to._list, object_from._list)
+        if object_from._array is not None:
+            # Always copy into new storage, since the previous one may be shared with views returned by object_to
+            object_to.clear()
+            object_to._array = object_from.array().copy()
+            object_to._length = object_from._length
+            object_to._N = object_from._N
+        else:
+            from rbnics.backends import assign
+            object_to._array = None
+            object_to._length = 0
+            object_to._N = None
+            assign(object_to._list, object_from._list)
         
 @overload
 def _assign(object_to: list_of(Number), object_from: list_of(Number)):
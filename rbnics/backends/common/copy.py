@@ -23,6 +23,10 @@ from rbnics.utils.decorators import backend_for
 def copy(time_series):
     from rbnics.backends import copy
     time_series_copy = TimeSeries(time_series._time_interval, time_series._time_step_size)
-    if len(time_series._list) > 0:
+    if time_series._array is not None:
+        time_series_copy._array = time_series._array.copy()
+        time_series_copy._length = time_series._length
+        time_series_copy._N = time_series._N
+    elif len(time_series._list) > 0:
         time_series_copy._list = copy(time_series._list)
     return time_series_copy
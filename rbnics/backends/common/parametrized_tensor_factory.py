@@ -51,3 +51,6 @@ class ParametrizedTensorFactory(AbstractParametrizedTensorFactory):
         
     def is_time_dependent(self):
         return False
+        
+    def is_solution_dependent(self):
+        return False
@@ -34,6 +34,17 @@ class TimeQuadrature_Numbers(AbstractTimeQuadrature):
         
     def integrate(self):
         return simps(self._function_over_time, dx=self._time_step_size)
+        
+class TimeQuadrature_Array(AbstractTimeQuadrature):
+    def __init__(self, time_interval, time_series):
+        assert len(time_series) > 1
+        self._time_step_size = (time_interval[1] - time_interval[0])/(len(time_series) - 1)
+        self._time_series = time_series
+        
+    def integrate(self):
+        # Integrate all stored values at once, without converting each row to a separate object
+        integrated_array = simps(self._time_series.array(), dx=self._time_step_size, axis=0)
+        return self._time_series._array_to_item(integrated_array)
     
 @overload
 def _TimeQuadrature(time_interval: tuple_of(Number), function_over_time: list_of(Number)):
@@ -41,5 +52,8 @@ def _TimeQuadrature(time_interval: tuple_of(Number), function_over_time: list_of
 
 @overload
 def _TimeQuadrature(time_interval: tuple_of(Number), time_series: TimeSeries):
-    from rbnics.backends import TimeQuadrature
-    return TimeQuadrature(time_interval, time_series._list)
+    if time_series.array() is not None:
+        return TimeQuadrature_Array(time_interval, time_series)
+    else:
+        from rbnics.backends import TimeQuadrature
+        return TimeQuadrature(time_interval, time_series._list)
@@ -17,7 +17,7 @@
 #
 
 from numbers import Number
-from numpy import arange, isclose
+from numpy import arange, asarray, concatenate, delete, empty, isclose
 from rbnics.backends.abstract import TimeSeries as AbstractTimeSeries
 from rbnics.utils.decorators import BackendFor, tuple_of
 
@@ -35,10 +35,15 @@ class TimeSeries(AbstractTimeSeries):
             self._time_interval = time_interval
             self._time_step_size = time_step_size
         self._times = arange(self._time_interval[0], self._time_interval[1] + self._time_step_size/2., self._time_step_size).tolist()
+        # Numbers and online functions are stored in a contiguous array, preallocated with one row per expected time,
+        # while any other object (e.g. truth functions) is stored in a list
         self._list = list()
+        self._array = None
+        self._length = 0
+        self._N = None # None for numbers, size of online functions otherwise
         
     def stored_times(self):
-        return self._times[:len(self._list)]
+        return self._times[:len(self)]
         
     def expected_times(self):
         return self._times
@@ -58,36 +63,130 @@ class TimeSeries(AbstractTimeSeries):
             else:
                 time_interval_1 = self._time_interval[0] + (key.stop - 1)*self._time_step_size
             output = TimeSeries((time_interval_0, time_interval_1), time_step_size)
-            output.extend(self._list[key])
+            if self._array is not None:
+                # Share storage with the current time series, rather than copying it
+                output._array = self._array[:self._length][key]
+                output._length = len(output._array)
+                output._N = self._N
+            else:
+                output._list = self._list[key]
             return output
         else:
             assert isinstance(key, int)
-            return self._list[key]
+            if self._array is not None:
+                if key < 0:
+                    key += self._length
+                if key < 0 or key >= self._length:
+                    raise IndexError("TimeSeries index out of range")
+                return self._array_to_item(self._array[key])
+            else:
+                return self._list[key]
         
     def at(self, time):
         assert time >= self._time_interval[0]
         assert time <= self._time_interval[1]
-        index = int(round(time/self._time_step_size))
-        assert isclose(index*self._time_step_size, time), "Requested time should be a multiple of discretization time step size"
-        return self._list[index]
+        index = int(round((time - self._time_interval[0])/self._time_step_size))
+        assert isclose(self._time_interval[0] + index*self._time_step_size, time), "Requested time should be a multiple of discretization time step size"
+        return self[index]
         
     def __iter__(self):
-        return iter(self._list)
+        if self._array is not None:
+            return map(self._array_to_item, self._array[:self._length])
+        else:
+            return iter(self._list)
         
     def __len__(self):
-        return len(self._list)
+        if self._array is not None:
+            return self._length
+        else:
+            return len(self._list)
         
     def __delitem__(self, key):
-        del self._list[key]
+        if self._array is not None:
+            indices = range(self._length)[key]
+            if isinstance(indices, int):
+                indices = [indices]
+            self._array = concatenate((delete(self._array[:self._length], indices, axis=0), self._array[self._length:]))
+            self._length -= len(indices)
+        else:
+            del self._list[key]
         
     def append(self, item):
-        self._list.append(item)
+        if len(self) == 0 and (self._array is None or not self._item_fits_array(item)):
+            self._init_storage(item)
+        if self._array is not None and not self._item_fits_array(item):
+            self._convert_to_list()
+        if self._array is not None:
+            if self._length == len(self._array):
+                self._array = concatenate((self._array, empty(self._array.shape)))
+            self._array[self._length] = self._item_to_array(item)
+            self._length += 1
+        else:
+            self._list.append(item)
         
     def extend(self, iterable):
-        self._list.extend(iterable)
+        for item in iterable:
+            self.append(item)
         
     def clear(self):
         del self._list[:]
+        # Do not reuse the array, since it may be shared with slices, items or views previously returned
+        self._array = None
+        self._length = 0
+        self._N = None
+        
+    def array(self):
+        """
+        Return a (number of stored times) x (size of stored online functions) view of the stored values,
+        or None if stored values do not allow for a contiguous storage.
+        """
+        if self._array is not None:
+            return self._array[:self._length]
+        else:
+            return None
+        
+    def _init_storage(self, item):
+        del self._list[:]
+        self._length = 0
+        capacity = max(len(self._times), 1)
+        if isinstance(item, Number):
+            self._N = None
+            self._array = empty((capacity, ))
+        elif _is_online_function(item):
+            self._N = item.N
+            self._array = empty((capacity, asarray(item.vector()).size))
+        else:
+            self._N = None
+            self._array = None
+            
+    def _item_fits_array(self, item):
+        if self._N is None:
+            return isinstance(item, Number)
+        else:
+            return _is_online_function(item) and item.N == self._N
+            
+    def _item_to_array(self, item):
+        if self._N is None:
+            return item
+        else:
+            return asarray(item.vector())
+            
+    def _array_to_item(self, row):
+        if self._N is None:
+            return float(row)
+        else:
+            from rbnics.backends.online import OnlineFunction, OnlineVector
+            return OnlineFunction(OnlineVector.Type()(self._N, row))
+            
+    def _convert_to_list(self):
+        self._list = list(self)
+        self._array = None
+        self._length = 0
+        self._N = None
         
     def __str__(self):
-        return str([e if isinstance(e, Number) else str(e) for e in self._list])
+        return str([e if isinstance(e, Number) else str(e) for e in self])
+        
+def _is_online_function(item):
+    from rbnics.backends.online import OnlineFunction # cannot import at global scope due to cyclic dependence
+    return isinstance(item, OnlineFunction.Type())
@@ -32,10 +32,12 @@ class LinearSolver(AbstractLinearSolver):
     @overload((Form, Matrix.Type(), ParametrizedTensorFactory), Function.Type(), (Form, ParametrizedTensorFactory, Vector.Type()), (list_of(DirichletBC), ProductOutputDirichletBC, dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC), None))
     def __init__(self, lhs, solution, rhs, bcs=None):
         self.solution = solution
+        self._bcs = bcs
         self._init_lhs(lhs, bcs)
         self._init_rhs(rhs, bcs)
         self._apply_bcs(bcs)
         self._linear_solver = "default"
+        self._factorized_solver = None
         self.monitor = None
         
     @overload(LinearProblemWrapper, Function.Type())
@@ -94,14 +96,38 @@ class LinearSolver(AbstractLinearSolver):
             for bc in bcs[key]:
                 bc.apply(self.lhs, self.rhs)
                 
+    @overload
+    def _apply_bcs_to_rhs(self, bcs: None):
+        pass
+        
+    @overload
+    def _apply_bcs_to_rhs(self, bcs: (list_of(DirichletBC), ProductOutputDirichletBC)):
+        for bc in bcs:
+            bc.apply(self.rhs)
+            
+    @overload
+    def _apply_bcs_to_rhs(self, bcs: (dict_of(str, list_of(DirichletBC)), dict_of(str, ProductOutputDirichletBC))):
+        for key in bcs:
+            for bc in bcs[key]:
+                bc.apply(self.rhs)
+                
     def set_parameters(self, parameters):
         assert len(parameters) in (0, 1)
         if len(parameters) is 1:
             assert "linear_solver" in parameters
         self._linear_solver = parameters.get("linear_solver", "default")
+        self._factorized_solver = None
+        
+    def set_rhs(self, rhs):
+        self._init_rhs(rhs, self._bcs)
+        self._apply_bcs_to_rhs(self._bcs)
         
     def solve(self):
-        solver = PETScLUSolver(self._linear_solver)
-        solver.solve(self.lhs, self.solution.vector(), self.rhs)
+        # The factorization of the left-hand side is computed at the first solve, and reused by subsequent solves
+        # after a new right-hand side has been provided through set_rhs()
+        if self._factorized_solver is None:
+            self._factorized_solver = PETScLUSolver(self._linear_solver)
+            self._factorized_solver.set_operator(self.lhs)
+        self._factorized_solver.solve(self.solution.vector(), self.rhs)
         if self.monitor is not None:
             self.monitor(self.solution)
@@ -16,7 +16,8 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from sympy import ccode, MatrixSymbol, sympify
+from numpy import array, einsum, full
+from sympy import ccode, ImmutableMatrix, lambdify, MatrixSymbol, sympify
 from mpi4py.MPI import MAX, MIN
 from dolfin import ALE, cells, Function, FunctionSpace, has_pybind11, LagrangeInterpolator, VectorFunctionSpace
 if has_pybind11():
@@ -38,8 +39,10 @@ class MeshMotion(AbstractMeshMotion):
         self.reference_coordinates = self.mesh.coordinates().copy()
         self.deformation_V = VectorFunctionSpace(self.mesh, "Lagrange", 1)
         self.subdomain_id_to_deformation_dofs = dict() # from int to list
+        self.vertex_to_subdomain_id = full(self.mesh.num_vertices(), -1, dtype=int)
         for cell in cells(self.mesh):
             subdomain_id = int(self.subdomains[cell]) - 1 # tuple start from 0, while subdomains from 1
+            self.vertex_to_subdomain_id[cell.entities(0)] = subdomain_id # vertices on interfaces are moved consistently by any of the adjacent subdomains
             if subdomain_id not in self.subdomain_id_to_deformation_dofs:
                 self.subdomain_id_to_deformation_dofs[subdomain_id] = list()
             dofs = self.deformation_V.dofmap().cell_dofs(cell.index())
@@ -64,56 +67,109 @@ class MeshMotion(AbstractMeshMotion):
         # Subdomain numbering is contiguous
         assert min(self.subdomain_id_to_deformation_dofs.keys()) == 0
         assert len(self.subdomain_id_to_deformation_dofs.keys()) == max(self.subdomain_id_to_deformation_dofs.keys()) + 1
+        # Every vertex belongs to at least one cell
+        assert all(self.vertex_to_subdomain_id >= 0)
         
         # Store the shape parametrization expression
         self.shape_parametrization_expression = shape_parametrization_expression
         assert len(self.shape_parametrization_expression) == len(self.subdomain_id_to_deformation_dofs.keys())
         
-        # Prepare storage for displacement expression, computed by init()
+        # Prepare storage for the problem, assigned by init()
+        self.problem = None
+        
+        # Prepare storage for the symbolic shape parametrization expression, computed by init()
+        self.shape_parametrization_expression_sympy = None
+        
+        # Prepare storage for displacement expression, computed by init() or, in case the shape parametrization
+        # is affine, by compute_displacement()
         self.displacement_expression = list()
         
+        # Prepare storage for the affine maps x -> A(mu) x + b(mu) on every subdomain, computed by init()
+        # in case the shape parametrization is affine
+        self.affine_maps = None
+        
     def init(self, problem):
-        if len(self.displacement_expression) == 0: # avoid initialize multiple times
+        if self.problem is None: # avoid initialize multiple times
+            # Store the problem, which provides the current value of the parameters
+            self.problem = problem
+            
             # Preprocess the shape parametrization expression to convert it in the displacement expression
             # This cannot be done during __init__ because at construction time the number
             # of parameters is still unknown
             
             # Declare first some sympy simbolic quantities, needed by ccode
             from rbnics.shape_parametrization.utils.symbolic import sympy_symbolic_coordinates
-            x = sympy_symbolic_coordinates(self.mesh.geometry().dim(), MatrixSymbol)
+            dim = self.mesh.geometry().dim()
+            x = sympy_symbolic_coordinates(dim, MatrixSymbol)
             mu = MatrixSymbol("mu", len(problem.mu), 1)
-            
-            # Then carry out the proprocessing
+            shape_parametrization_expression_sympy = list()
             for shape_parametrization_expression_on_subdomain in self.shape_parametrization_expression:
-                displacement_expression_on_subdomain = list()
-                assert len(shape_parametrization_expression_on_subdomain) == self.mesh.geometry().dim()
-                for (component, shape_parametrization_component_on_subdomain) in enumerate(shape_parametrization_expression_on_subdomain):
-                    # convert from shape parametrization T to displacement d = T - I
-                    displacement_expression_component_on_subdomain = sympify(shape_parametrization_component_on_subdomain + " - x[" + str(component) + "]", locals={"x": x, "mu": mu})
-                    displacement_expression_on_subdomain.append(
-                        ccode(displacement_expression_component_on_subdomain).replace(", 0]", "]"),
-                    )
-                self.displacement_expression.append(
-                    ParametrizedExpression(
-                        problem,
-                        tuple(displacement_expression_on_subdomain),
-                        mu=problem.mu,
-                        element=self.deformation_V.ufl_element(),
-                        domain=self.mesh
-                    )
+                assert len(shape_parametrization_expression_on_subdomain) == dim
+                shape_parametrization_expression_sympy.append([
+                    sympify(shape_parametrization_component_on_subdomain, locals={"x": x, "mu": mu})
+                    for shape_parametrization_component_on_subdomain in shape_parametrization_expression_on_subdomain
+                ])
+            
+            # If the shape parametrization is affine on every subdomain, store the rows [A(mu) b(mu)] of all subdomains
+            # in a single function of mu, so that the mesh can be moved by acting directly on vertex coordinates
+            if all(
+                not shape_parametrization_component_on_subdomain.diff(x[j, 0]).has(x)
+                for shape_parametrization_expression_on_subdomain in shape_parametrization_expression_sympy
+                for shape_parametrization_component_on_subdomain in shape_parametrization_expression_on_subdomain
+                for j in range(dim)
+            ):
+                affine_maps_rows = list()
+                for shape_parametrization_expression_on_subdomain in shape_parametrization_expression_sympy:
+                    for shape_parametrization_component_on_subdomain in shape_parametrization_expression_on_subdomain:
+                        affine_maps_rows.append(
+                            [shape_parametrization_component_on_subdomain.diff(x[j, 0]) for j in range(dim)] +
+                            [shape_parametrization_component_on_subdomain.subs({x[j, 0]: 0 for j in range(dim)})]
+                        )
+                self.affine_maps = lambdify((mu, ), ImmutableMatrix(affine_maps_rows), modules="numpy")
+            
+            # Store the symbolic expressions, since the displacement expression is compiled only when required
+            self.shape_parametrization_expression_sympy = (x, shape_parametrization_expression_sympy)
+            if self.affine_maps is None:
+                self._init_displacement_expression()
+                
+    def _init_displacement_expression(self):
+        # Carry out the proprocessing for the interpolation of the displacement
+        (x, shape_parametrization_expression_sympy) = self.shape_parametrization_expression_sympy
+        for shape_parametrization_expression_on_subdomain in shape_parametrization_expression_sympy:
+            displacement_expression_on_subdomain = list()
+            for (component, shape_parametrization_component_on_subdomain) in enumerate(shape_parametrization_expression_on_subdomain):
+                # convert from shape parametrization T to displacement d = T - I
+                displacement_expression_component_on_subdomain = shape_parametrization_component_on_subdomain - x[component, 0]
+                displacement_expression_on_subdomain.append(
+                    ccode(displacement_expression_component_on_subdomain).replace(", 0]", "]"),
                 )
+            self.displacement_expression.append(
+                ParametrizedExpression(
+                    self.problem,
+                    tuple(displacement_expression_on_subdomain),
+                    mu=self.problem.mu,
+                    element=self.deformation_V.ufl_element(),
+                    domain=self.mesh
+                )
+            )
         
     def move_mesh(self):
         log(PROGRESS, "moving mesh")
-        displacement = self.compute_displacement()
-        ALE.move(self.mesh, displacement)
+        if self.affine_maps is not None:
+            self.mesh.coordinates()[:] = self.compute_affine_coordinates()
+        else:
+            displacement = self.compute_displacement()
+            ALE.move(self.mesh, displacement)
         
     def reset_reference(self):
         log(PROGRESS, "back to the reference mesh")
         self.mesh.coordinates()[:] = self.reference_coordinates
         
-    # Auxiliary method to deform the domain
+    # Auxiliary method to deform the domain. It is used by move_mesh only in case of a non affine shape parametrization,
+    # but it is also available for an affine one, e.g. to compare with compute_affine_coordinates
     def compute_displacement(self):
+        if len(self.displacement_expression) == 0:
+            self._init_displacement_expression()
         displacement = Function(self.deformation_V)
         assert len(self.displacement_expression) == len(self.shape_parametrization_expression)
         for (subdomain, displacement_expression_on_subdomain) in enumerate(self.displacement_expression):
@@ -122,3 +178,12 @@ class MeshMotion(AbstractMeshMotion):
             subdomain_dofs = self.subdomain_id_to_deformation_dofs[subdomain]
             displacement.vector()[subdomain_dofs] = displacement_function_on_subdomain.vector()[subdomain_dofs]
         return displacement
+        
+    # Auxiliary method to deform the domain in case of an affine shape parametrization
+    def compute_affine_coordinates(self):
+        dim = self.mesh.geometry().dim()
+        mu = array(self.problem.mu, dtype=float).reshape(-1, 1)
+        affine_maps = array(self.affine_maps(mu), dtype=float).reshape(-1, dim, dim + 1)
+        assert affine_maps.shape[0] == len(self.shape_parametrization_expression)
+        affine_maps_on_vertices = affine_maps[self.vertex_to_subdomain_id]
+        return einsum("vij,vj->vi", affine_maps_on_vertices[:, :, :dim], self.reference_coordinates) + affine_maps_on_vertices[:, :, dim]
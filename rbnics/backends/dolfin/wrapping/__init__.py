@@ -56,6 +56,7 @@ from rbnics.backends.dolfin.wrapping.get_default_linear_solver import get_defaul
 from rbnics.backends.dolfin.wrapping.get_function_norm import get_function_norm
 from rbnics.backends.dolfin.wrapping.get_function_space import get_function_space
 from rbnics.backends.dolfin.wrapping.get_function_subspace import get_function_subspace
+from rbnics.backends.dolfin.wrapping.get_functions_list_dense_storage import get_functions_list_dense_storage
 from rbnics.backends.dolfin.wrapping.get_global_dof_component import get_global_dof_component
 from rbnics.backends.dolfin.wrapping.get_global_dof_coordinates import get_global_dof_coordinates
 from rbnics.backends.dolfin.wrapping.get_global_dof_to_local_dof_map import get_global_dof_to_local_dof_map
@@ -66,6 +67,7 @@ from rbnics.backends.dolfin.wrapping.is_parametrized import is_parametrized
 from rbnics.backends.dolfin.wrapping.is_problem_solution import is_problem_solution
 from rbnics.backends.dolfin.wrapping.is_problem_solution_dot import is_problem_solution_dot
 from rbnics.backends.dolfin.wrapping.is_problem_solution_type import is_problem_solution_type
+from rbnics.backends.dolfin.wrapping.is_solution_dependent import is_solution_dependent
 from rbnics.backends.dolfin.wrapping.is_time_dependent import is_time_dependent
 from rbnics.backends.dolfin.wrapping.matrix_mul import matrix_mul_vector, vectorized_matrix_inner_vectorized_matrix
 from rbnics.backends.dolfin.wrapping.parametrized_constant import is_parametrized_constant, ParametrizedConstant, parametrized_constant_to_float
@@ -126,6 +128,7 @@ __all__ = [
     'get_function_norm',
     'get_function_space',
     'get_function_subspace',
+    'get_functions_list_dense_storage',
     'get_global_dof_component',
     'get_global_dof_coordinates',
     'get_global_dof_to_local_dof_map',
@@ -139,6 +142,7 @@ __all__ = [
     'is_problem_solution_type',
     'is_pull_back_expression',
     'is_pull_back_expression_parametrized',
+    'is_solution_dependent',
     'is_time_dependent',
     'map_functionspaces_between_mesh_and_submesh',
     'matrix_mul_vector',
@@ -16,7 +16,9 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from numpy import asarray, hstack
 from dolfin import Function, FunctionSpace
+from rbnics.backends.dolfin.wrapping.get_functions_list_dense_storage import get_functions_list_dense_storage
 
 def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matrix, BasisFunctionsMatrixType):
     space = basis_functions_matrix.space
@@ -24,17 +26,17 @@ def basis_functions_matrix_mul_online_matrix(basis_functions_matrix, online_matr
     
     output = BasisFunctionsMatrixType(space)
     assert isinstance(online_matrix.M, dict)
+    online_matrix_content = asarray(online_matrix, dtype=float)
+    assert online_matrix_content.shape == (sum(basis_functions_matrix._component_name_to_basis_component_length.values()), sum(online_matrix.M.values()))
+    if online_matrix_content.shape[0] > 0:
+        output_content = online_matrix_content.T.dot(_get_basis_functions_matrix_dense_storage(basis_functions_matrix).T) # row j contains the local part of the j-th output
     j = 0
     for col_component_name in basis_functions_matrix._components_name:
         for _ in range(online_matrix.M[col_component_name]):
-            assert len(online_matrix[:, j]) == sum(len(functions_list) for functions_list in basis_functions_matrix._components)
             output_j = Function(space)
-            i = 0
-            for row_component_name in basis_functions_matrix._components_name:
-                for fun_i in basis_functions_matrix._components[row_component_name]:
-                    output_j.vector().add_local(fun_i.vector().get_local()*online_matrix[i, j])
-                    i += 1
-            output_j.vector().apply("add")
+            if online_matrix_content.shape[0] > 0:
+                output_j.vector().add_local(output_content[j])
+                output_j.vector().apply("add")
             output.enrich(output_j)
             j += 1
     return output
@@ -47,10 +49,31 @@ def basis_functions_matrix_mul_online_vector(basis_functions_matrix, online_vect
     if sum(basis_functions_matrix._component_name_to_basis_component_length.values()) is 0:
         return output
     else:
-        i = 0
-        for component_name in basis_functions_matrix._components_name:
-            for fun_i in basis_functions_matrix._components[component_name]:
-                output.vector().add_local(fun_i.vector().get_local()*online_vector[i])
-                i += 1
+        online_vector_content = asarray(online_vector, dtype=float).reshape(-1)
+        assert len(online_vector_content) == sum(basis_functions_matrix._component_name_to_basis_component_length.values())
+        output.vector().add_local(_get_basis_functions_matrix_dense_storage(basis_functions_matrix).dot(online_vector_content))
         output.vector().apply("add")
         return output
+        
+def _get_basis_functions_matrix_dense_storage(basis_functions_matrix):
+    # The concatenated storage is cached by the basis functions matrix, which discards it as soon as
+    # the matrix is changed. Since a component may also be changed directly (e.g. by __setitem__ on
+    # the component functions list), the cache is also discarded if any component storage has been rebuilt.
+    components_dense_storage = tuple(
+        get_functions_list_dense_storage(basis_functions_matrix._components[component_name])
+        for component_name in basis_functions_matrix._components_name
+        if len(basis_functions_matrix._components[component_name]) > 0
+    )
+    if (
+        basis_functions_matrix._dense_storage is None
+            or
+        len(basis_functions_matrix._dense_storage[0]) != len(components_dense_storage)
+            or
+        any(cached is not current for (cached, current) in zip(basis_functions_matrix._dense_storage[0], components_dense_storage))
+    ):
+        if len(components_dense_storage) == 1:
+            dense_storage = components_dense_storage[0]
+        else:
+            dense_storage = hstack(components_dense_storage)
+        basis_functions_matrix._dense_storage = (components_dense_storage, dense_storage)
+    return basis_functions_matrix._dense_storage[1]
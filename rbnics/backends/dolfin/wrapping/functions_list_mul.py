@@ -16,7 +16,9 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from numpy import asarray
 from dolfin import Function, FunctionSpace
+from rbnics.backends.dolfin.wrapping.get_functions_list_dense_storage import get_functions_list_dense_storage
 
 def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsListType):
     space = functions_list.space
@@ -24,12 +26,15 @@ def functions_list_mul_online_matrix(functions_list, online_matrix, FunctionsLis
     
     output = FunctionsListType(space)
     assert isinstance(online_matrix.M, int)
+    online_matrix_content = asarray(online_matrix, dtype=float)
+    assert online_matrix_content.shape == (len(functions_list), online_matrix.M)
+    if len(functions_list) > 0:
+        output_content = online_matrix_content.T.dot(get_functions_list_dense_storage(functions_list).T) # row j contains the local part of the j-th output
     for j in range(online_matrix.M):
-        assert len(online_matrix[:, j]) == len(functions_list)
         output_j = Function(space)
-        for (i, fun_i) in enumerate(functions_list):
-            output_j.vector().add_local(fun_i.vector().get_local()*online_matrix[i, j])
-        output_j.vector().apply("add")
+        if len(functions_list) > 0:
+            output_j.vector().add_local(output_content[j])
+            output_j.vector().apply("add")
         output.enrich(output_j)
     return output
 
@@ -41,7 +46,8 @@ def functions_list_mul_online_vector(functions_list, online_vector):
     if len(functions_list) is 0:
         return output
     else:
-        for (i, fun_i) in enumerate(functions_list):
-            output.vector().add_local(fun_i.vector().get_local()*online_vector[i])
+        online_vector_content = asarray(online_vector, dtype=float).reshape(-1)
+        assert len(online_vector_content) == len(functions_list)
+        output.vector().add_local(get_functions_list_dense_storage(functions_list).dot(online_vector_content))
         output.vector().apply("add")
         return output
@@ -0,0 +1,44 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from numpy import empty
+from rbnics.backends.dolfin.wrapping.to_petsc4py import to_petsc4py
+
+def get_functions_list_dense_storage(functions_list):
+    """
+    Return a (number of local dofs) x (number of functions) array storing the local part of the vectors
+    of all functions in the list, so that products with online matrices and vectors can be carried out
+    by a single BLAS call. The array is cached by the functions list (unless the list is a snapshots matrix,
+    to avoid doubling its memory footprint), and it is prepared again as soon as the list is changed or
+    any of its vectors is modified in place.
+    """
+    assert len(functions_list) > 0
+    vectors_state = tuple(_get_vector_state(fun_i.vector()) for fun_i in functions_list)
+    if functions_list._dense_storage is None or functions_list._dense_storage[0] != vectors_state:
+        dense_storage = empty((functions_list[0].vector().local_size(), len(functions_list)))
+        for (i, fun_i) in enumerate(functions_list):
+            dense_storage[:, i] = fun_i.vector().get_local()
+        if not functions_list._keep_dense_storage:
+            return dense_storage
+        functions_list._dense_storage = (vectors_state, dense_storage)
+    return functions_list._dense_storage[1]
+    
+def _get_vector_state(vector):
+    # PETSc increases the state of a vector every time its values are changed
+    vec = to_petsc4py(vector)
+    return (vec.handle, vec.stateGet())
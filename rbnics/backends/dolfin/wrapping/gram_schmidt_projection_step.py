@@ -16,7 +16,9 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose):
-    new_basis.vector().add_local(- (transpose(new_basis)*inner_product*old_basis) * old_basis.vector().get_local())
-    new_basis.vector().apply("add")
+def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose, N_bc):
+    projections = transpose(old_basis)*inner_product*new_basis
+    for i in range(N_bc):
+        projections[i] = 0.
+    new_basis.vector().axpy(-1., (old_basis*projections).vector())
     return new_basis
@@ -0,0 +1,35 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+def basic_is_solution_dependent(backend, wrapping):
+    def _basic_is_solution_dependent(expression_or_form, iterator):
+        for node in iterator(expression_or_form):
+            # ... problem solutions related to nonlinear terms
+            if wrapping.is_problem_solution_type(node):
+                if wrapping.is_problem_solution(node) or wrapping.is_problem_solution_dot(node):
+                    return True
+        return False
+    return _basic_is_solution_dependent
+    
+from rbnics.backends.dolfin.wrapping.is_problem_solution import is_problem_solution
+from rbnics.backends.dolfin.wrapping.is_problem_solution_dot import is_problem_solution_dot
+from rbnics.backends.dolfin.wrapping.is_problem_solution_type import is_problem_solution_type
+from rbnics.utils.decorators import ModuleWrapper
+backend = ModuleWrapper()
+wrapping = ModuleWrapper(is_problem_solution, is_problem_solution_dot, is_problem_solution_type)
+is_solution_dependent = basic_is_solution_dependent(backend, wrapping)
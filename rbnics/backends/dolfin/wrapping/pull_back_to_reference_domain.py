@@ -22,7 +22,7 @@ import numbers
 import re
 from numpy import allclose, isclose, ones as numpy_ones, zeros as numpy_zeros
 from mpi4py.MPI import Op
-from sympy import Basic as SympyBase, ccode, collect, Float, ImmutableMatrix, Integer, Matrix as SympyMatrix, Number, preorder_traversal, simplify, symbols, sympify
+from sympy import Basic as SympyBase, ccode, collect, Float, ImmutableMatrix, Integer, lambdify, Matrix as SympyMatrix, Number, preorder_traversal, simplify, symbols, sympify
 from ufl import as_tensor, FiniteElement, Form, Measure, sqrt, TensorElement, VectorElement
 from ufl.algorithms import apply_transformer, expand_derivatives, Transformer
 from ufl.algorithms.apply_derivatives import apply_derivatives
@@ -544,7 +544,6 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
         assert any([Algorithm in ParametrizedDifferentialProblem_DerivedClass.ProblemDecorators for Algorithm in (AffineShapeParametrization, ShapeParametrization)]), "PullBackFormsToReferenceDomain should be applied after AffineShapeParametrization or ShapeParametrization"
         
         from rbnics.backends.dolfin import SeparatedParametrizedForm
-        from rbnics.shape_parametrization.utils.symbolic import sympy_eval
         
         @PreserveClassName
         class PullBackFormsToReferenceDomainDecoratedProblem_Class(ParametrizedDifferentialProblem_DerivedClass):
@@ -557,6 +556,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                 self._pull_back_is_affine = dict()
                 self._pulled_back_operators = dict()
                 self._pulled_back_theta_factors = dict()
+                self._pulled_back_theta_factors_lambdified = dict()
                 (self._facet_id_to_subdomain_ids, self._subdomain_id_to_facet_ids) = self._map_facet_id_to_subdomain_id(**kwargs)
                 self._facet_id_to_normal_direction_if_straight = self._map_facet_id_to_normal_direction_if_straight(**kwargs)
                 self._is_affine_parameter_dependent_regex = re.compile(r"\bx\[[0-9]+\]")
@@ -615,6 +615,7 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                                 self._pull_back_is_affine[term] = pull_back_is_affine
                                 self._pulled_back_operators[term] = postprocessed_pulled_back_forms
                                 self._pulled_back_theta_factors[term] = postprocessed_pulled_back_theta_factors
+                                self._pulled_back_theta_factors_lambdified[term] = tuple(tuple(self._lambdify_theta_factor(pulled_back_theta_factor) for pulled_back_theta_factor in pulled_back_theta_factors) for pulled_back_theta_factors in postprocessed_pulled_back_theta_factors)
                                 # If debug is enabled, deform the mesh for a few representative values of the parameters to check the the form assembled
                                 # on the parametrized domain results in the same tensor as the pulled back one
                                 if self.debug:
@@ -642,9 +643,9 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                                             print("\ttheta_" + str(q), "=", theta)
                                         print("Theta factors for pull back")
                                         q = 0
-                                        for (parametrized_q, pulled_back_theta_factors) in enumerate(self._pulled_back_theta_factors[term]):
-                                            for pulled_back_theta_factor in pulled_back_theta_factors:
-                                                print("\ttheta_factor_" + str(q), "=", pulled_back_theta_factor, "(evals to " + str(sympy_eval(str(pulled_back_theta_factor), {"mu": mu})) + ") associated to theta_" + str(parametrized_q))
+                                        for (parametrized_q, (pulled_back_theta_factors, pulled_back_theta_factors_lambdified)) in enumerate(zip(self._pulled_back_theta_factors[term], self._pulled_back_theta_factors_lambdified[term])):
+                                            for (pulled_back_theta_factor, pulled_back_theta_factor_lambdified) in zip(pulled_back_theta_factors, pulled_back_theta_factors_lambdified):
+                                                print("\ttheta_factor_" + str(q), "=", pulled_back_theta_factor, "(evals to " + str(pulled_back_theta_factor_lambdified(mu)) + ") associated to theta_" + str(parametrized_q))
                                                 q += 1
                                         print("Pulled back thetas")
                                         for (q, theta) in enumerate(thetas_pull_back):
@@ -666,6 +667,12 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                                     # Restore mu
                                     self.set_mu(mu_bak)
                                 
+            def _lambdify_theta_factor(self, theta_factor):
+                # Compile once a function of mu, which can also be evaluated on a tuple of arrays
+                # (one for each parameter component) to process several parameters at once
+                mu_symbols = [symbols("mu[" + str(p) + "]") for p in range(len(self.mu))]
+                return lambdify((mu_symbols, ), sympify(theta_factor), modules="numpy")
+                
             def _init_operators(self):
                 self._init_pull_back()
                 ParametrizedDifferentialProblem_DerivedClass._init_operators(self)
@@ -678,8 +685,8 @@ def PullBackFormsToReferenceDomainDecoratedProblem(**decorator_kwargs):
                     
             def compute_theta(self, term):
                 thetas = ParametrizedDifferentialProblem_DerivedClass.compute_theta(self, term)
-                if term in self._pulled_back_theta_factors:
-                    return tuple([sympy_eval(str(pulled_back_theta_factor), {"mu": self.mu})*thetas[q] for (q, pulled_back_theta_factors) in enumerate(self._pulled_back_theta_factors[term]) for pulled_back_theta_factor in pulled_back_theta_factors])
+                if term in self._pulled_back_theta_factors_lambdified:
+                    return tuple([pulled_back_theta_factor(self.mu)*thetas[q] for (q, pulled_back_theta_factors) in enumerate(self._pulled_back_theta_factors_lambdified[term]) for pulled_back_theta_factor in pulled_back_theta_factors])
                 else:
                     return thetas
                     
@@ -25,6 +25,7 @@ def LinearSolver(backend, wrapping):
         @overload((backend.Matrix.Type(), wrapping.DelayedTransposeWithArithmetic), backend.Function.Type(), (backend.Vector.Type(), wrapping.DelayedTransposeWithArithmetic), ThetaType + DictOfThetaType + (None,))
         def __init__(self, lhs, solution, rhs, bcs=None):
             self.solution = solution
+            self._bcs = bcs
             self._init_lhs(lhs)
             self._init_rhs(rhs)
             self._apply_bcs(bcs)
@@ -62,6 +63,9 @@ def LinearSolver(backend, wrapping):
         @overload
         def _apply_bcs(self, bcs: ThetaType):
             bcs = DirichletBC(bcs)
+            # Apply to copies, since lhs and rhs may be reduced operators which are stored in a cache
+            self.rhs = wrapping.tensor_copy(self.rhs)
+            self.lhs = wrapping.tensor_copy(self.lhs)
             bcs.apply_to_vector(self.rhs)
             bcs.apply_to_matrix(self.lhs)
             
@@ -72,7 +76,32 @@ def LinearSolver(backend, wrapping):
             assert self.rhs._component_name_to_basis_component_length == self.lhs._component_name_to_basis_component_length[0]
             # Provide auxiliary dicts to DirichletBC constructor, and apply
             bcs = DirichletBC(bcs, self.rhs._component_name_to_basis_component_index, self.rhs.N)
+            # Apply to copies, since lhs and rhs may be reduced operators which are stored in a cache
+            self.rhs = wrapping.tensor_copy(self.rhs)
+            self.lhs = wrapping.tensor_copy(self.lhs)
             bcs.apply_to_vector(self.rhs)
             bcs.apply_to_matrix(self.lhs)
             
+        def set_rhs(self, rhs):
+            self._init_rhs(rhs)
+            self._apply_bcs_to_rhs(self._bcs)
+            
+        @overload
+        def _apply_bcs_to_rhs(self, bcs: None):
+            pass
+            
+        @overload
+        def _apply_bcs_to_rhs(self, bcs: ThetaType):
+            bcs = DirichletBC(bcs)
+            self.rhs = wrapping.tensor_copy(self.rhs)
+            bcs.apply_to_vector(self.rhs)
+            
+        @overload
+        def _apply_bcs_to_rhs(self, bcs: DictOfThetaType):
+            assert self.rhs._component_name_to_basis_component_index == self.lhs._component_name_to_basis_component_index[0]
+            assert self.rhs._component_name_to_basis_component_length == self.lhs._component_name_to_basis_component_length[0]
+            bcs = DirichletBC(bcs, self.rhs._component_name_to_basis_component_index, self.rhs.N)
+            self.rhs = wrapping.tensor_copy(self.rhs)
+            bcs.apply_to_vector(self.rhs)
+            
     return LinearSolver_Class
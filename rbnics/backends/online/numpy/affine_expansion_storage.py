@@ -16,13 +16,18 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+import os
+from numbers import Number
+from numpy import array, ix_, nditer
 from rbnics.backends.online.basic import AffineExpansionStorage as BasicAffineExpansionStorage
+from rbnics.backends.online.basic.wrapping import slice_to_array
 from rbnics.backends.online.numpy.copy import function_copy, tensor_copy
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.vector import Vector
 from rbnics.backends.online.numpy.wrapping import function_load, function_save, tensor_load, tensor_save
-from rbnics.utils.decorators import BackendFor, ModuleWrapper, tuple_of
+from rbnics.utils.decorators import BackendFor, ModuleWrapper, overload, tuple_of
+from rbnics.utils.io import Folders, NumpyIO
 
 backend = ModuleWrapper(Function, Matrix, Vector)
 wrapping = ModuleWrapper(function_load, function_save, tensor_load, tensor_save, function_copy=function_copy, tensor_copy=tensor_copy)
@@ -31,4 +36,140 @@ AffineExpansionStorage_Base = BasicAffineExpansionStorage(backend, wrapping)
 @BackendFor("numpy", inputs=((int, tuple_of(Matrix.Type()), tuple_of(Vector.Type())), (int, None)))
 class AffineExpansionStorage(AffineExpansionStorage_Base):
     def __init__(self, arg1, arg2=None):
+        from rbnics.utils.config import config # cannot import at global scope
+        self._stacked_content = None # contiguous array of shape (Q, ...) or (Q0, Q1, ...), built on demand
+        self._stacked_content_enabled = config.get("backends", "online stacked affine expansion storage")
+        self._memory_mapped_content_enabled = config.get("backends", "online memory mapped affine expansion storage")
         AffineExpansionStorage_Base.__init__(self, arg1, arg2)
+        
+    def __getitem__(self, key):
+        output = AffineExpansionStorage_Base.__getitem__(self, key)
+        if (
+            self._stacked_content_enabled
+                and
+            (isinstance(key, slice) or (isinstance(key, tuple) and all([isinstance(key_i, slice) for key_i in key])))
+                and
+            output is not self
+                and
+            output._stacked_content is None
+        ):
+            self._stack_sliced_content(key, output)
+        return output
+        
+    def __setitem__(self, key, item):
+        AffineExpansionStorage_Base.__setitem__(self, key, item)
+        self._stacked_content = None
+        
+    def save(self, directory, filename):
+        AffineExpansionStorage_Base.save(self, directory, filename)
+        # Also save all items in a single binary file, which can be memory mapped when loading
+        stacked_content = None
+        if self._stacked_content_enabled or self._memory_mapped_content_enabled:
+            if self._stacked_content_enabled:
+                stacked_content = self.stacked_content()
+            else:
+                stacked_content = self._stack_content()
+        full_directory = Folders.Folder(os.path.join(str(directory), filename))
+        if stacked_content is not None:
+            NumpyIO.save_file(stacked_content, full_directory, "stacked_content")
+        elif NumpyIO.exists_file(full_directory, "stacked_content"):
+            # Remove the file saved by a previous stacked save, otherwise it would be memory mapped when loading
+            # instead of the items which have just been saved
+            NumpyIO.remove_file(full_directory, "stacked_content")
+        
+    def load(self, directory, filename):
+        stacked_content = self._stacked_content
+        self._stacked_content = None # may be set while loading content
+        loaded = AffineExpansionStorage_Base.load(self, directory, filename)
+        if not loaded:
+            self._stacked_content = stacked_content
+        return loaded
+        
+    @overload(Matrix.Type(), nditer, Folders.Folder)
+    def _load_content(self, item, it, full_directory):
+        if self._memory_mapped_content_enabled and NumpyIO.exists_file(full_directory, "stacked_content"):
+            self._load_memory_mapped_content(item, it, full_directory)
+        else:
+            AffineExpansionStorage_Base._load_content(self, item, it, full_directory)
+        
+    @overload(Vector.Type(), nditer, Folders.Folder)
+    def _load_content(self, item, it, full_directory):
+        if self._memory_mapped_content_enabled and NumpyIO.exists_file(full_directory, "stacked_content"):
+            self._load_memory_mapped_content(item, it, full_directory)
+        else:
+            AffineExpansionStorage_Base._load_content(self, item, it, full_directory)
+            
+    @overload(Number, nditer, Folders.Folder)
+    def _load_content(self, item, it, full_directory):
+        if self._memory_mapped_content_enabled and NumpyIO.exists_file(full_directory, "stacked_content"):
+            self._load_memory_mapped_content(item, it, full_directory)
+        else:
+            AffineExpansionStorage_Base._load_content(self, item, it, full_directory)
+            
+    def _load_memory_mapped_content(self, item, it, full_directory):
+        # Pages of the copy-on-write memory map are shared by all processes loading the same file
+        stacked_content = NumpyIO.load_file(full_directory, "stacked_content", mmap_mode="c")
+        assert stacked_content.shape[:self._content.ndim] == self._content.shape
+        while not it.finished:
+            if isinstance(item, Matrix.Type()):
+                self._content[it.multi_index] = Matrix.Type()(item.M, item.N, stacked_content[it.multi_index])
+            elif isinstance(item, Vector.Type()):
+                self._content[it.multi_index] = Vector.Type()(item.N, stacked_content[it.multi_index])
+            else:
+                self._content[it.multi_index] = float(stacked_content[it.multi_index])
+            it.iternext()
+        if self._stacked_content_enabled:
+            self._stacked_content = stacked_content
+        
+    def stacked_content(self):
+        """
+        Return all items of the storage as a single contiguous array, of shape (Q, M, N) for matrices, (Q, N) for vectors
+        and (Q, ) for scalars (or (Q0, Q1, ...) for storages of order 2). Matrices and vectors in the storage are updated
+        so that their content is a view of such array. Return None if stacking is disabled or not possible.
+        """
+        if self._stacked_content is None and self._stacked_content_enabled:
+            self._stacked_content = self._stack_content()
+        return self._stacked_content
+        
+    def _stack_content(self):
+        if self._content.size == 0:
+            return None
+        items = list()
+        it = nditer(self._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
+        while not it.finished:
+            items.append((it.multi_index, self._content[it.multi_index]))
+            it.iternext()
+        if all([isinstance(item, (Matrix.Type(), Vector.Type())) for (_, item) in items]):
+            shapes = set([item.content.shape for (_, item) in items])
+            if len(shapes) > 1:
+                return None
+            stacked_content = array([item.content for (_, item) in items], dtype=float)
+            stacked_content = stacked_content.reshape(self._content.shape + shapes.pop())
+            for (index, item) in items:
+                item.content = stacked_content[index]
+            return stacked_content
+        elif all([isinstance(item, Number) for (_, item) in items]):
+            return array([item for (_, item) in items], dtype=float).reshape(self._content.shape)
+        else:
+            return None
+            
+    def _stack_sliced_content(self, key, output):
+        stacked_content = self.stacked_content()
+        if stacked_content is None or stacked_content.ndim == self._content.ndim: # stacking not available, or scalar content
+            return
+        if not isinstance(key, tuple):
+            key = (key, )
+        reference_item = self._content[self._smallest_key]
+        indices = slice_to_array(reference_item, key, self._component_name_to_basis_component_length, self._component_name_to_basis_component_index)
+        if len(key) == 1:
+            indices = (indices, )
+        leading_slices = (slice(None), )*self._content.ndim
+        if all([indices_i == tuple(range(len(indices_i))) for indices_i in indices]): # contiguous slicing, return a view
+            sliced_stacked_content = stacked_content[leading_slices + tuple([slice(0, len(indices_i)) for indices_i in indices])]
+        else: # e.g. slicing of several components, only one copy for all items
+            sliced_stacked_content = stacked_content[(Ellipsis, ) + ix_(*indices)]
+        it = nditer(output._content, flags=["multi_index", "refs_ok"], op_flags=["readonly"])
+        while not it.finished:
+            output._content[it.multi_index].content = sliced_stacked_content[it.multi_index]
+            it.iternext()
+        output._stacked_content = sliced_stacked_content
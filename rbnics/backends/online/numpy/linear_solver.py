@@ -16,17 +16,23 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from numpy.linalg import solve
+from warnings import catch_warnings, simplefilter
+from numpy import asarray, diag, dot, eye, finfo, outer, triu
+from numpy.linalg import LinAlgError, norm, solve
+from scipy.linalg import cholesky, LinAlgWarning, lu_factor, lu_solve, solve_triangular
 from rbnics.backends.abstract import LinearProblemWrapper
 from rbnics.backends.online.basic import LinearSolver as BasicLinearSolver
 from rbnics.backends.online.numpy.function import Function
 from rbnics.backends.online.numpy.matrix import Matrix
 from rbnics.backends.online.numpy.transpose import DelayedTransposeWithArithmetic
 from rbnics.backends.online.numpy.vector import Vector
+from rbnics.backends.online.numpy.wrapping.tensor_copy import basic_tensor_copy
 from rbnics.utils.decorators import BackendFor, DictOfThetaType, ModuleWrapper, ThetaType
 
 backend = ModuleWrapper(Function, Matrix, Vector)
-wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArithmetic)
+wrapping_for_wrapping = ModuleWrapper()
+tensor_copy = basic_tensor_copy(backend, wrapping_for_wrapping)
+wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArithmetic, tensor_copy=tensor_copy)
 LinearSolver_Base = BasicLinearSolver(backend, wrapping)
 
 @BackendFor("numpy", inputs=((Matrix.Type(), DelayedTransposeWithArithmetic, LinearProblemWrapper), Function.Type(), (Vector.Type(), DelayedTransposeWithArithmetic, None), ThetaType + DictOfThetaType + (None,)))
@@ -35,7 +41,66 @@ class LinearSolver(LinearSolver_Base):
         assert len(parameters) == 0, "NumPy linear solver does not accept parameters yet"
         
     def solve(self):
-        solution = solve(self.lhs, self.rhs)
+        if not hasattr(self, "_lu_factors"): # factorize only once, since the left-hand side cannot be changed after construction
+            with catch_warnings():
+                simplefilter("ignore", LinAlgWarning) # singular matrices are detected below
+                self._lu_factors = lu_factor(asarray(self.lhs))
+            if (diag(self._lu_factors[0]) == 0.).any(): # scipy only warns in this case, while numpy.linalg.solve would raise
+                del self._lu_factors
+                raise LinAlgError("Singular matrix")
+        solution = lu_solve(self._lu_factors, asarray(self.rhs))
         self.solution.vector()[:] = solution
         if self.monitor is not None:
             self.monitor(self.solution)
+            
+    def solve_hierarchical(self, solutions):
+        """
+        Solve the systems associated to the leading principal submatrices of the left-hand side,
+        whose dimensions are provided by the (increasing) dimensions of solutions.
+        A single factorization of the left-hand side is carried out.
+        """
+        lhs = asarray(self.lhs)
+        rhs = asarray(self.rhs)
+        try:
+            (L, U) = _hierarchical_factorization(lhs)
+        except LinAlgError: # a leading principal submatrix is (numerically) singular, solve each system separately
+            for solution in solutions:
+                N = solution.vector().content.size
+                solution.vector()[:] = solve(lhs[:N, :N], rhs[:N])
+        else:
+            for solution in solutions:
+                N = solution.vector().content.size
+                solution.vector()[:] = solve_triangular(U[:N, :N], solve_triangular(L[:N, :N], rhs[:N], lower=True))
+        
+# Factorization A = L U such that the factors of each leading principal submatrix are the leading principal
+# submatrices of the factors: Cholesky factorization for symmetric positive definite matrices, and LU factorization
+# without pivoting otherwise. Pivots which are small relative to the norm of A are considered to be zero.
+def _hierarchical_factorization(A):
+    A = A.astype(float)
+    tol = finfo(float).eps*norm(A)
+    if norm(A - A.T) <= 100*tol:
+        try:
+            L = cholesky(A, lower=True)
+        except LinAlgError: # not positive definite
+            pass
+        else:
+            if (diag(L)**2 > tol).all():
+                return (L, L.T)
+    return _lu_without_pivoting(A, tol)
+    
+# Blocked LU factorization without pivoting: the panel of each block column is factorized column by column,
+# while the trailing submatrix is updated by a matrix-matrix product
+def _lu_without_pivoting(A, tol, block_size=32):
+    N = A.shape[0]
+    L = eye(N)
+    U = A.copy()
+    for k0 in range(0, N, block_size):
+        k1 = min(k0 + block_size, N)
+        for k in range(k0, k1):
+            if abs(U[k, k]) <= tol:
+                raise LinAlgError("Singular leading principal submatrix")
+            L[k + 1:, k] = U[k + 1:, k]/U[k, k]
+            U[k + 1:, k:k1] -= outer(L[k + 1:, k], U[k, k:k1])
+        U[k0:k1, k1:] = solve_triangular(L[k0:k1, k0:k1], U[k0:k1, k1:], lower=True, unit_diagonal=True)
+        U[k1:, k1:] -= dot(L[k1:, k0:k1], U[k0:k1, k1:])
+    return (L, triu(U))
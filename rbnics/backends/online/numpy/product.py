@@ -16,6 +16,8 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from numbers import Number
+from numpy import tensordot
 from rbnics.backends.online.basic import product as basic_product
 from rbnics.backends.online.numpy.affine_expansion_storage import AffineExpansionStorage
 from rbnics.backends.online.numpy.function import Function
@@ -33,4 +35,38 @@ wrapping = ModuleWrapper(DelayedTransposeWithArithmetic=DelayedTransposeWithArit
 # even though this one actually carries out both the sum and the product!
 @backend_for("numpy", inputs=(ThetaType, (AffineExpansionStorage, NonAffineExpansionStorage), ThetaType + (None,)))
 def product(thetas, operators, thetas2=None):
+    if isinstance(operators, AffineExpansionStorage):
+        stacked_operators = operators.stacked_content()
+        if stacked_operators is not None:
+            return ProductOutput(_stacked_product(thetas, operators, stacked_operators, thetas2))
     return product_base(thetas, operators, thetas2)
+    
+# Compute the linear combination of operators with a single tensor contraction on their stacked content
+def _stacked_product(thetas, operators, stacked_operators, thetas2):
+    order = operators.order()
+    assert order in (1, 2)
+    if order == 1:
+        assert thetas2 is None
+        assert len(thetas) == stacked_operators.shape[0]
+        first_operator = operators[0]
+        output_content = tensordot(thetas, stacked_operators, axes=1)
+    elif order == 2:
+        assert thetas2 is not None
+        assert len(thetas) == stacked_operators.shape[0]
+        assert len(thetas2) == stacked_operators.shape[1]
+        first_operator = operators[0, 0]
+        output_content = tensordot(thetas2, tensordot(thetas, stacked_operators, axes=1), axes=1)
+    else:
+        raise ValueError("product(): invalid operands.")
+    if isinstance(first_operator, Number):
+        return float(output_content)
+    elif isinstance(first_operator, Matrix.Type()):
+        output = Matrix.Type()(first_operator.M, first_operator.N, output_content)
+    elif isinstance(first_operator, Vector.Type()):
+        output = Vector.Type()(first_operator.N, output_content)
+    else:
+        raise ValueError("product(): invalid operands.")
+    # Preserve auxiliary attributes related to basis functions matrix
+    output._component_name_to_basis_component_index = first_operator._component_name_to_basis_component_index
+    output._component_name_to_basis_component_length = first_operator._component_name_to_basis_component_length
+    return output
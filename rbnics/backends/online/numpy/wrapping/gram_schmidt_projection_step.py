@@ -16,6 +16,8 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose):
-    new_basis.vector()[:] -= (transpose(new_basis)*inner_product*old_basis) * old_basis.vector()
+def gram_schmidt_projection_step(new_basis, inner_product, old_basis, transpose, N_bc):
+    projections = [transpose(new_basis)*inner_product*old_basis[i] for i in range(N_bc, len(old_basis))]
+    for (i, projection) in zip(range(N_bc, len(old_basis)), projections):
+        new_basis.vector()[:] -= projection * old_basis[i].vector()
     return new_basis
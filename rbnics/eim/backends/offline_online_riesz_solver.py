@@ -55,9 +55,12 @@ def OfflineOnlineRieszSolver(problem_name):
                 problem = self.problem
                 args = (problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs, problem._riesz_solve_homogeneous_dirichlet_bc)
                 if not self.delay:
-                    solver = LinearSolver(*args)
-                    solver.set_parameters(problem._linear_solver_parameters)
-                    solver.solve()
+                    if problem._riesz_solve_linear_solver is None:
+                        problem._riesz_solve_linear_solver = LinearSolver(*args)
+                        problem._riesz_solve_linear_solver.set_parameters(problem._linear_solver_parameters)
+                    else:
+                        problem._riesz_solve_linear_solver.set_rhs(rhs)
+                    problem._riesz_solve_linear_solver.solve()
                     return problem._riesz_solve_storage
                 else:
                     solver = DelayedLinearSolver(*args)
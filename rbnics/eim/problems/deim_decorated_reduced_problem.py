@@ -147,6 +147,10 @@ def DEIMDecoratedReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             self._update_N_DEIM(**kwargs)
             ParametrizedReducedDifferentialProblem_DerivedClass._solve(self, N, **kwargs)
             
+        def _solve_hierarchical(self, all_n, **kwargs):
+            self._update_N_DEIM(**kwargs)
+            ParametrizedReducedDifferentialProblem_DerivedClass._solve_hierarchical(self, all_n, **kwargs)
+            
         def _update_N_DEIM(self, **kwargs):
             self.truth_problem._update_N_DEIM(**kwargs)
             
@@ -77,7 +77,8 @@ class EIMApproximation(ParametrizedProblem):
             key_generator=_snapshot_cache_key_generator,
             import_=_snapshot_cache_import,
             export=_snapshot_cache_export,
-            filename_generator=_snapshot_cache_filename_generator
+            filename_generator=_snapshot_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
         
     # Initialize data structures required for the online phase
@@ -42,6 +42,11 @@ class EIMApproximationReductionMethod(ReductionMethod):
         self.folder["post_processing"] = os.path.join(self.folder_prefix, "post_processing")
         self.greedy_selected_parameters = GreedySelectedParametersList()
         self.greedy_errors = GreedyErrorEstimatorsList()
+        # Interpolation residuals of all snapshots in the training set, updated at each greedy iteration
+        self._interpolation_residuals = None
+        self._interpolation_residuals_maximum = list()
+        self._interpolation_residuals_maximum_location = list()
+        self._greedy_selected_index = None
         #
         # By default set a tolerance slightly larger than zero, in order to
         # stop greedy iterations in trivial cases by default
@@ -133,11 +138,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 print(TextLine(interpolation_method_name + " N = " + str(self.EIM_approximation.N), fill=":"))
                 
                 self._print_greedy_interpolation_solve_message()
-                self.EIM_approximation.solve()
-                
-                print("compute and locate maximum interpolation error")
-                self.EIM_approximation.snapshot = self.load_snapshot()
-                (error, maximum_error, maximum_location) = self.EIM_approximation.compute_maximum_interpolation_error()
+                (error, maximum_error, maximum_location) = self.load_interpolation_residual()
                 
                 print("update locations with", maximum_location)
                 self.update_interpolation_locations(maximum_location)
@@ -148,6 +149,9 @@ class EIMApproximationReductionMethod(ReductionMethod):
                 print("update interpolation matrix")
                 self.update_interpolation_matrix()
                 
+                print("update interpolation residuals")
+                self.update_interpolation_residuals()
+                
                 (error_max, relative_error_max) = self.greedy()
                 print("maximum interpolation error =", error_max)
                 print("maximum interpolation relative error =", relative_error_max)
@@ -182,7 +186,7 @@ class EIMApproximationReductionMethod(ReductionMethod):
         self.EIM_approximation.init("online")
         
     def _print_greedy_interpolation_solve_message(self):
-        print("solve interpolation for mu =", self.EIM_approximation.mu)
+        print("load interpolation residual for mu =", self.EIM_approximation.mu)
         
     # Update the snapshots container
     def add_to_snapshots(self, snapshot):
@@ -220,6 +224,47 @@ class EIMApproximationReductionMethod(ReductionMethod):
     def update_interpolation_matrix(self):
         self.EIM_approximation.interpolation_matrix[0] = evaluate(self.EIM_approximation.basis_functions[:self.EIM_approximation.N], self.EIM_approximation.interpolation_locations)
         self.EIM_approximation.interpolation_matrix.save(self.EIM_approximation.folder["reduced_operators"], "interpolation_matrix")
+        
+    # Initialize the interpolation residuals with the snapshots, since N = 0
+    def init_interpolation_residuals(self):
+        assert self.EIM_approximation.basis_generation == "Greedy"
+        assert self.EIM_approximation.N == 0
+        self._interpolation_residuals = self.snapshots_container
+        self._compute_maximum_interpolation_residuals()
+        
+    # Update the interpolation residuals of all snapshots after a new basis function has been added.
+    # Since the greedy basis function vanishes at all previous interpolation locations, the interpolation
+    # matrix is lower triangular and the interpolant with N + 1 basis functions is obtained by a rank-one
+    # correction of the residual with N basis functions, rather than a new interpolation of each snapshot
+    def update_interpolation_residuals(self):
+        assert self.EIM_approximation.basis_generation == "Greedy"
+        N = self.EIM_approximation.N
+        basis_function = self.EIM_approximation.basis_functions[N - 1]
+        diagonal_entry = self.EIM_approximation.interpolation_matrix[0][N - 1, N - 1]
+        if diagonal_entry == 0.:
+            # Trivial case, the basis function is zero and so are all residuals
+            return
+        interpolation_residuals = self.EIM_approximation.parametrized_expression.create_snapshots_container()
+        for interpolation_residual in self._interpolation_residuals:
+            interpolation_residual_on_interpolation_locations = evaluate(interpolation_residual, self.EIM_approximation.interpolation_locations)
+            coefficient = interpolation_residual_on_interpolation_locations[N - 1]/diagonal_entry
+            interpolation_residuals.enrich(interpolation_residual - basis_function*coefficient)
+        self._interpolation_residuals = interpolation_residuals
+        self._compute_maximum_interpolation_residuals()
+        
+    def _compute_maximum_interpolation_residuals(self):
+        self._interpolation_residuals_maximum = list()
+        self._interpolation_residuals_maximum_location = list()
+        for interpolation_residual in self._interpolation_residuals:
+            (maximum_error, maximum_location) = max(abs(interpolation_residual))
+            self._interpolation_residuals_maximum.append(maximum_error) # keep the sign, which is required to normalize the next basis function
+            self._interpolation_residuals_maximum_location.append(maximum_location)
+            
+    # Load the precomputed interpolation residual of the parameter selected by the greedy
+    def load_interpolation_residual(self):
+        assert self.EIM_approximation.basis_generation == "Greedy"
+        mu_index = self._greedy_selected_index
+        return (self._interpolation_residuals[mu_index], self._interpolation_residuals_maximum[mu_index], self._interpolation_residuals_maximum_location[mu_index])
             
     # Load the precomputed snapshot
     def load_snapshot(self):
@@ -244,20 +289,19 @@ class EIMApproximationReductionMethod(ReductionMethod):
             print("interpolation error for current mu =", abs(maximum_error))
             print("interpolation error on interpolation locations for current mu =", abs(maximum_error_on_interpolation_locations))
         
-        # Carry out the actual greedy search
-        def solve_and_computer_error(mu):
-            self.EIM_approximation.set_mu(mu)
-            
-            self.EIM_approximation.solve()
-            self.EIM_approximation.snapshot = self.load_snapshot()
-            (_, maximum_error, _) = self.EIM_approximation.compute_maximum_interpolation_error()
-            return abs(maximum_error)
+        # Carry out the actual greedy search, based on the precomputed interpolation residuals
+        if self.EIM_approximation.N == 0:
+            self.init_interpolation_residuals()
+        def get_maximum_interpolation_residuals(mus):
+            assert len(mus) == len(self._interpolation_residuals_maximum)
+            return [abs(maximum_error) for maximum_error in self._interpolation_residuals_maximum]
             
         if self.EIM_approximation.N == 0:
             print("find initial mu")
         else:
             print("find next mu")
-        (error_max, error_argmax) = self.training_set.max(solve_and_computer_error)
+        (error_max, error_argmax) = self.training_set.max_batch(get_maximum_interpolation_residuals)
+        self._greedy_selected_index = error_argmax
         self.EIM_approximation.set_mu(self.training_set[error_argmax])
         self.greedy_selected_parameters.append(self.training_set[error_argmax])
         self.greedy_selected_parameters.save(self.folder["post_processing"], "mu_greedy")
@@ -306,7 +350,9 @@ class EIMApproximationReductionMethod(ReductionMethod):
         error_analysis_table.add_column("error", group_name="eim", operations=("mean", "max"))
         error_analysis_table.add_column("relative_error", group_name="eim", operations=("mean", "max"))
         
-        for (mu_index, mu) in enumerate(self.testing_set):
+        filename = "error_analysis" if filename is None else filename
+        rows_folder = os.path.join(str(self.folder["error_analysis"]), filename)
+        for (mu_index, mu) in self._testing_set_iterator(error_analysis_table, rows_folder, self.EIM_approximation.folder["reduced_operators"], N, N_generator, **kwargs):
             print(TextLine(interpolation_method_name + " " + str(mu_index), fill=":"))
             
             self.EIM_approximation.set_mu(mu)
@@ -327,17 +373,21 @@ class EIMApproximationReductionMethod(ReductionMethod):
                     error_analysis_table["error", n, mu_index] = NotImplemented
                     error_analysis_table["relative_error", n, mu_index] = NotImplemented
         
-        # Print
-        print("")
-        print(error_analysis_table)
+        # Print and export error analysis table, unless other partitions of the testing set still have to be processed
+        if error_analysis_table.is_complete():
+            print("")
+            print(error_analysis_table)
+            
+            error_analysis_table.save(self.folder["error_analysis"], filename)
+            error_analysis_table.remove_rows(rows_folder)
+        else:
+            print("")
+            print("Error analysis table will be printed once all testing set partitions have been processed")
         
         print("")
         print(TextBox(interpolation_method_name + " error analysis ends for" + "\n" + "\n".join(description), fill="="))
         print("")
         
-        # Export error analysis table
-        error_analysis_table.save(self.folder["error_analysis"], "error_analysis" if filename is None else filename)
-        
     # Compute the speedup of the empirical interpolation approximation with respect to the
     # exact function over the testing set
     def speedup_analysis(self, N_generator=None, filename=None, **kwargs):
@@ -94,7 +94,7 @@ class TimeDependentEIMApproximationReductionMethod(EIMApproximationReductionMeth
             mu_set[n] = mu_t
             
     def _print_greedy_interpolation_solve_message(self):
-        print("solve interpolation for mu =", self.EIM_approximation.mu, "and t =", self.EIM_approximation.t)
+        print("load interpolation residual for mu =", self.EIM_approximation.mu, "and t =", self.EIM_approximation.t)
         
     # Load the precomputed snapshot. Overridden to correct the assert
     def load_snapshot(self):
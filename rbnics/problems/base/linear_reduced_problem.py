@@ -17,6 +17,7 @@
 #
 
 from rbnics.backends import LinearProblemWrapper, LinearSolver
+from rbnics.backends.online import OnlineFunction
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 @RequiredBaseDecorators(None)
@@ -32,12 +33,50 @@ def LinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             
             # Nonlinear solver parameters
             self._linear_solver_parameters = dict()
+            
+        def solve_hierarchical(self, N=None, **kwargs):
+            """
+            Perform online solves for all reduced dimensions n = 1, ..., N, assembling and factorizing
+            the reduced system only once, since reduced systems of dimension n are leading principal
+            submatrices of the one of dimension N. Solutions are stored in the solution cache,
+            so that subsequent calls to solve do not require any further computation.
+            """
+            N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+            if len(self.components) > 1: # basis functions are ordered by component, hence smaller reduced systems are not leading principal submatrices
+                return
+            all_n = list()
+            for n in range(1, N[self.components[0]] + 1):
+                n, _ = self._online_size_from_kwargs(n)
+                n += self.N_bc
+                if (self.mu, n, kwargs) not in self._solution_cache:
+                    all_n.append(n)
+            if len(all_n) > 0:
+                self._solve_hierarchical(all_n, **kwargs) # will also add to cache
+                
+        # Perform online solves for all reduced dimensions in all_n (internal)
+        def _solve_hierarchical(self, all_n, **kwargs):
+            problem_solver = self.ProblemSolver(self, all_n[-1], **kwargs)
+            solver = LinearSolver(problem_solver, OnlineFunction(all_n[-1]))
+            solver.set_parameters(self._linear_solver_parameters)
+            solutions = [OnlineFunction(n) for n in all_n]
+            solver.solve_hierarchical(solutions)
+            for (n, solution) in zip(all_n, solutions):
+                self._solution_cache[self.mu, n, kwargs] = solution
         
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, LinearProblemWrapper):
             def solve(self):
                 problem = self.problem
-                solver = LinearSolver(self, problem._solution)
-                solver.set_parameters(problem._linear_solver_parameters)
+                # Reuse the online solver, and thus the factorization of the reduced system, of previous solves with the same parameter and size
+                try:
+                    solver = problem._online_assembly_cache[problem.mu, "linear solver", self.N, self.kwargs]
+                except KeyError:
+                    solver = LinearSolver(self, problem._solution)
+                    solver.set_parameters(problem._linear_solver_parameters)
+                    problem._online_assembly_cache[problem.mu, "linear solver", self.N, self.kwargs] = solver
+                else:
+                    solver.solution = problem._solution
+                    solver.monitor = self.monitor
+                    problem.number_of_avoided_assemblies += 1
                 solver.solve()
             
     # return value (a class) for the decorator
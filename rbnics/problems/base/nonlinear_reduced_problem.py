@@ -16,7 +16,7 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from rbnics.backends import NonlinearProblemWrapper, NonlinearSolver
+from rbnics.backends import NonlinearProblemWrapper, NonlinearSolver, ParametrizedTensorFactory
 from rbnics.utils.decorators import PreserveClassName, RequiredBaseDecorators
 
 @RequiredBaseDecorators(None)
@@ -32,6 +32,35 @@ def NonlinearReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass)
             
             # Nonlinear solver parameters
             self._nonlinear_solver_parameters = dict()
+            
+            # Reduced operators which do not depend on the solution are cached, and then reused
+            # for all residual and jacobian evaluations of the nonlinear solver
+            self._is_solution_dependent = dict() # from term to bool
+            
+        def _assemble_reduced_operator(self, term, N, **kwargs):
+            if self._term_is_solution_dependent(term):
+                return self._compute_reduced_operator(term, N)
+            else:
+                return ParametrizedReducedDifferentialProblem_DerivedClass._assemble_reduced_operator(self, term, N, **kwargs)
+            
+        def _term_is_solution_dependent(self, term):
+            if term not in self._is_solution_dependent:
+                truth_problem = self.truth_problem
+                if hasattr(truth_problem, "_assemble_operator_exact"):
+                    assemble_operator = truth_problem._assemble_operator_exact
+                elif hasattr(truth_problem, "_apply_EIM_at_stages") or hasattr(truth_problem, "_apply_DEIM_at_stages"):
+                    assemble_operator = None
+                else:
+                    assemble_operator = truth_problem.assemble_operator
+                if assemble_operator is not None:
+                    # Inspect exact (i.e., neither EIM nor DEIM) truth forms
+                    self._is_solution_dependent[term] = any(
+                        ParametrizedTensorFactory(form).is_solution_dependent() for form in assemble_operator(term))
+                else:
+                    # Exact truth forms are not available, since assemble_operator returns EIM/DEIM approximations,
+                    # which do not store the solution they have been computed from: never reuse reduced operators
+                    self._is_solution_dependent[term] = True
+            return self._is_solution_dependent[term]
         
         class ProblemSolver(ParametrizedReducedDifferentialProblem_DerivedClass.ProblemSolver, NonlinearProblemWrapper):
             def solve(self):
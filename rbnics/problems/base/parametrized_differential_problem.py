@@ -19,7 +19,9 @@
 from abc import ABCMeta, abstractmethod
 import os
 import hashlib
+import inspect
 from numbers import Number
+from numpy import array, asarray, broadcast_to, column_stack, zeros
 from rbnics.problems.base.parametrized_problem import ParametrizedProblem
 from rbnics.backends import AffineExpansionStorage, assign, copy, export, Function, import_, product, sum
 from rbnics.utils.cache import Cache
@@ -51,6 +53,10 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         self.components = list()
         # Number of terms in the affine expansion
         self.Q = dict() # from string to integer
+        # Set to True in child classes if compute_theta only involves NumPy-compatible arithmetic on self.mu,
+        # so that it can be evaluated for several parameters at once by compute_theta_over_parameters
+        self.vectorized_compute_theta = False
+        self._vectorized_compute_theta_failed_terms = set()
         # Matrices/vectors resulting from the truth discretization
         self.OperatorExpansionStorage = AffineExpansionStorage
         self.operator = dict() # from string to OperatorExpansionStorage
@@ -85,7 +91,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_solution_cache_key_generator,
             import_=_solution_cache_import,
             export=_solution_cache_export,
-            filename_generator=_solution_cache_filename_generator
+            filename_generator=_solution_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
         def _output_cache_key_generator(*args, **kwargs):
             assert len(args) is 1
@@ -107,7 +114,8 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
             key_generator=_output_cache_key_generator,
             import_=_output_cache_import,
             export=_output_cache_export,
-            filename_generator=_output_cache_filename_generator
+            filename_generator=_output_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
         
     def name(self):
@@ -476,6 +484,63 @@ class ParametrizedDifferentialProblem(ParametrizedProblem, metaclass=ABCMeta):
         """
         raise NotImplementedError("The method compute_theta() is problem-specific and needs to be overridden.")
         
+    def compute_theta_over_parameters(self, term, parameters):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for each of the provided parameters,
+        as an array of shape (len(parameters), Q).
+        If vectorized_compute_theta is True, compute_theta is called only once, after replacing each component of
+        self.mu by the array of its values over all parameters. Otherwise, or if such evaluation fails,
+        compute_theta is called once for each parameter.
+        
+        :param term: the forms of the class of the problem.
+        :param parameters: an iterable of parameters, e.g. a ParameterSpaceSubset.
+        :return: computed thetas.
+        """
+        return self._evaluate_over_parameters(term, lambda: self.compute_theta(term), self.compute_theta, parameters, self.Q[term])
+        
+    def get_stability_factor_over_parameters(self, parameters):
+        """
+        Return a lower bound for the coercivity constant for each of the provided parameters, as an array of
+        shape (len(parameters), ). As in compute_theta_over_parameters, if vectorized_compute_theta is True
+        get_stability_factor is called only once, on arrays of parameter values.
+        
+        :param parameters: an iterable of parameters, e.g. a ParameterSpaceSubset.
+        :return: computed lower bounds.
+        """
+        return self._evaluate_over_parameters("stability_factor", lambda: (self.get_stability_factor(), ), self.get_stability_factor, parameters, 1)[:, 0]
+        
+    # Evaluate a tuple of Q values for each of the provided parameters, possibly vectorizing the evaluation over parameters
+    # if method (i.e., the one called by evaluate) is a method of the problem (rather than being replaced by online computations,
+    # e.g. by EIM) and the user allows it by means of vectorized_compute_theta
+    def _evaluate_over_parameters(self, key, evaluate, method, parameters, Q):
+        parameters = list(parameters)
+        if len(parameters) == 0:
+            return zeros((0, Q))
+        if (
+            self.vectorized_compute_theta
+                and
+            key not in self._vectorized_compute_theta_failed_terms
+                and
+            inspect.ismethod(method)
+        ):
+            mu_bak = self.mu
+            self.mu = tuple(array([mu[p] for mu in parameters], dtype=float) for p in range(len(mu_bak)))
+            try:
+                values = column_stack([broadcast_to(asarray(value, dtype=float), (len(parameters), )) for value in evaluate()])
+            except Exception: # evaluation is not compatible with NumPy arrays, e.g. due to branching on the value of mu
+                self._vectorized_compute_theta_failed_terms.add(key)
+            else:
+                return values
+            finally:
+                self.mu = mu_bak
+        mu_bak = self.mu
+        values = list()
+        for mu in parameters:
+            self.set_mu(mu)
+            values.append(evaluate())
+        self.set_mu(mu_bak)
+        return array(values, dtype=float)
+        
     @abstractmethod
     def assemble_operator(self, term):
         """
@@ -84,6 +84,15 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             "reduced problems",
             key_generator=_output_cache_key_generator
         )
+        def _online_assembly_cache_key_generator(*args, **kwargs):
+            assert len(args) is 3
+            assert args[0] == self.mu
+            return (args[1], ) + self._cache_key_from_N_and_kwargs(args[2], **kwargs)
+        self._online_assembly_cache = Cache(
+            "reduced operators",
+            key_generator=_online_assembly_cache_key_generator
+        ) # stores assembled reduced operators for recently used (mu, N)
+        self.number_of_avoided_assemblies = 0
         
         # $$ OFFLINE DATA STRUCTURES $$ #
         # High fidelity problem
@@ -110,6 +119,7 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             if term not in self.operator: # init was not called already
                 self.Q[term] = self.truth_problem.Q[term]
                 self.operator[term] = self.OperatorExpansionStorage(self.Q[term])
+        self._online_assembly_cache.clear()
         assert current_stage in ("online", "offline")
         if current_stage == "online":
             for term in self.terms:
@@ -326,6 +336,16 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
             delattr(self, "_is_solving")
         return self._solution
         
+    def solve_hierarchical(self, N=None, **kwargs):
+        """
+        Perform online solves for all reduced dimensions n = 1, ..., N at once, when cheaper than separate solves.
+        By default nothing is precomputed, and each solution will be computed by solve.
+        
+        :param N : Maximum dimension of the reduced problem
+        :type N : integer
+        """
+        pass
+        
     class ProblemSolver(object, metaclass=ABCMeta):
         def __init__(self, problem, N, **kwargs):
             self.problem = problem
@@ -437,6 +457,34 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
     def _build_reduced_operators(self, current_stage="offline"):
         for term in self.terms:
             self.operator[term] = self.assemble_operator(term, current_stage)
+        self._online_assembly_cache.clear()
+        
+    def _assemble_reduced_operator(self, term, N, **kwargs):
+        """
+        Return the linear combination of reduced operators associated to term, for the current parameter
+        and reduced dimension N. Results are stored in a cache of bounded size, so that they can be reused
+        by subsequent calls with the same arguments, hence they must not be modified in place.
+        
+        :param term: the forms of the class of the problem.
+        :param N: dimension of the reduced problem.
+        """
+        try:
+            assembled_operator = self._online_assembly_cache[self.mu, term, N, kwargs]
+        except KeyError:
+            assembled_operator = self._compute_reduced_operator(term, N)
+            self._online_assembly_cache[self.mu, term, N, kwargs] = assembled_operator
+        else:
+            self.number_of_avoided_assemblies += 1
+        return assembled_operator
+        
+    def _compute_reduced_operator(self, term, N):
+        assert self.terms_order[term] in (1, 2)
+        if self.terms_order[term] == 2:
+            return sum(product(self.compute_theta(term), self.operator[term][:N, :N]))
+        elif self.terms_order[term] == 1:
+            return sum(product(self.compute_theta(term), self.operator[term][:N]))
+        else:
+            raise ValueError("Invalid value for order of term " + term)
             
     def _build_reduced_inner_products(self, current_stage="offline"):
         n_components = len(self.components)
@@ -647,6 +695,16 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         """
         return self.truth_problem.compute_theta(term)
         
+    def compute_theta_over_parameters(self, term, parameters):
+        """
+        Return theta multiplicative terms of the affine expansion of the problem for each of the provided parameters.
+        
+        :param term: the forms of the class of the problem.
+        :param parameters: an iterable of parameters, e.g. a ParameterSpaceSubset.
+        :return: computed thetas, as an array of shape (len(parameters), Q).
+        """
+        return self.truth_problem.compute_theta_over_parameters(term, parameters)
+        
     # Assemble the reduced order affine expansion
     def assemble_operator(self, term, current_stage="online"):
         """
@@ -799,3 +857,12 @@ class ParametrizedReducedDifferentialProblem(ParametrizedProblem, metaclass=ABCM
         Return a lower bound for the coercivity constant.
         """
         return self.truth_problem.get_stability_factor()
+        
+    def get_stability_factor_over_parameters(self, parameters):
+        """
+        Return a lower bound for the coercivity constant for each of the provided parameters.
+        
+        :param parameters: an iterable of parameters, e.g. a ParameterSpaceSubset.
+        :return: computed lower bounds, as an array of shape (len(parameters), ).
+        """
+        return self.truth_problem.get_stability_factor_over_parameters(parameters)
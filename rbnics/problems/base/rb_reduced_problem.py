@@ -20,7 +20,8 @@ import os
 from abc import ABCMeta, abstractmethod
 from numbers import Number
 from rbnics.backends import BasisFunctionsMatrix, Function, FunctionsList, LinearSolver, transpose
-from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.backends.abstract import BasisFunctionsMatrix as AbstractBasisFunctionsMatrix, FunctionsList as AbstractFunctionsList
+from rbnics.backends.online import OnlineAffineExpansionStorage, OnlineMatrix, OnlineVector
 from rbnics.utils.decorators import overload, PreserveClassName, RequiredBaseDecorators
 
 @RequiredBaseDecorators(None)
@@ -53,7 +54,11 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             self._riesz_solve_storage = Function(self.truth_problem.V)
             self._riesz_solve_inner_product = None # setup by init()
             self._riesz_solve_homogeneous_dirichlet_bc = None # setup by init()
+            self._riesz_solve_linear_solver = None # setup by the first Riesz solve, and reused by the subsequent ones
             self._error_estimation_inner_product = None # setup by init()
+            self._error_estimation_inner_product_times_riesz = dict() # from (term, q) to list of products of the error estimation inner product by the Riesz representors
+            self._riesz_generation = dict() # from term to number of times that its Riesz representors have been cleared
+            self._error_estimation_operator_riesz_generation = dict() # from (term, q0, q1) to Riesz generations used in the assembly of the error estimation operator
             # I/O
             self.folder["error_estimation"] = os.path.join(self.folder_prefix, "error_estimation")
             
@@ -77,6 +82,7 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 self._riesz_solve_inner_product = self.truth_problem._combined_inner_product
             # Setup homogeneous Dirichlet BCs for Riesz solve, if any (no check if init was already called because this variable can actually be None)
             self._riesz_solve_homogeneous_dirichlet_bc = self.truth_problem._combined_and_homogenized_dirichlet_bc
+            self._riesz_solve_linear_solver = None # will be rebuilt with the current homogeneous Dirichlet BCs
             # Initialize Riesz representation
             for term in self.riesz_terms:
                 if term not in self.riesz: # init was not called already
@@ -204,6 +210,18 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             else:
                 raise ValueError("Invalid value for order of term " + term)
                 
+        def clear_riesz_representation(self, term):
+            """
+            It clears the Riesz representation of term, e.g. because the reduced basis is not hierarchical.
+            Error estimation operators depending on term will then be assembled from scratch.
+            
+            :param term: the forms of the truth problem.
+            """
+            for q in range(self.Q[term]):
+                self.riesz[term][q].clear()
+                self._error_estimation_inner_product_times_riesz.pop((term, q), None)
+            self._riesz_generation[term] = self._riesz_generation.get(term, 0) + 1
+            
         class RieszSolver(object):
             def __init__(self, problem):
                 self.problem = problem
@@ -211,9 +229,13 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
             @overload
             def solve(self, rhs: object):
                 problem = self.problem
-                solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs, problem._riesz_solve_homogeneous_dirichlet_bc)
-                solver.set_parameters(problem._linear_solver_parameters)
-                solver.solve()
+                # The left-hand side never changes, so that its factorization can be reused for all right-hand sides
+                if problem._riesz_solve_linear_solver is None:
+                    problem._riesz_solve_linear_solver = LinearSolver(problem._riesz_solve_inner_product, problem._riesz_solve_storage, rhs, problem._riesz_solve_homogeneous_dirichlet_bc)
+                    problem._riesz_solve_linear_solver.set_parameters(problem._linear_solver_parameters)
+                else:
+                    problem._riesz_solve_linear_solver.set_rhs(rhs)
+                problem._riesz_solve_linear_solver.solve()
                 return problem._riesz_solve_storage
                 
             @overload
@@ -237,12 +259,20 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 if self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 2:
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
-                            self.error_estimation_operator[term][q0, q1] = transpose(self.riesz[term[0]][q0])*self._error_estimation_inner_product*self.riesz[term[1]][q1]
+                            if self._can_assemble_error_estimation_operator_incrementally(term, q0, q1):
+                                self.error_estimation_operator[term][q0, q1] = self._assemble_error_estimation_operator_incrementally(term, q0, q1)
+                            else:
+                                self.error_estimation_operator[term][q0, q1] = transpose(self.riesz[term[0]][q0])*self._error_estimation_inner_product*self.riesz[term[1]][q1]
+                            self._error_estimation_operator_riesz_generation[term + (q0, q1)] = self._get_riesz_generations(term)
                 elif self.terms_order[term[0]] == 2 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         for q1 in range(self.Q[term[1]]):
                             assert len(self.riesz[term[1]][q1]) == 1
-                            self.error_estimation_operator[term][q0, q1] = transpose(self.riesz[term[0]][q0])*self._error_estimation_inner_product*self.riesz[term[1]][q1][0]
+                            if self._can_assemble_error_estimation_operator_incrementally(term, q0, q1):
+                                self.error_estimation_operator[term][q0, q1] = self._assemble_error_estimation_operator_incrementally(term, q0, q1)
+                            else:
+                                self.error_estimation_operator[term][q0, q1] = transpose(self.riesz[term[0]][q0])*self._error_estimation_inner_product*self.riesz[term[1]][q1][0]
+                            self._error_estimation_operator_riesz_generation[term + (q0, q1)] = self._get_riesz_generations(term)
                 elif self.terms_order[term[0]] == 1 and self.terms_order[term[1]] == 1:
                     for q0 in range(self.Q[term[0]]):
                         assert len(self.riesz[term[0]][q0]) == 1
@@ -255,6 +285,85 @@ def RBReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 return self.error_estimation_operator[term]
             else:
                 raise ValueError("Invalid stage in assemble_error_estimation_operators().")
+                
+        def _can_assemble_error_estimation_operator_incrementally(self, term, q0, q1):
+            # Incremental assembly requires affine Riesz representors of a problem with one component,
+            # and an operator assembled at a previous iteration with fewer (or no) basis functions,
+            # starting from the same Riesz representors (i.e., which have not been cleared in the meantime)
+            if len(self.components) > 1:
+                return False
+            if not isinstance(self.riesz[term[0]][q0], AbstractBasisFunctionsMatrix):
+                return False
+            if not isinstance(self.riesz[term[1]][q1], (AbstractBasisFunctionsMatrix, AbstractFunctionsList)):
+                return False
+            previous_operator = self.error_estimation_operator[term][q0, q1]
+            if previous_operator is not None:
+                if self._error_estimation_operator_riesz_generation.get(term + (q0, q1)) != self._get_riesz_generations(term):
+                    return False
+                if self.terms_order[term[1]] == 2:
+                    return (
+                        _online_size(previous_operator.M) <= len(self.riesz[term[0]][q0])
+                            and
+                        _online_size(previous_operator.N) <= len(self.riesz[term[1]][q1])
+                    )
+                else:
+                    return _online_size(previous_operator.N) <= len(self.riesz[term[0]][q0])
+            return True
+            
+        def _get_riesz_generations(self, term):
+            return (self._riesz_generation.get(term[0], 0), self._riesz_generation.get(term[1], 0))
+            
+        def _assemble_error_estimation_operator_incrementally(self, term, q0, q1):
+            """
+            It assembles the (q0, q1) error estimation operator associated to term, only computing
+            the entries associated to Riesz representors which have been added since the previous assembly.
+            """
+            riesz_0 = self.riesz[term[0]][q0]
+            inner_product_times_riesz_0 = self._compute_error_estimation_inner_product_times_riesz(term[0], q0)
+            previous_operator = self.error_estimation_operator[term][q0, q1]
+            if self.terms_order[term[1]] == 2:
+                riesz_1 = self.riesz[term[1]][q1]
+                inner_product_times_riesz_1 = self._compute_error_estimation_inner_product_times_riesz(term[1], q1)
+                if previous_operator is not None:
+                    (M_previous, N_previous) = (_online_size(previous_operator.M), _online_size(previous_operator.N))
+                else:
+                    (M_previous, N_previous) = (0, 0)
+                operator = OnlineMatrix(riesz_0._component_name_to_basis_component_length, riesz_1._component_name_to_basis_component_length)
+                if M_previous > 0 and N_previous > 0:
+                    operator[:M_previous, :N_previous] = previous_operator
+                # New columns
+                for n in range(N_previous, len(riesz_1)):
+                    operator[:, n] = transpose(riesz_0)*inner_product_times_riesz_1[n]
+                # New rows, exploiting the symmetry of the error estimation inner product
+                if N_previous > 0:
+                    for m in range(M_previous, len(riesz_0)):
+                        operator[m, :N_previous] = transpose(riesz_1[:N_previous])*inner_product_times_riesz_0[m]
+            else:
+                riesz_1 = self.riesz[term[1]][q1][0]
+                if previous_operator is not None:
+                    N_previous = _online_size(previous_operator.N)
+                else:
+                    N_previous = 0
+                operator = OnlineVector(riesz_0._component_name_to_basis_component_length)
+                if N_previous > 0:
+                    operator[:N_previous] = previous_operator
+                for n in range(N_previous, len(riesz_0)):
+                    operator[n] = transpose(riesz_1)*inner_product_times_riesz_0[n]
+            return operator
+            
+        def _compute_error_estimation_inner_product_times_riesz(self, term, q):
+            riesz_term_q = self.riesz[term][q]
+            inner_product_times_riesz_term_q = self._error_estimation_inner_product_times_riesz.setdefault((term, q), list())
+            for n in range(len(inner_product_times_riesz_term_q), len(riesz_term_q)):
+                inner_product_times_riesz_term_q.append(self._error_estimation_inner_product*riesz_term_q[n])
+            return inner_product_times_riesz_term_q
         
     # return value (a class) for the decorator
     return RBReducedProblem_Class
+    
+def _online_size(size):
+    if isinstance(size, dict):
+        assert len(size) == 1
+        return sum(size.values())
+    else:
+        return size
@@ -70,7 +70,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_solution_cache_key_generator,
                 import_=_solution_cache_import,
                 export=_solution_cache_export,
-                filename_generator=_solution_cache_filename_generator
+                filename_generator=_solution_cache_filename_generator,
+                folder_generator=lambda: self.folder["cache"]
             )
             def _solution_dot_cache_key_generator(*args, **kwargs):
                 assert len(args) is 1
@@ -91,7 +92,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_solution_dot_cache_key_generator,
                 import_=_solution_dot_cache_import,
                 export=_solution_dot_cache_export,
-                filename_generator=_solution_dot_cache_filename_generator
+                filename_generator=_solution_dot_cache_filename_generator,
+                folder_generator=lambda: self.folder["cache"]
             )
             del self._solution_cache
             def _output_cache_key_generator(*args, **kwargs):
@@ -113,7 +115,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 key_generator=_output_cache_key_generator,
                 import_=_output_cache_import,
                 export=_output_cache_export,
-                filename_generator=_output_cache_filename_generator
+                filename_generator=_output_cache_filename_generator,
+                folder_generator=lambda: self.folder["cache"]
             )
             del self._output_cache
             
@@ -398,6 +401,8 @@ def TimeDependentProblem(ParametrizedDifferentialProblem_DerivedClass):
                 solver = TimeStepping(self, problem._solution, problem._solution_dot)
                 solver.set_parameters(problem._time_stepping_parameters)
                 solver.solve()
+                problem._solution_over_time_cache.flush()
+                problem._solution_dot_over_time_cache.flush()
         
         # Perform a truth evaluation of the output
         def compute_output(self):
@@ -234,6 +234,14 @@ def TimeDependentReducedProblem(ParametrizedReducedDifferentialProblem_DerivedCl
             else:
                 return ParametrizedReducedDifferentialProblem_DerivedClass.assemble_operator(self, term, current_stage)
                 
+        def solve_hierarchical(self, N=None, **kwargs):
+            # Reduced systems change at every time step, hence each solution will be computed by solve
+            pass
+            
+        def _assemble_reduced_operator(self, term, N, **kwargs):
+            # Theta terms may depend on time, hence reduced operators are not cached
+            return self._compute_reduced_operator(term, N)
+            
         def solve(self, N=None, **kwargs):
             N, kwargs = self._online_size_from_kwargs(N, **kwargs)
             N += self.N_bc
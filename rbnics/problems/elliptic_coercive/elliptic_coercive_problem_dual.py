@@ -56,3 +56,6 @@ class EllipticCoerciveProblem_Dual(EllipticCoerciveProblem_Dual_Base):
     # Return a lower bound for the coercivity constant
     def get_stability_factor(self):
         return self.primal_problem.get_stability_factor()
+        
+    def get_stability_factor_over_parameters(self, parameters):
+        return self.primal_problem.get_stability_factor_over_parameters(parameters)
@@ -17,7 +17,8 @@
 #
 
 from math import sqrt
-from numpy import isclose
+from numpy import abs as vectorized_abs, all as vectorized_all, arange, array, asarray, einsum, isclose, newaxis, sqrt as vectorized_sqrt, zeros
+from numpy.linalg import solve as vectorized_solve
 from rbnics.backends import product, sum, transpose
 from rbnics.problems.base import LinearRBReducedProblem, ParametrizedReducedDifferentialProblem, PrimalDualReducedProblem
 from rbnics.problems.elliptic_coercive.elliptic_coercive_problem import EllipticCoerciveProblem
@@ -41,6 +42,9 @@ class EllipticCoerciveRBReducedProblem(EllipticCoerciveRBReducedProblem_Base):
         # Skip useless Riesz products
         self.riesz_terms = ["f", "a"]
         self.error_estimation_terms = [("f", "f"), ("a", "f"), ("a", "a")]
+        
+        # Maximum number of parameters whose reduced systems are stacked at once by solve_and_estimate_error_batch
+        self.batch_size = 256
     
     # Return an error bound for the current solution
     def estimate_error(self):
@@ -72,6 +76,54 @@ class EllipticCoerciveRBReducedProblem(EllipticCoerciveRBReducedProblem_Base):
             + 2.0*(transpose(self._solution)*sum(product(theta_a, self.error_estimation_operator["a", "f"][:N], theta_f)))
             + transpose(self._solution)*sum(product(theta_a, self.error_estimation_operator["a", "a"][:N, :N], theta_a))*self._solution
         )
+        
+    # Solve the reduced problems associated to all parameters in mus at once, and return an error bound for each of them.
+    # Thetas and stability factors are evaluated over all parameters at once, while assembly, solution and residual norm
+    # computation are carried out on stacked arrays, i.e. (batch_size, N, N) for the reduced matrices and (batch_size, N)
+    # for the reduced solutions, processing parameters in chunks of batch_size to bound memory usage.
+    def solve_and_estimate_error_batch(self, mus, N=None, **kwargs):
+        assert len(self.components) == 1, "Batched solves are only available for problems with one component"
+        N, kwargs = self._online_size_from_kwargs(N, **kwargs)
+        N += self.N_bc
+        mus = list(mus)
+        if len(mus) == 0:
+            return zeros(0)
+        has_non_homogeneous_dirichlet_bc = self.dirichlet_bc and not self.dirichlet_bc_are_homogeneous
+        # Evaluate parameter dependent coefficients
+        theta_a = self.compute_theta_over_parameters("a", mus)
+        theta_f = self.compute_theta_over_parameters("f", mus)
+        if has_non_homogeneous_dirichlet_bc:
+            theta_bc = self.compute_theta_over_parameters("dirichlet_bc", mus)
+        alpha = self.get_stability_factor_over_parameters(mus)
+        assert vectorized_all(alpha >= 0.)
+        # Compute the (f, f) part of the residual norm, which does not depend on the reduced solution
+        error_estimation_operator_ff = array([[self.error_estimation_operator["f", "f"][q0, q1] for q1 in range(self.Q["f"])] for q0 in range(self.Q["f"])], dtype=float)
+        eps2 = einsum("mp,pq,mq->m", theta_f, error_estimation_operator_ff, theta_f)
+        if N > 0:
+            operator_a = self.operator["a"][:N, :N]
+            operator_f = self.operator["f"][:N]
+            operator_a = array([asarray(operator_a[q]) for q in range(self.Q["a"])])
+            operator_f = array([asarray(operator_f[q]) for q in range(self.Q["f"])])
+            error_estimation_operator_af = self.error_estimation_operator["a", "f"][:N]
+            error_estimation_operator_aa = self.error_estimation_operator["a", "a"][:N, :N]
+            error_estimation_operator_af = array([[asarray(error_estimation_operator_af[q0, q1]) for q1 in range(self.Q["f"])] for q0 in range(self.Q["a"])])
+            error_estimation_operator_aa = array([[asarray(error_estimation_operator_aa[q0, q1]) for q1 in range(self.Q["a"])] for q0 in range(self.Q["a"])])
+            for begin in range(0, len(mus), self.batch_size):
+                batch = slice(begin, min(begin + self.batch_size, len(mus)))
+                # Assemble and solve all reduced systems in the current chunk
+                matrices = einsum("mq,qij->mij", theta_a[batch], operator_a)
+                vectors = einsum("mq,qi->mi", theta_f[batch], operator_f)
+                if has_non_homogeneous_dirichlet_bc:
+                    bc_indices = arange(theta_bc.shape[1])
+                    matrices[:, bc_indices, :] = 0.
+                    matrices[:, bc_indices, bc_indices] = 1.
+                    vectors[:, bc_indices] = theta_bc[batch]
+                solutions = vectorized_solve(matrices, vectors[..., newaxis])[..., 0]
+                # Add the (a, f) and (a, a) parts of the residual norm
+                eps2[batch] += 2.0*einsum("mi,mp,pqi,mq->m", solutions, theta_a[batch], error_estimation_operator_af, theta_f[batch], optimize=True)
+                eps2[batch] += einsum("mi,mp,pqij,mq,mj->m", solutions, theta_a[batch], error_estimation_operator_aa, theta_a[batch], solutions, optimize=True)
+        assert vectorized_all((eps2 >= 0.) | isclose(eps2, 0.))
+        return vectorized_sqrt(vectorized_abs(eps2))/alpha
 
 # Add dual reduced problem if an output is provided in the term "s"
 def _problem_has_output(truth_problem, reduction_method, **kwargs):
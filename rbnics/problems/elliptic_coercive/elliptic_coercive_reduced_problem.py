@@ -31,12 +31,12 @@ def EllipticCoerciveReducedProblem(ParametrizedReducedDifferentialProblem_Derive
             def matrix_eval(self):
                 problem = self.problem
                 N = self.N
-                return sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
+                return problem._assemble_reduced_operator("a", N, **self.kwargs)
                 
             def vector_eval(self):
                 problem = self.problem
                 N = self.N
-                return sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
+                return problem._assemble_reduced_operator("f", N, **self.kwargs)
             
         # Perform an online evaluation of the output
         def _compute_output(self, N):
@@ -34,7 +34,7 @@ def EllipticOptimalControlReducedProblem(ParametrizedReducedDifferentialProblem_
                 N = self.N
                 assembled_operator = dict()
                 for term in ("a", "a*", "c", "c*", "m", "n"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
                 return (
                       assembled_operator["m"]                           + assembled_operator["a*"]
                                               + assembled_operator["n"] - assembled_operator["c*"]
@@ -46,7 +46,7 @@ def EllipticOptimalControlReducedProblem(ParametrizedReducedDifferentialProblem_
                 N = self.N
                 assembled_operator = dict()
                 for term in ("f", "g"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
                 return (
                       assembled_operator["g"]
                     
@@ -16,8 +16,11 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+from numpy import allclose, asarray, ix_, outer, tensordot, zeros
 from rbnics.problems.base import NonlinearReducedProblem
-from rbnics.backends import product, sum
+from rbnics.backends import AffineExpansionStorage, assign, copy, transpose
+from rbnics.backends.online import OnlineMatrix
+from rbnics.utils.io import NumpyIO
 
 def NavierStokesReducedProblem(StokesReducedProblem_DerivedClass):
     
@@ -25,19 +28,128 @@ def NavierStokesReducedProblem(StokesReducedProblem_DerivedClass):
     
     class NavierStokesReducedProblem_Class(NavierStokesReducedProblem_Base):
         
+        # Default initialization of members
+        def __init__(self, truth_problem, **kwargs):
+            # Call to parent
+            NavierStokesReducedProblem_Base.__init__(self, truth_problem, **kwargs)
+            
+            # Galerkin trilinear tensor representation of the (quadratic) convection term. If enabled,
+            # the (q, k) entry of the tensor contains the reduced Jacobian of the q-th affine term of "dc"
+            # evaluated at the k-th basis function, so that online the Jacobian is a contraction
+            # of the tensor with the reduced solution and, since the term is quadratic, c = 1/2 dc * solution
+            self.trilinear_convection = False
+            self.convection_tensor = None # dense array of shape (Q_dc, Nmax, Nmax, Nmax)
+            
+        def init(self, current_stage="online"):
+            NavierStokesReducedProblem_Base.init(self, current_stage)
+            if self.trilinear_convection:
+                self._init_convection_tensor(current_stage)
+                
+        def _init_convection_tensor(self, current_stage="online"):
+            assert current_stage in ("online", "offline")
+            if current_stage == "online":
+                self.convection_tensor = NumpyIO.load_file(self.folder["reduced_operators"], "convection_tensor")
+            elif current_stage == "offline":
+                pass # Nothing else to be done
+            else:
+                raise ValueError("Invalid stage in _init_convection_tensor().")
+                
+        def build_reduced_operators(self, current_stage="offline"):
+            NavierStokesReducedProblem_Base.build_reduced_operators(self, current_stage)
+            if self.trilinear_convection:
+                self._build_convection_tensor(current_stage)
+                
+        def _build_convection_tensor(self, current_stage="offline"):
+            assert current_stage == "offline"
+            truth_problem = self.truth_problem
+            # Exact (i.e., neither EIM nor DEIM) forms are required, since EIM/DEIM approximations do not
+            # change when the solution is replaced by each basis function
+            if hasattr(truth_problem, "_apply_EIM_at_stages") or hasattr(truth_problem, "_apply_DEIM_at_stages"):
+                assert hasattr(truth_problem, "_assemble_operator_exact"), "Trilinear convection requires exact forms: please use @ExactParametrizedFunctions(\"offline\")"
+            assemble_operator = getattr(truth_problem, "_assemble_operator_exact", truth_problem.assemble_operator)
+            Nmax = self._basis_functions_length()
+            
+            def assemble_convection_tensor_slice(function, scaling=1.):
+                # Assemble forms replacing the solution with the (scaled) function
+                assign(truth_problem._solution, function)
+                if scaling != 1.:
+                    solution_vector = truth_problem._solution.vector()
+                    solution_vector *= scaling
+                dc = AffineExpansionStorage(assemble_operator("dc"))
+                return [transpose(self.basis_functions)*dc[q]*self.basis_functions for q in range(len(dc))]
+                
+            truth_solution_backup = copy(truth_problem._solution)
+            for (k, basis_function) in enumerate(self._basis_functions_iterator()):
+                dc_k = assemble_convection_tensor_slice(basis_function)
+                if k == 0:
+                    Q_dc = len(dc_k)
+                    self.convection_tensor = zeros((Q_dc, Nmax, Nmax, Nmax))
+                    # Check that "dc" is linear in the solution ...
+                    dc_2k = assemble_convection_tensor_slice(basis_function, 2.)
+                    assert all(allclose(asarray(dc_2k_q), 2.*asarray(dc_k_q)) for (dc_2k_q, dc_k_q) in zip(dc_2k, dc_k)), "Trilinear convection requires dc to be linear in the solution"
+                    # ... and affine in the parameters, since only its theta terms will be evaluated online.
+                    # This is only a heuristic, as forms are compared at two corners of the parameter range:
+                    # a dependence on the parameters outside of the theta terms may still go undetected
+                    mu_backup = truth_problem.mu
+                    truth_problem.set_mu(tuple(mu_range_p[0] for mu_range_p in truth_problem.mu_range))
+                    dc_k_min = assemble_convection_tensor_slice(basis_function)
+                    truth_problem.set_mu(tuple(mu_range_p[1] for mu_range_p in truth_problem.mu_range))
+                    dc_k_max = assemble_convection_tensor_slice(basis_function)
+                    truth_problem.set_mu(mu_backup)
+                    assert all(allclose(asarray(dc_k_min_q), asarray(dc_k_max_q)) for (dc_k_min_q, dc_k_max_q) in zip(dc_k_min, dc_k_max)), "Trilinear convection requires dc to have an affine expansion"
+                for q in range(Q_dc):
+                    self.convection_tensor[q, k] = asarray(dc_k[q])
+            assign(truth_problem._solution, truth_solution_backup)
+            NumpyIO.save_file(self.convection_tensor, self.folder["reduced_operators"], "convection_tensor")
+            
+        def _basis_functions_iterator(self):
+            # Iterate over basis functions following the ordering of the reduced solution vector
+            for component in self.components:
+                for basis_function in self.basis_functions[component]:
+                    yield basis_function
+                    
+        def _basis_functions_length(self):
+            length = 0
+            for component in self.components:
+                length += len(self.basis_functions[component])
+            return length
+                    
+        def _compute_theta_exact(self, term):
+            # Do not use EIM/DEIM interpolated theta terms, since the convection tensor has been assembled from exact forms
+            compute_theta = getattr(self.truth_problem, "_compute_theta_exact", self.truth_problem.compute_theta)
+            return compute_theta(term)
+            
+        def _assemble_convection_jacobian(self, solution, N):
+            # Indices of the basis functions which are currently employed, following the ordering of the tensor
+            indices = list()
+            offset = 0
+            for component in self.components:
+                N_component = N[component] if isinstance(N, dict) else N
+                indices.extend(range(offset, offset + N_component))
+                offset += len(self.basis_functions[component])
+            # Contract the convection tensor with theta terms and the reduced solution, padding with zeros coefficients
+            # associated to basis functions which are not currently employed, and then restrict the result
+            theta_dc = self._compute_theta_exact("dc")
+            solution_coefficients = zeros(offset)
+            solution_coefficients[indices] = asarray(solution.vector())
+            convection_jacobian = OnlineMatrix(N, N)
+            convection_jacobian[:, :] = tensordot(outer(theta_dc, solution_coefficients), self.convection_tensor, axes=2)[ix_(indices, indices)]
+            return convection_jacobian
+        
         class ProblemSolver(NavierStokesReducedProblem_Base.ProblemSolver):
             def residual_eval(self, solution):
                 problem = self.problem
                 N = self.N
+                if problem.trilinear_convection:
+                    convection_jacobian = problem._assemble_convection_jacobian(solution, N)
+                    terms = ("a", "b", "bt", "f", "g")
+                else:
+                    terms = ("a", "b", "bt", "c", "f", "g")
                 assembled_operator = dict()
-                for term in ("a", "b", "bt", "c", "f", "g"):
-                    assert problem.terms_order[term] in (1, 2)
-                    if problem.terms_order[term] == 2:
-                        assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
-                    elif problem.terms_order[term] == 1:
-                        assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N]))
-                    else:
-                        raise ValueError("Invalid value for order of term " + term)
+                for term in terms:
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
+                if problem.trilinear_convection:
+                    assembled_operator["c"] = (convection_jacobian*solution)/2. # since the convection term is quadratic
                 return (
                      (assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"])*solution
                     + assembled_operator["c"]
@@ -47,10 +159,16 @@ def NavierStokesReducedProblem(StokesReducedProblem_DerivedClass):
             def jacobian_eval(self, solution):
                 problem = self.problem
                 N = self.N
+                if problem.trilinear_convection:
+                    terms = ("a", "b", "bt")
+                else:
+                    terms = ("a", "b", "bt", "dc")
                 assembled_operator = dict()
-                for term in ("a", "b", "bt", "dc"):
+                for term in terms:
                     assert problem.terms_order[term] is 2
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
+                if problem.trilinear_convection:
+                    assembled_operator["dc"] = problem._assemble_convection_jacobian(solution, N)
                 return (
                       assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"]
                     + assembled_operator["dc"]
@@ -17,7 +17,6 @@
 #
 
 from rbnics.problems.base import NonlinearReducedProblem
-from rbnics.backends import product, sum
 
 def NonlinearEllipticReducedProblem(EllipticCoerciveReducedProblem_DerivedClass):
     
@@ -30,17 +29,17 @@ def NonlinearEllipticReducedProblem(EllipticCoerciveReducedProblem_DerivedClass)
                 problem = self.problem
                 N = self.N
                 assembled_operator = dict()
-                assembled_operator["a"] = sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
-                assembled_operator["c"] = sum(product(problem.compute_theta("c"), problem.operator["c"][:N]))
-                assembled_operator["f"] = sum(product(problem.compute_theta("f"), problem.operator["f"][:N]))
+                assembled_operator["a"] = problem._assemble_reduced_operator("a", N, **self.kwargs)
+                assembled_operator["c"] = problem._assemble_reduced_operator("c", N, **self.kwargs)
+                assembled_operator["f"] = problem._assemble_reduced_operator("f", N, **self.kwargs)
                 return assembled_operator["a"]*solution + assembled_operator["c"] - assembled_operator["f"]
                 
             def jacobian_eval(self, solution):
                 problem = self.problem
                 N = self.N
                 assembled_operator = dict()
-                assembled_operator["a"] = sum(product(problem.compute_theta("a"), problem.operator["a"][:N, :N]))
-                assembled_operator["dc"] = sum(product(problem.compute_theta("dc"), problem.operator["dc"][:N, :N]))
+                assembled_operator["a"] = problem._assemble_reduced_operator("a", N, **self.kwargs)
+                assembled_operator["dc"] = problem._assemble_reduced_operator("dc", N, **self.kwargs)
                 return assembled_operator["a"] + assembled_operator["dc"]
         
     # return value (a class) for the decorator
@@ -50,7 +50,7 @@ def StokesReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 N = self.N
                 assembled_operator = dict()
                 for term in ("a", "b", "bt"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
                 return assembled_operator["a"] + assembled_operator["b"] + assembled_operator["bt"]
                 
             def vector_eval(self):
@@ -58,7 +58,7 @@ def StokesReducedProblem(ParametrizedReducedDifferentialProblem_DerivedClass):
                 N = self.N
                 assembled_operator = dict()
                 for term in ("f", "g"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
                 return assembled_operator["f"] + assembled_operator["g"]
                 
             # Custom combination of boundary conditions *not* to add BCs of supremizers
@@ -105,14 +105,16 @@ class StokesOptimalControlProblem(StokesOptimalControlProblem_Base):
                 key_generator=_supremizer_cache_key_generator,
                 import_=_supremizer_cache_import("s"),
                 export=_supremizer_cache_export("s"),
-                filename_generator=_supremizer_cache_filename_generator
+                filename_generator=_supremizer_cache_filename_generator,
+                folder_generator=lambda: self.folder["cache"]
             ),
             "r": Cache(
                 "problems",
                 key_generator=_supremizer_cache_key_generator,
                 import_=_supremizer_cache_import("r"),
                 export=_supremizer_cache_export("r"),
-                filename_generator=_supremizer_cache_filename_generator
+                filename_generator=_supremizer_cache_filename_generator,
+                folder_generator=lambda: self.folder["cache"]
             )
         }
         
@@ -31,7 +31,7 @@ def StokesOptimalControlReducedProblem(ParametrizedReducedDifferentialProblem_De
                 N = self.N
                 assembled_operator = dict()
                 for term in ("a", "a*", "b", "b*", "bt", "bt*", "c", "c*", "m", "n"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N, :N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
                 return (
                       assembled_operator["m"]                                                      + assembled_operator["a*"] + assembled_operator["bt*"]
                                                                                                    + assembled_operator["b*"]
@@ -45,7 +45,7 @@ def StokesOptimalControlReducedProblem(ParametrizedReducedDifferentialProblem_De
                 N = self.N
                 assembled_operator = dict()
                 for term in ("f", "g", "l"):
-                    assembled_operator[term] = sum(product(problem.compute_theta(term), problem.operator[term][:N]))
+                    assembled_operator[term] = problem._assemble_reduced_operator(term, N, **self.kwargs)
                 return (
                       assembled_operator["g"]
                     
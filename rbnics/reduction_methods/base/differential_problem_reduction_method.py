@@ -175,6 +175,7 @@ class DifferentialProblemReductionMethod(ReductionMethod):
             other_truth_problem._output_cache.clear()
             self.reduced_problem._solution_cache.clear()
             self.reduced_problem._output_cache.clear()
+            self.reduced_problem._online_assembly_cache.clear()
             
             # Disable the capability of importing/exporting truth solutions
             def disable_import_solution_method(self_, folder=None, filename=None, solution=None, component=None, suffix=None):
@@ -119,7 +119,44 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                 self._offline()
             self._finalize_offline()
             return self.reduced_problem
+        
+        def farm_snapshots(self, task_index, number_of_tasks):
+            """
+            It solves the truth problem for the subset of the training set assigned to the current task, storing
+            the snapshots in the truth problem disk cache. Several independent jobs (each one possibly running on
+            its own set of MPI processes) can be launched with task indices 0, ..., number_of_tasks - 1, sharing
+            the same training set file. A subsequent call to offline() will then load all snapshots from the cache.
+            
+            :param task_index: index of the current task.
+            :param number_of_tasks: total number of tasks.
+            """
+            from rbnics.utils.config import config # cannot import at global scope
+            assert "disk" in config.get("problems", "cache"), "Snapshot farm requires disk cache for truth problems"
+            # Concurrent tasks would overwrite each other's disk cache index, and evict each other's snapshots
+            assert config.get("problems", "disk cache limit") == "unlimited", "Snapshot farm requires an unlimited disk cache for truth problems"
+            assert number_of_tasks > 0
+            assert task_index >= 0 and task_index < number_of_tasks
+            
+            # Initialize the affine expansion in the truth problem
+            self.truth_problem.init()
+            self.truth_problem.folder["cache"].create()
+            
+            print(TextBox(self.truth_problem.name() + " " + self.label + " snapshot farm task " + str(task_index) + " of " + str(number_of_tasks) + " begins", fill="="))
+            print("")
+            
+            for mu_index in range(task_index, len(self.training_set), number_of_tasks):
+                print(TextLine(str(mu_index), fill="#"))
+                
+                self.truth_problem.set_mu(self.training_set[mu_index])
+                
+                print("truth solve for mu =", self.truth_problem.mu)
+                self.truth_problem.solve()
+                
+                print("")
             
+            print(TextBox(self.truth_problem.name() + " " + self.label + " snapshot farm task " + str(task_index) + " of " + str(number_of_tasks) + " ends", fill="="))
+            print("")
+        
         @snapshot_links_to_cache
         def _offline(self):
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase begins", fill="="))
@@ -137,7 +174,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                 
                 print("update snapshots matrix")
                 self.update_snapshots_matrix(snapshot)
-
+                
                 print("")
                 mu_index += 1
                 
@@ -151,7 +188,7 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             print("")
             print(TextBox(self.truth_problem.name() + " " + self.label + " offline phase ends", fill="="))
             print("")
-
+        
         def update_snapshots_matrix(self, snapshot):
             """
             It updates the snapshots matrix.
@@ -224,10 +261,13 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("error_output", group_name="output", operations=("mean", "max"))
             error_analysis_table.add_column("relative_error_output", group_name="output", operations=("mean", "max"))
             
-            for (mu_index, mu) in enumerate(self.testing_set):
+            filename = "error_analysis" if filename is None else filename
+            rows_folder = os.path.join(str(self.folder["error_analysis"]), filename)
+            for (mu_index, mu) in self._testing_set_iterator(error_analysis_table, rows_folder, self.reduced_problem.folder["reduced_operators"], N, N_generator, **kwargs):
                 print(TextLine(str(mu_index), fill="#"))
                 
                 self.reduced_problem.set_mu(mu)
+                self.reduced_problem.solve_hierarchical(N, **kwargs)
                             
                 for n in range(1, N + 1): # n = 1, ... N
                     n_arg = N_generator(n)
@@ -263,16 +303,21 @@ def PODGalerkinReduction(DifferentialProblemReductionMethod_DerivedClass):
                     error_analysis_table["error_output", n, mu_index] = error_output
                     error_analysis_table["relative_error_output", n, mu_index] = relative_error_output
             
-            # Print
-            print("")
-            print(error_analysis_table)
+            # Print and export error analysis table, unless other partitions of the testing set still have to be processed
+            if error_analysis_table.is_complete():
+                print("")
+                print(error_analysis_table)
+                
+                error_analysis_table.save(self.folder["error_analysis"], filename)
+                error_analysis_table.remove_rows(rows_folder)
+            else:
+                print("")
+                print("Error analysis table will be printed once all testing set partitions have been processed")
             
             print("")
             print(TextBox(self.truth_problem.name() + " " + self.label + " error analysis ends", fill="="))
             print("")
             
-            # Export error analysis table
-            error_analysis_table.save(self.folder["error_analysis"], "error_analysis" if filename is None else filename)
         
         def speedup_analysis(self, N_generator=None, filename=None, **kwargs):
             """
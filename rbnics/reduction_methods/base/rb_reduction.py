@@ -48,6 +48,24 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             self.greedy_selected_parameters = GreedySelectedParametersList()
             self.greedy_error_estimators = GreedyErrorEstimatorsList()
             self.label = "RB"
+            # Greedy search mode
+            self.batched_greedy = False # if True, all reduced problems in the training set are solved at once
+            
+        def set_batched_greedy(self, batched_greedy):
+            """
+            It enables (or disables) the batched greedy search, in which all reduced systems associated to
+            the (local part of the) training set are assembled and solved at once, rather than one parameter at a time.
+            The reduced problem is required to provide a solve_and_estimate_error_batch method.
+            
+            Operators are required to be affine, since they are evaluated only once for all parameters:
+            problems decorated with @ExactParametrizedFunctions, @EIM or @DEIM are not supported.
+            
+            :param batched_greedy: True to enable batched greedy search, False to restore the default one.
+            """
+            if batched_greedy:
+                for stages_attribute in ("_apply_exact_evaluation_at_stages", "_apply_EIM_at_stages", "_apply_DEIM_at_stages"):
+                    assert not hasattr(self.truth_problem, stages_attribute), "Batched greedy is not available for problems with non affine operators"
+            self.batched_greedy = batched_greedy
             
         def _init_offline(self):
             # Call parent to initialize inner product and reduced problem
@@ -177,12 +195,22 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                 log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
                 return error_estimator
                 
+            def solve_and_estimate_error_batch(mus):
+                error_estimators = self.reduced_problem.solve_and_estimate_error_batch(mus)
+                for (mu, error_estimator) in zip(mus, error_estimators):
+                    log(DEBUG, "Error estimator for mu = " + str(mu) + " is " + str(error_estimator))
+                return error_estimators
+                
             if self.reduced_problem.N == 0:
                 print("find initial mu")
             else:
                 print("find next mu")
                 
-            return self.training_set.max(solve_and_estimate_error)
+            if self.batched_greedy:
+                assert hasattr(self.reduced_problem, "solve_and_estimate_error_batch"), "Batched greedy is not available for this reduced problem"
+                return self.training_set.max_batch(solve_and_estimate_error_batch)
+            else:
+                return self.training_set.max(solve_and_estimate_error)
             
         def error_analysis(self, N_generator=None, filename=None, **kwargs):
             """
@@ -239,10 +267,13 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
             error_analysis_table.add_column("relative_error_estimator_output", group_name="output_relative_error", operations=("mean", "max"))
             error_analysis_table.add_column("relative_effectivity_output", group_name="output_relative_error", operations=("min", "mean", "max"))
             
-            for (mu_index, mu) in enumerate(self.testing_set):
+            filename = "error_analysis" if filename is None else filename
+            rows_folder = os.path.join(str(self.folder["error_analysis"]), filename)
+            for (mu_index, mu) in self._testing_set_iterator(error_analysis_table, rows_folder, self.reduced_problem.folder["reduced_operators"], N, N_generator, **kwargs):
                 print(TextLine(str(mu_index), fill="#"))
                 
                 self.reduced_problem.set_mu(mu)
+                self.reduced_problem.solve_hierarchical(N, **kwargs)
                             
                 for n in range(1, N + 1): # n = 1, ... N
                     n_arg = N_generator(n)
@@ -308,17 +339,21 @@ def RBReduction(DifferentialProblemReductionMethod_DerivedClass):
                     error_analysis_table["relative_error_estimator_output", n, mu_index] = relative_error_output_estimator
                     error_analysis_table["relative_effectivity_output", n, mu_index] = error_analysis_table["relative_error_estimator_output", n, mu_index]/error_analysis_table["relative_error_output", n, mu_index]
             
-            # Print
-            print("")
-            print(error_analysis_table)
+            # Print and export error analysis table, unless other partitions of the testing set still have to be processed
+            if error_analysis_table.is_complete():
+                print("")
+                print(error_analysis_table)
+                
+                error_analysis_table.save(self.folder["error_analysis"], filename)
+                error_analysis_table.remove_rows(rows_folder)
+            else:
+                print("")
+                print("Error analysis table will be printed once all testing set partitions have been processed")
             
             print("")
             print(TextBox(self.truth_problem.name() + " " + self.label + " error analysis ends", fill="="))
             print("")
             
-            # Export error analysis table
-            error_analysis_table.save(self.folder["error_analysis"], "error_analysis" if filename is None else filename)
-            
         def speedup_analysis(self, N_generator=None, filename=None, **kwargs):
             """
             It computes the speedup of the reduced order approximation with respect to the full order one over the testing set.
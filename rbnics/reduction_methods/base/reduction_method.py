@@ -16,6 +16,7 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
+import hashlib
 import os
 from abc import ABCMeta, abstractmethod
 from rbnics.sampling import ParameterSpaceSubset
@@ -45,6 +46,8 @@ class ReductionMethod(object, metaclass=ABCMeta):
         self.folder["testing_set"] = os.path.join(self.folder_prefix, "testing_set")
         self.folder["error_analysis"] = os.path.join(self.folder_prefix, "error_analysis")
         self.folder["speedup_analysis"] = os.path.join(self.folder_prefix, "speedup_analysis")
+        # Partition of the testing set processed by the current run, as (partition index, number of partitions)
+        self.testing_set_partition = (0, 1)
     
     # OFFLINE: set maximum reduced space dimension (stopping criterion)
     def set_Nmax(self, Nmax, **kwargs):
@@ -92,6 +95,30 @@ class ReductionMethod(object, metaclass=ABCMeta):
             self.testing_set.save(self.folder["testing_set"], "testing_set")
         return import_successful
     
+    # ERROR ANALYSIS: only process every number_of_partitions-th entry of the testing set, starting from partition_index,
+    # so that the error analysis can be shared among several independent runs
+    def set_testing_set_partition(self, partition_index, number_of_partitions):
+        assert number_of_partitions > 0
+        assert partition_index >= 0 and partition_index < number_of_partitions
+        self.testing_set_partition = (partition_index, number_of_partitions)
+        
+    # ERROR ANALYSIS: iterate over the entries of the testing set which still need to be processed by the current run.
+    # Rows of the table are appended to file as soon as they are completed, so that an interrupted analysis can be resumed,
+    # and rows completed by other partitions are merged. Rows are only merged if they were computed for the same reduced
+    # order model (as identified by the content of reduced_operators_folder), reduced dimensions (as provided by N_generator)
+    # and keyword arguments
+    def _testing_set_iterator(self, table, folder, reduced_operators_folder, N, N_generator, **kwargs):
+        folder = Folders.Folder(folder)
+        folder.create()
+        (partition_index, number_of_partitions) = self.testing_set_partition
+        key = _hash_folder_content(reduced_operators_folder) + str([N_generator(n) for n in range(1, N + 1)]) + str(sorted(kwargs.items()))
+        table.load_rows(folder, key)
+        for (mu_index, mu) in enumerate(self.testing_set):
+            if mu_index % number_of_partitions == partition_index and not table.has_row(mu_index):
+                yield (mu_index, mu)
+                table.save_row(folder, mu_index, mu, partition_index, key)
+        table.load_rows(folder, key)
+                
     # Perform the offline phase of the reduced order model
     @abstractmethod
     def offline(self):
@@ -132,3 +159,16 @@ class ReductionMethod(object, metaclass=ABCMeta):
     # Finalize data structures required after the speedup analysis phase
     def _finalize_speedup_analysis(self, **kwargs):
         pass
+        
+# Identify the content of a folder (e.g., the reduced operators of a reduced order model) by a hash of all its files
+def _hash_folder_content(folder):
+    folder = str(folder)
+    content_hash = hashlib.sha1()
+    for (root, dirs, files) in os.walk(folder):
+        dirs.sort() # walk subfolders in a reproducible order
+        for filename in sorted(files):
+            path = os.path.join(root, filename)
+            content_hash.update(os.path.relpath(path, folder).encode())
+            with open(path, "rb") as f:
+                content_hash.update(f.read())
+    return content_hash.hexdigest()
@@ -157,10 +157,12 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
                         print("# POD-Greedy for component", component)
                         (basis_functions1, N1) = self._POD_greedy_compute_basis_extension_with_orthogonal_snapshot(orthogonal_snapshot_over_time, component=component)
                         self.reduced_problem.basis_functions.enrich(basis_functions1, component=component)
+                        self.GS[component].apply(self.reduced_problem.basis_functions[component], self.reduced_problem.N_bc[component], N_new=N1)
                         self.reduced_problem.N[component] += N1
                 else:
                     (basis_functions1, N1) = self._POD_greedy_compute_basis_extension_with_orthogonal_snapshot(orthogonal_snapshot_over_time)
                     self.reduced_problem.basis_functions.enrich(basis_functions1)
+                    self.GS.apply(self.reduced_problem.basis_functions, self.reduced_problem.N_bc, N_new=N1)
                     self.reduced_problem.N += N1
             elif self.POD_greedy_basis_extension == "POD":
                 self.reduced_problem.basis_functions.clear()
@@ -244,8 +246,7 @@ def TimeDependentRBReduction(DifferentialProblemReductionMethod_DerivedClass):
             # because POD-Greedy basis are not hierarchical from one greedy iteration to the next one
             for term in self.reduced_problem.riesz_terms:
                 if self.reduced_problem.terms_order[term] > 1:
-                    for q in range(self.reduced_problem.Q[term]):
-                        self.reduced_problem.riesz[term][q].clear()
+                    self.reduced_problem.clear_riesz_representation(term)
                 
             # Return
             return (basis_functions2, N_plus_N2)
@@ -16,11 +16,10 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-import operator # to find closest parameters
-from math import sqrt
 from mpi4py.MPI import COMM_WORLD
 from numpy import zeros as array
-from numpy import argmax
+from numpy import argmax, asarray
+from scipy.spatial import cKDTree
 from rbnics.sampling.distributions import CompositeDistribution, UniformDistribution
 from rbnics.utils.decorators import overload
 from rbnics.utils.io import ExportableList
@@ -31,6 +30,12 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
         ExportableList.__init__(self, "text")
         self.mpi_comm = COMM_WORLD
         self.distributed_max = True
+        # Array representation of the parameters and nearest neighbour search tree,
+        # lazily (re)computed when the underlying list changes
+        self._index_key = None
+        self._array = None
+        self._tree = None
+        self._number_of_queries = 0
         
     @overload
     def __getitem__(self, key: int):
@@ -42,6 +47,10 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
         output.distributed_max = self.distributed_max
         output._list = self._list[key]
         return output
+        
+    def __setitem__(self, key, item):
+        ExportableList.__setitem__(self, key, item)
+        self._index_key = None # force recomputation of the index
     
     # Method for generation of parameter space subsets
     def generate(self, box, n, sampling=None):
@@ -59,6 +68,18 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
                 self._list.append(tuple())
         
     def max(self, generator, postprocessor=None):
+        def batch_generator(mus):
+            values = array(len(mus))
+            for (i, mu) in enumerate(mus):
+                values[i] = generator(mu)
+            return values
+        return self.max_batch(batch_generator, postprocessor)
+        
+    def max_batch(self, batch_generator, postprocessor=None):
+        """
+        Same as max(), but the generator is called only once on the list of all (local) parameters,
+        and is expected to return an array with one value for each of them.
+        """
         if postprocessor is None:
             def postprocessor(value):
                 return value
@@ -66,10 +87,10 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
             local_list_indices = list(range(self.mpi_comm.rank, len(self._list), self.mpi_comm.size)) # start from index rank and take steps of length equal to size
         else:
             local_list_indices = list(range(len(self._list)))
-        values = array(len(local_list_indices))
+        values = batch_generator([self._list[i] for i in local_list_indices])
+        assert len(values) == len(local_list_indices)
         values_with_postprocessing = array(len(local_list_indices))
         for i in range(len(local_list_indices)):
-            values[i] = generator(self._list[local_list_indices[i]])
             values_with_postprocessing[i] = postprocessor(values[i])
         if self.distributed_max:
             local_i_max = argmax(values_with_postprocessing)
@@ -88,9 +109,10 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
         self.distributed_max = False
     
     def diff(self, other_set):
+        other_set = set(tuple(mu) for mu in other_set)
         output = ParameterSpaceSubset()
         output.distributed_max = self.distributed_max
-        output._list = [mu for mu in self._list if mu not in other_set]
+        output._list = [mu for mu in self._list if tuple(mu) not in other_set]
         return output
         
     # M parameters in this set closest to mu
@@ -108,10 +130,58 @@ class ParameterSpaceSubset(ExportableList): # equivalent to a list of tuples
         if M == 0:
             return output
         
-        parameters_and_distances = list()
-        for xi_i in self:
-            distance = sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)]))
-            parameters_and_distances.append((xi_i, distance))
-        parameters_and_distances.sort(key=operator.itemgetter(1))
-        output._list = [xi_i for (xi_i, _) in parameters_and_distances[:M]]
+        output._list = [self._list[i] for i in self._closest_indices(M, [mu])[0]]
         return output
+        
+    # M parameters in this set closest to each parameter in mus
+    def closest_batch(self, M, mus):
+        assert M <= len(self)
+        
+        outputs = list()
+        for closest_indices in self._closest_indices(M, mus, batch=True):
+            output = ParameterSpaceSubset()
+            output.distributed_max = self.distributed_max
+            output._list = [self._list[i] for i in closest_indices]
+            outputs.append(output)
+        return outputs
+        
+    def _closest_indices(self, M, mus, batch=False):
+        if M == 0:
+            return [list() for _ in mus]
+        parameters = self._get_array()
+        mus = asarray(mus, dtype=float).reshape(len(mus), parameters.shape[1])
+        if parameters.shape[1] == 0: # trivial parameter space, all parameters are equally close
+            return [list(range(M)) for _ in mus]
+        
+        # A brute force search (vectorized over the parameters in this set) is cheaper if the tree
+        # would be used only once, e.g. because this set has just been created by slicing
+        self._number_of_queries += len(mus)
+        if self._tree is None and (batch or self._number_of_queries > 1):
+            self._tree = cKDTree(parameters)
+        if self._tree is not None:
+            # The tree may break ties in a different way than the brute force search: collect all parameters
+            # which are not farther than the M-th closest one, and then sort them as in the brute force search
+            (distances, _) = self._tree.query(mus, k=M)
+            distances = distances.reshape(len(mus), M)
+            candidates = self._tree.query_ball_point(mus, distances[:, -1]*(1. + 1.e-10))
+            closest_indices = list()
+            for (mu, candidates_mu) in zip(mus, candidates):
+                candidates_mu = sorted(candidates_mu)
+                closest_indices.append([candidates_mu[i] for i in self._sort_by_distance(parameters[candidates_mu], mu)[:M]])
+            return closest_indices
+        else:
+            return [self._sort_by_distance(parameters, mu)[:M].tolist() for mu in mus]
+            
+    @staticmethod
+    def _sort_by_distance(parameters, mu):
+        squared_distances = ((parameters - mu)**2).sum(axis=1)
+        return squared_distances.argsort(kind="mergesort") # stable sort, as ties are sorted by position
+            
+    def _get_array(self):
+        index_key = (id(self._list), len(self._list))
+        if self._index_key != index_key:
+            self._array = asarray(self._list, dtype=float).reshape(len(self._list), len(self._list[0]) if len(self._list) > 0 else 0)
+            self._tree = None
+            self._number_of_queries = 0
+            self._index_key = index_key
+        return self._array
@@ -53,6 +53,11 @@ def ExactCoercivityConstantDecoratedProblem(
                 (minimum_eigenvalue, _) = self.exact_coercivity_constant_calculator.solve()
                 return minimum_eigenvalue
                 
+            # Return the alpha_lower bound for each of the provided parameters. Eigenvalue problems
+            # require the parameter to be a tuple of numbers, hence they are never vectorized over parameters
+            def get_stability_factor_over_parameters(self, parameters):
+                return self._evaluate_over_parameters("stability_factor", lambda: (self.get_stability_factor(), ), None, parameters, 1)[:, 0]
+                
         # return value (a class) for the decorator
         return ExactCoercivityConstantDecoratedProblem_Class
         
@@ -67,7 +67,8 @@ class ParametrizedCoercivityConstantEigenProblem(ParametrizedProblem):
             key_generator=_eigenvalue_cache_key_generator,
             import_=_eigenvalue_cache_import,
             export=_eigenvalue_cache_export,
-            filename_generator=_eigenvalue_cache_filename_generator
+            filename_generator=_eigenvalue_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
         def _eigenvector_cache_key_generator(*args, **kwargs):
             return args
@@ -83,7 +84,8 @@ class ParametrizedCoercivityConstantEigenProblem(ParametrizedProblem):
             key_generator=_eigenvector_cache_key_generator,
             import_=_eigenvector_cache_import,
             export=_eigenvector_cache_export,
-            filename_generator=_eigenvector_cache_filename_generator
+            filename_generator=_eigenvector_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
     
     def init(self):
@@ -18,6 +18,7 @@
 
 import os
 import hashlib
+from numpy import array, asarray, dot, zeros
 from rbnics.backends import export, import_, LinearProgramSolver
 from rbnics.backends.common.linear_program_solver import Error as LinearProgramSolverError, Matrix, Vector
 from rbnics.problems.base import ParametrizedProblem
@@ -44,6 +45,7 @@ class SCMApproximation(ParametrizedProblem):
         self.B_max = BoundingBoxSideList() # maximum values of the bounding box mathcal{B}. Vector of size Q
         self.training_set = None # SCM algorithm needs the training set also in the online stage
         self.greedy_selected_parameters = GreedySelectedParametersList() # list storing the parameters selected during the training phase
+        self.greedy_selected_parameters_subset = dict() # dict, over N, of list storing the first N parameters selected during the training phase
         self.greedy_selected_parameters_complement = dict() # dict, over N, of list storing the complement of parameters selected during the training phase
         self.UB_vectors = UpperBoundsList() # list of Q-dimensional vectors storing the infimizing elements at the greedily selected parameters
         self.N = 0
@@ -53,6 +55,9 @@ class SCMApproximation(ParametrizedProblem):
         # Storage for online computations
         self._alpha_LB = 0.
         self._alpha_UB = 0.
+        self._training_set_theta_a = None # array storing, for each parameter in the training set, the corresponding theta_a
+        self._training_set_index = None # dict from parameter to row of self._training_set_theta_a
+        self._training_set_alpha_LB = dict() # from (parameter, N) to lower bound, for parameters in the training set
         
         # I/O
         self.folder["cache"] = os.path.join(self.folder_prefix, "reduced_cache")
@@ -77,7 +82,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_alpha_cache_key_generator,
             import_=_alpha_LB_cache_import,
             export=_alpha_LB_cache_export,
-            filename_generator=_alpha_cache_filename_generator
+            filename_generator=_alpha_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
         def _alpha_UB_cache_import(filename):
             self.import_stability_factor_upper_bound(self.folder["cache"], filename)
@@ -89,7 +95,8 @@ class SCMApproximation(ParametrizedProblem):
             key_generator=_alpha_cache_key_generator,
             import_=_alpha_UB_cache_import,
             export=_alpha_UB_cache_export,
-            filename_generator=_alpha_cache_filename_generator
+            filename_generator=_alpha_cache_filename_generator,
+            folder_generator=lambda: self.folder["cache"]
         )
         
         # Coercivity constant eigen problem
@@ -112,6 +119,10 @@ class SCMApproximation(ParametrizedProblem):
             self.UB_vectors.load(self.folder["reduced_operators"], "UB_vectors")
             # Set the value of N
             self.N = len(self.greedy_selected_parameters)
+            # Reset storage related to the training set
+            self._training_set_theta_a = None
+            self._training_set_index = None
+            self._training_set_alpha_LB.clear()
         elif current_stage == "offline":
             self.truth_problem.init()
             # Properly resize structures related to operator
@@ -122,6 +133,9 @@ class SCMApproximation(ParametrizedProblem):
             # in order to use it online
             assert self.training_set is not None
             self.training_set.save(self.folder["reduced_operators"], "training_set")
+            self._training_set_theta_a = None
+            self._training_set_index = None
+            self._training_set_alpha_LB.clear()
             # Properly initialize structures related to greedy selected parameters
             assert len(self.greedy_selected_parameters) is 0
             # Init exact coercivity constant computations
@@ -141,6 +155,7 @@ class SCMApproximation(ParametrizedProblem):
         except KeyError:
             self._get_stability_factor_lower_bound(N)
             self._alpha_LB_cache[self.mu, N] = self._alpha_LB
+        self._store_training_set_stability_factor_lower_bound(self.mu, N, self._alpha_LB)
         return self._alpha_LB
         
     def _get_stability_factor_lower_bound(self, N):
@@ -164,58 +179,43 @@ class SCMApproximation(ParametrizedProblem):
         # 2a. Add constraints: a constraint is added for the closest samples to mu among the selected parameters
         mu_bak = self.mu
         closest_selected_parameters = self._closest_selected_parameters(M_e, N, self.mu)
+        if M_e > 0:
+            # Assemble the LHS of the constraints
+            constraints_matrix[:M_e, :] = self._get_training_set_theta_a(closest_selected_parameters)
         for (j, omega) in enumerate(closest_selected_parameters):
             # Overwrite parameter values
             self.set_mu(omega)
             
-            # Compute theta
-            current_theta_a = self.truth_problem.compute_theta("a")
-            
-            # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[j, q] = current_theta_a[q]
-            
             # Assemble the RHS of the constraint
             (constraints_vector[j], _) = self.evaluate_stability_factor() # note that computations for this call may be already cached
         self.set_mu(mu_bak)
         
         # 2b. Add constraints: also constrain the closest point in the complement of selected parameters,
         #                      with RHS depending on previously computed lower bounds
-        mu_bak = self.mu
         closest_selected_parameters_complement = self._closest_unselected_parameters(M_p, N, self.mu)
+        if M_p > 0:
+            # Assemble the LHS of the constraints
+            constraints_matrix[M_e:M_e + M_p, :] = self._get_training_set_theta_a(closest_selected_parameters_complement)
         for (j, nu) in enumerate(closest_selected_parameters_complement):
-            # Overwrite parameter values
-            self.set_mu(nu)
-            
-            # Compute theta
-            current_theta_a = self.truth_problem.compute_theta("a")
-            
-            # Assemble the LHS of the constraint
-            for q in range(Q):
-                constraints_matrix[M_e + j, q] = current_theta_a[q]
-                
             # Assemble the RHS of the constraint
             if N > 1:
-                constraints_vector[M_e + j] = self.get_stability_factor_lower_bound(N - 1) # note that computations for this call may be already cached
+                constraints_vector[M_e + j] = self._get_training_set_stability_factor_lower_bound(nu, N - 1) # note that computations for this call may be already cached
             else:
                 constraints_vector[M_e + j] = 0.
-        self.set_mu(mu_bak)
         
         # 2c. Add constraints: also constrain the coercivity constant for mu to be positive
         # Compute theta
-        current_theta_a = self.truth_problem.compute_theta("a")
+        current_theta_a = asarray(self.truth_problem.compute_theta("a"), dtype=float)
         
         # Assemble the LHS of the constraint
-        for q in range(Q):
-            constraints_matrix[M_e + M_p, q] = current_theta_a[q]
+        constraints_matrix[M_e + M_p, :] = current_theta_a
             
         # Assemble the RHS of the constraint
         constraints_vector[M_e + M_p] = 0.
         
         # 3. Add cost function coefficients
         cost = Vector(Q)
-        for q in range(Q):
-            cost[q] = current_theta_a[q]
+        cost[:] = current_theta_a
         
         # 4. Solve the linear programming problem
         linear_program = LinearProgramSolver(cost, constraints_matrix, constraints_vector, bounds)
@@ -229,6 +229,44 @@ class SCMApproximation(ParametrizedProblem):
         
         self._alpha_LB = alpha_LB
         
+    def _get_training_set_theta_a(self, parameters):
+        """
+        Returns an array storing, for each of the provided parameters, the corresponding theta_a.
+        Coefficients are computed for the whole training set at the first call, and then reused.
+        """
+        if self._training_set_theta_a is None:
+            self._training_set_theta_a = self.truth_problem.compute_theta_over_parameters("a", self.training_set)
+            self._training_set_index = dict()
+            for (i, mu) in enumerate(self.training_set):
+                self._training_set_index[mu] = i
+        theta_a = zeros((len(parameters), self._training_set_theta_a.shape[1]))
+        other_parameters = list()
+        other_parameters_indices = list()
+        for (j, mu) in enumerate(parameters):
+            if mu in self._training_set_index:
+                theta_a[j, :] = self._training_set_theta_a[self._training_set_index[mu], :]
+            else:
+                other_parameters.append(mu)
+                other_parameters_indices.append(j)
+        if len(other_parameters) > 0:
+            theta_a[other_parameters_indices, :] = self.truth_problem.compute_theta_over_parameters("a", other_parameters)
+        return theta_a
+        
+    def _get_training_set_stability_factor_lower_bound(self, mu, N):
+        try:
+            return self._training_set_alpha_LB[mu, N]
+        except KeyError:
+            mu_bak = self.mu
+            self.set_mu(mu)
+            alpha_LB = self.get_stability_factor_lower_bound(N)
+            self.set_mu(mu_bak)
+            return alpha_LB
+            
+    def _store_training_set_stability_factor_lower_bound(self, mu, N, alpha_LB):
+        # Lower bounds at parameters in the training set are the RHS of constraints at the next iteration, so keep them in memory
+        if self._training_set_index is not None and mu in self._training_set_index:
+            self._training_set_alpha_LB[mu, N] = alpha_LB
+        
     # Get an upper bound for alpha
     def get_stability_factor_upper_bound(self, N=None):
         if N is None:
@@ -241,25 +279,12 @@ class SCMApproximation(ParametrizedProblem):
         return self._alpha_UB
         
     def _get_stability_factor_upper_bound(self, N):
-        Q = self.truth_problem.Q["a"]
-        UB_vectors = self.UB_vectors
-        
-        alpha_UB = None
-        current_theta_a = self.truth_problem.compute_theta("a")
-        
-        for j in range(N):
-            UB_vector = UB_vectors[j]
-            
-            # Compute the cost function for fixed omega
-            obj = 0.
-            for q in range(Q):
-                obj += UB_vector[q]*current_theta_a[q]
-            
-            if alpha_UB is None or obj < alpha_UB:
-                alpha_UB = obj
+        assert N > 0
+        UB_vectors = array([self.UB_vectors[j] for j in range(N)], dtype=float)
+        current_theta_a = asarray(self.truth_problem.compute_theta("a"), dtype=float)
         
-        assert alpha_UB is not None
-        self._alpha_UB = alpha_UB
+        # Compute the cost function for each fixed omega, and take the minimum
+        self._alpha_UB = float(dot(UB_vectors, current_theta_a).min())
                     
     def _cache_key(self, N):
         return (self.mu, N)
@@ -268,7 +293,9 @@ class SCMApproximation(ParametrizedProblem):
         return hashlib.sha1(str(self._cache_key(N)).encode("utf-8")).hexdigest()
         
     def _closest_selected_parameters(self, M, N, mu):
-        return self.greedy_selected_parameters[:N].closest(M, mu)
+        if N not in self.greedy_selected_parameters_subset:
+            self.greedy_selected_parameters_subset[N] = self.greedy_selected_parameters[:N]
+        return self.greedy_selected_parameters_subset[N].closest(M, mu)
         
     def _closest_unselected_parameters(self, M, N, mu):
         if N not in self.greedy_selected_parameters_complement:
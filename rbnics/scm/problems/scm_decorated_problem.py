@@ -68,6 +68,11 @@ def SCMDecoratedProblem(
             # Return the alpha_lower bound.
             def get_stability_factor(self):
                 return self.SCM_approximation.get_stability_factor_lower_bound()
+                
+            # Return the alpha_lower bound for each of the provided parameters. SCM online computations
+            # require the parameter to be a tuple of numbers, hence they are never vectorized over parameters
+            def get_stability_factor_over_parameters(self, parameters):
+                return self._evaluate_over_parameters("stability_factor", lambda: (self.get_stability_factor(), ), None, parameters, 1)[:, 0]
 
         # return value (a class) for the decorator
         return SCMDecoratedProblem_Class
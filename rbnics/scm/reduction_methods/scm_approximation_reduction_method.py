@@ -224,7 +224,9 @@ class SCMApproximationReductionMethod(ReductionMethod):
         error_analysis_table.set_Nmax(N)
         error_analysis_table.add_column("normalized_error", group_name="scm", operations=("min", "mean", "max"))
         
-        for (mu_index, mu) in enumerate(self.testing_set):
+        filename = "error_analysis" if filename is None else filename
+        rows_folder = os.path.join(str(self.folder["error_analysis"]), filename)
+        for (mu_index, mu) in self._testing_set_iterator(error_analysis_table, rows_folder, self.SCM_approximation.folder["reduced_operators"], N, N_generator, **kwargs):
             print(TextLine("SCM " + str(mu_index), fill="~"))
             
             self.SCM_approximation.set_mu(mu)
@@ -248,17 +250,21 @@ class SCMApproximationReductionMethod(ReductionMethod):
                 else:
                     error_analysis_table["normalized_error", n, mu_index] = NotImplemented
         
-        # Print
-        print("")
-        print(error_analysis_table)
+        # Print and export error analysis table, unless other partitions of the testing set still have to be processed
+        if error_analysis_table.is_complete():
+            print("")
+            print(error_analysis_table)
+            
+            error_analysis_table.save(self.folder["error_analysis"], filename)
+            error_analysis_table.remove_rows(rows_folder)
+        else:
+            print("")
+            print("Error analysis table will be printed once all testing set partitions have been processed")
         
         print("")
         print(TextBox("SCM error analysis ends", fill="="))
         print("")
         
-        # Export error analysis table
-        error_analysis_table.save(self.folder["error_analysis"], "error_analysis" if filename is None else filename)
-        
     # Compute the speedup of the scm approximation with respect to the
     # exact coercivity over the testing set
     def speedup_analysis(self, N_generator=None, filename=None, **kwargs):
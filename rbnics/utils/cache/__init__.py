@@ -16,11 +16,12 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from rbnics.utils.cache.cache import Cache, cache
+from rbnics.utils.cache.cache import Cache, cache, cache_statistics
 from rbnics.utils.cache.time_series_cache import TimeSeriesCache
 
 __all__ = [
     'Cache',
     'cache',
+    'cache_statistics',
     'TimeSeriesCache'
 ]
@@ -19,19 +19,27 @@
 from collections import MutableMapping
 from functools import wraps
 from pylru import lrucache
+from rbnics.utils.cache.disk_cache_index import DiskCacheIndex
 from rbnics.utils.mpi import log, PROGRESS
 
+# Number of cache hits and misses for each config section
+cache_statistics = dict()
+
 class Cache(object):
-    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None):
+    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None, folder_generator=None):
         self._config_section = config_section
+        self._folder_generator = None
+        self._disk_cache_limit = None
         if self._config_section is None:
             self._storage = dict()
             self._key_generator = None
             self._import = None
             self._export = None
             self._filename_generator = None
+            self._statistics = None
         else:
             from rbnics.utils.config import config # cannot import at global scope
+            self._statistics = cache_statistics.setdefault(self._config_section, {"RAM hits": 0, "disk hits": 0, "misses": 0})
             cache_options = config.get(self._config_section, "cache")
             assert isinstance(cache_options, set)
             if "RAM" in cache_options:
@@ -52,7 +60,12 @@ class Cache(object):
             if "disk" in cache_options:
                 cache_size = config.get(self._config_section, "disk cache limit")
                 assert isinstance(cache_size, str)
-                assert cache_size == "unlimited"
+                if cache_size != "unlimited":
+                    assert folder_generator is not None
+                    self._folder_generator = folder_generator
+                    cache_policy = config.get(self._config_section, "disk cache policy")
+                    assert cache_policy in ("LRU", "LFU")
+                    self._disk_cache_limit = _parse_disk_cache_limit(cache_size) + (cache_policy, )
                 assert import_ is not None
                 self._import = import_
                 assert export is not None
@@ -93,19 +106,35 @@ class Cache(object):
         except KeyError as key_error:
             if self._filename_generator is not None:
                 storage_filename = self._filename_generator(*args, **kwargs)
+                if self._disk_cache_limit is not None:
+                    disk_index = DiskCacheIndex.get(self._folder_generator())
+                    if storage_filename not in disk_index:
+                        log(PROGRESS, "Could not load key " + str(storage_key) + " (corresponding to args = " + str(args) + " and kwargs = " + str(kwargs) + ") from cache or disk index")
+                        self._update_statistics("misses")
+                        raise key_error
                 try:
                     self._storage[storage_key] = self._import(storage_filename)
                 except OSError:
                     log(PROGRESS, "Could not load key " + str(storage_key) + " (corresponding to args = " + str(args) + " and kwargs = " + str(kwargs) + ") from cache or disk")
+                    if self._disk_cache_limit is not None:
+                        disk_index.remove(storage_filename)
+                        disk_index.save_if_needed()
+                    self._update_statistics("misses")
                     raise key_error
                 else:
                     log(PROGRESS, "Loaded key " + str(storage_key) + " (corresponding to args = " + str(args) + " and kwargs = " + str(kwargs) + ") from disk")
+                    if self._disk_cache_limit is not None:
+                        disk_index.touch(storage_filename)
+                        disk_index.save_if_needed()
+                    self._update_statistics("disk hits")
                     return self._storage[storage_key]
             else:
                 log(PROGRESS, "Could not load key " + str(storage_key) + " (corresponding to args = " + str(args) + " and kwargs = " + str(kwargs) + ") from cache")
+                self._update_statistics("misses")
                 raise key_error
         else:
             log(PROGRESS, "Loaded key " + str(storage_key) + " (corresponding to args = " + str(args) + " and kwargs = " + str(kwargs) + ") from cache")
+            self._update_statistics("RAM hits")
             return storage_value
         
     def __setitem__(self, key, value):
@@ -117,6 +146,7 @@ class Cache(object):
         if self._filename_generator is not None:
             storage_filename = self._filename_generator(*args, **kwargs)
             self._export(storage_filename)
+            self._update_disk_index(storage_filename)
         
     def __delitem__(self, key):
         """
@@ -125,6 +155,18 @@ class Cache(object):
         (_, _, storage_key) = self._compute_storage_key(key)
         del self._storage[storage_key]
         
+    def _update_disk_index(self, storage_filename):
+        if self._disk_cache_limit is not None:
+            (max_entries, max_bytes, policy) = self._disk_cache_limit
+            disk_index = DiskCacheIndex.get(self._folder_generator())
+            disk_index.add(storage_filename)
+            disk_index.evict(max_entries, max_bytes, policy)
+            disk_index.save_if_needed()
+            
+    def _update_statistics(self, counter):
+        if self._statistics is not None:
+            self._statistics[counter] += 1
+        
     def _compute_storage_key(self, key):
         from rbnics.utils.io import OnlineSizeDict # cannot import at global scope
         if isinstance(key, tuple):
@@ -186,6 +228,22 @@ def cache(fun):
         
     return wrapper
     
+def _parse_disk_cache_limit(cache_size):
+    """
+    Convert the disk cache limit, either a number of entries (e.g. "100") or a size in bytes (e.g. "500MB"),
+    to a tuple (maximum number of entries, maximum number of bytes).
+    """
+    units = (("KB", 1024), ("MB", 1024**2), ("GB", 1024**3), ("TB", 1024**4), ("B", 1)) # "B" must be the last one
+    for (unit, multiplier) in units:
+        if cache_size.endswith(unit):
+            cache_bytes = cache_size[:-len(unit)].strip()
+            assert cache_bytes.isdigit()
+            assert int(cache_bytes) > 0
+            return (None, int(cache_bytes)*multiplier)
+    assert cache_size.isdigit()
+    assert int(cache_size) > 0
+    return (int(cache_size), None)
+    
 class DisabledStorage(MutableMapping):
     def __getitem__(self, key):
         raise KeyError
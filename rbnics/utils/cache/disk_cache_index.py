@@ -0,0 +1,258 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import atexit
+import fcntl
+import glob
+import os
+from collections import OrderedDict
+from rbnics.utils.mpi import log, parallel_io, PROGRESS
+
+class DiskCacheIndex(object):
+    """
+    Index of the entries stored in a disk cache folder. Each entry is identified by the filename
+    passed to the export function of the cache, and corresponds to all files in the folder named after
+    that filename, possibly followed by a suffix (starting with an underscore) and an extension.
+    The index is saved to file, so that lookups do not need to access the filesystem. Since several processes
+    may share the same folder, the index is reloaded whenever the file is changed by another process, and
+    changes carried out by the current process are merged with the ones of other processes upon saving.
+    Changes are buffered, and written to file only after evictions, pins, once save_interval changes
+    have been buffered, or at exit. Entries which are pinned (e.g. because they are linked from the snapshots folder)
+    are never evicted.
+    """
+    
+    _all_indices = dict() # from folder name to DiskCacheIndex
+    save_interval = 100 # maximum number of buffered changes
+    
+    @classmethod
+    def get(cls, folder):
+        folder_name = str(folder)
+        if folder_name not in cls._all_indices:
+            cls._all_indices[folder_name] = cls(folder)
+        else:
+            cls._all_indices[folder_name].refresh()
+        return cls._all_indices[folder_name]
+        
+    @classmethod
+    def save_all(cls):
+        """
+        Save all indices with buffered changes.
+        """
+        for index in cls._all_indices.values():
+            if len(index._changes) > 0:
+                index.save()
+        
+    def __init__(self, folder):
+        self._folder = folder
+        self._entries = OrderedDict() # from filename to [size in bytes, number of accesses, pinned], sorted from least to most recently used
+        self._changes = list() # changes which have not been saved to file yet
+        self._timestamp = None # modification time of the file when it was last loaded or saved
+        if self._file_timestamp() is not None:
+            self._load()
+        else:
+            # Entries possibly stored before the index was introduced
+            def scan_folder():
+                entries = OrderedDict()
+                if os.path.exists(str(self._folder)):
+                    for path in sorted(glob.iglob(os.path.join(str(self._folder), "*")), key=os.path.getmtime):
+                        filename = os.path.basename(path)
+                        if not _is_index_file(filename):
+                            filename = _entry_filename(filename)
+                            entries.setdefault(filename, [0, 1, False])
+                            entries[filename][0] += os.path.getsize(path)
+                return entries
+            self._entries = parallel_io(scan_folder)
+            
+    def __contains__(self, filename):
+        return filename in self._entries
+        
+    def __len__(self):
+        return len(self._entries)
+        
+    def size(self):
+        """
+        Returns the overall size in bytes of the entries stored in the folder.
+        """
+        return sum(entry[0] for entry in self._entries.values())
+        
+    def add(self, filename):
+        """
+        Add (or update) an entry after the corresponding files have been exported.
+        """
+        def compute_size():
+            return sum(os.path.getsize(path) for path in self._entry_paths(filename))
+        self._change(("add", filename, parallel_io(compute_size)))
+        
+    def touch(self, filename):
+        """
+        Mark an entry as accessed.
+        """
+        self._change(("touch", filename))
+        
+    def remove(self, filename):
+        """
+        Remove an entry which could not be loaded, e.g. because files were removed by another process.
+        """
+        self._change(("remove", filename))
+        
+    def pin(self, filename):
+        """
+        Prevent eviction of an entry, e.g. because its files are linked from another folder.
+        The index is saved immediately, so that other processes do not evict the entry either.
+        """
+        self._change(("pin", filename))
+        self.save()
+        
+    def is_pinned(self, filename):
+        return filename in self._entries and self._entries[filename][2]
+        
+    def evict(self, max_entries, max_bytes, policy):
+        """
+        Evict entries according to the least recently used or least frequently used policy,
+        until the number of entries and the overall size fit in the provided budget.
+        The most recently used entry and pinned entries are never evicted.
+        If at least one entry is evicted, the index is saved immediately.
+        """
+        assert policy in ("LRU", "LFU")
+        evicted = False
+        while len(self._entries) > 1 and (
+            (max_entries is not None and len(self._entries) > max_entries)
+                or
+            (max_bytes is not None and self.size() > max_bytes)
+        ):
+            candidates = [candidate for candidate in list(self._entries.keys())[:-1] if not self._entries[candidate][2]]
+            if len(candidates) == 0:
+                log(PROGRESS, "Could not evict pinned entries from disk cache in " + str(self._folder))
+                break
+            if policy == "LRU":
+                filename = candidates[0]
+            else:
+                filename = min(candidates, key=lambda candidate: self._entries[candidate][1]) # ties are broken by recency
+            def remove_files():
+                for path in self._entry_paths(filename):
+                    os.remove(path)
+            parallel_io(remove_files)
+            self._change(("remove", filename))
+            evicted = True
+            log(PROGRESS, "Evicted " + filename + " from disk cache in " + str(self._folder))
+        if evicted:
+            self.save()
+            
+    def refresh(self):
+        """
+        Reload the index if the file has been changed by another process, keeping unsaved changes.
+        """
+        timestamp = self._file_timestamp()
+        if timestamp is not None and timestamp != self._timestamp:
+            self._load()
+            for change in self._changes:
+                self._apply(change)
+                
+    def save_if_needed(self):
+        """
+        Save the index only if enough changes have been buffered.
+        """
+        if len(self._changes) >= self.save_interval:
+            self.save()
+            
+    def save(self):
+        """
+        Merge buffered changes with the ones saved by other processes, and save the index to file.
+        The merge is carried out while holding a lock file, and the index is written to a temporary file
+        which is then atomically renamed, so that concurrent readers never load a partially written index.
+        """
+        import pickle
+        def save_task():
+            with open(os.path.join(str(self._folder), "cache_index.lock"), "w") as lock_file:
+                fcntl.lockf(lock_file, fcntl.LOCK_EX)
+                try:
+                    path = os.path.join(str(self._folder), "cache_index.pkl")
+                    if os.path.exists(path):
+                        with open(path, "rb") as infile:
+                            entries = pickle.load(infile)
+                        for change in self._changes:
+                            _apply(entries, change)
+                    else:
+                        entries = self._entries
+                    temporary_path = path + "." + str(os.getpid()) + ".tmp"
+                    with open(temporary_path, "wb") as outfile:
+                        pickle.dump(entries, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(temporary_path, path)
+                    return (entries, os.stat(path).st_mtime_ns)
+                finally:
+                    fcntl.lockf(lock_file, fcntl.LOCK_UN)
+        (self._entries, self._timestamp) = parallel_io(save_task)
+        self._changes = list()
+        
+    def _load(self):
+        from rbnics.utils.io import PickleIO # cannot import at global scope
+        self._timestamp = self._file_timestamp()
+        self._entries = PickleIO.load_file(self._folder, "cache_index")
+        
+    def _file_timestamp(self):
+        def file_timestamp():
+            path = os.path.join(str(self._folder), "cache_index.pkl")
+            if os.path.exists(path):
+                return os.stat(path).st_mtime_ns
+            else:
+                return None
+        return parallel_io(file_timestamp)
+        
+    def _change(self, change):
+        self._changes.append(change)
+        self._apply(change)
+        
+    def _apply(self, change):
+        _apply(self._entries, change)
+        
+    def _entry_paths(self, filename):
+        # The pattern filename + "*" would also match other entries starting with filename
+        return [
+            path for path in glob.glob(os.path.join(str(self._folder), glob.escape(filename) + "*"))
+            if not _is_index_file(os.path.basename(path)) and _entry_filename(os.path.basename(path)) == filename
+        ]
+        
+def _apply(entries, change):
+    filename = change[1]
+    if change[0] == "add":
+        if filename in entries:
+            entries[filename][0] = change[2]
+            entries[filename][1] += 1
+            entries.move_to_end(filename)
+        else:
+            entries[filename] = [change[2], 1, False]
+    elif change[0] == "touch":
+        if filename in entries: # may have been evicted by another process
+            entries[filename][1] += 1
+            entries.move_to_end(filename)
+    elif change[0] == "remove":
+        entries.pop(filename, None)
+    elif change[0] == "pin":
+        if filename in entries: # may have been evicted by another process
+            entries[filename][2] = True
+    else:
+        raise ValueError("Invalid change in DiskCacheIndex")
+        
+def _entry_filename(path_basename):
+    return path_basename.split(".")[0].split("_")[0]
+    
+def _is_index_file(path_basename):
+    return path_basename.startswith("cache_index.")
+    
+# Write changes which are still buffered when the interpreter exits
+atexit.register(DiskCacheIndex.save_all)
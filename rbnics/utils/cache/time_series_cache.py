@@ -19,6 +19,30 @@
 from rbnics.utils.cache.cache import Cache
 
 class TimeSeriesCache(Cache):
+    """
+    Cache for time series. Items appended to a time series are buffered in RAM, and exported to disk
+    once "disk cache flush interval" items have been buffered, when the time series is complete,
+    or when flush() is called. Buffering only delays and groups the writes: each buffered item is still
+    exported by a separate call to the export function. With the dolfin backend and HDF5 support all
+    time steps are appended to a single XDMF/HDF5 file per time series, while without HDF5 support
+    each time step is written to its own XML file (alongside a single PVD file for visualization), and with
+    the numpy online backend each time step is written to its own NumPy file.
+    """
+    
+    def __init__(self, config_section=None, key_generator=None, import_=None, export=None, filename_generator=None, folder_generator=None):
+        Cache.__init__(self, config_section, key_generator, import_, export, filename_generator, folder_generator)
+        # Time series entries are buffered and written to disk in chunks, rather than at every append
+        if self._filename_generator is not None:
+            from rbnics.utils.config import config # cannot import at global scope
+            flush_interval = config.get(self._config_section, "disk cache flush interval")
+            assert isinstance(flush_interval, str)
+            assert flush_interval.isdigit()
+            self._flush_interval = int(flush_interval)
+            assert self._flush_interval > 0
+        else:
+            self._flush_interval = None
+        self._buffers = dict() # from storage filename to list of (index, item) to be written to disk
+        
     def __setitem__(self, key, value):
         """
         Set key in both RAM and disk storage.
@@ -27,16 +51,46 @@ class TimeSeriesCache(Cache):
         from rbnics.utils.test import PatchInstanceMethod
         assert isinstance(value, TimeSeries)
         if self._filename_generator is not None:
-            # Patch value's append method to save to file
+            # Patch value's append method to buffer the item, and save to file once enough items have been buffered
             (args, kwargs, storage_key) = self._compute_storage_key(key)
             storage_filename = self._filename_generator(*args, **kwargs)
+            self._flush(storage_filename) # in case an older time series was associated to the same file
+            buffer_ = self._buffers.setdefault(storage_filename, list())
             original_append = value.append
             def patched_append(self_, item):
-                self._export(storage_filename, item, len(self_))
+                buffer_.append((len(self_), item))
                 original_append(item)
+                if len(buffer_) >= self._flush_interval or len(self_) >= len(self_.expected_times()):
+                    self._flush(storage_filename)
             PatchInstanceMethod(value, "append", patched_append).patch()
         # Call standard setitem, disabling export
         bak_filename_generator = self._filename_generator
         self._filename_generator = None
         Cache.__setitem__(self, key, value)
         self._filename_generator = bak_filename_generator
+        
+    def __getitem__(self, key):
+        """
+        Get key from either RAM or disk storage, if possible.
+        """
+        if self._filename_generator is not None:
+            # Make sure that any buffered item is available on disk before importing it
+            (args, kwargs, storage_key) = self._compute_storage_key(key)
+            if storage_key not in self._storage:
+                self._flush(self._filename_generator(*args, **kwargs))
+        return Cache.__getitem__(self, key)
+        
+    def flush(self):
+        """
+        Write buffered time series entries to disk.
+        """
+        for storage_filename in list(self._buffers.keys()):
+            self._flush(storage_filename)
+            
+    def _flush(self, storage_filename):
+        buffer_ = self._buffers.get(storage_filename)
+        if buffer_ is not None and len(buffer_) > 0:
+            for (index, item) in buffer_:
+                self._export(storage_filename, item, index)
+            del buffer_[:]
+            self._update_disk_index(storage_filename)
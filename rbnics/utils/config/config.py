@@ -29,18 +29,31 @@ class Config(object):
     defaults = {
         "backends": {
             "online backend": "numpy",
+            "online stacked affine expansion storage": False,
+            "online memory mapped affine expansion storage": False,
             "required backends": None
         },
         "EIM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
+            "disk cache policy": "LRU",
             "RAM cache limit": "1"
         },
+        "POD": {
+            "method": "eigensolver",
+            "randomized oversampling": "10"
+        },
         "problems": {
             "cache": {"disk", "RAM"},
+            "disk cache flush interval": "10", # number of time steps buffered in RAM before being exported
             "disk cache limit": "unlimited",
+            "disk cache policy": "LRU",
             "RAM cache limit": "1"
         },
+        "reduced operators": {
+            "cache": {"RAM"},
+            "RAM cache limit": "100"
+        },
         "reduced problems": {
             "cache": {"RAM"},
             "RAM cache limit": "unlimited"
@@ -48,6 +61,7 @@ class Config(object):
         "SCM": {
             "cache": {"disk", "RAM"},
             "disk cache limit": "unlimited",
+            "disk cache policy": "LRU",
             "RAM cache limit": "1"
         }
     }
@@ -18,6 +18,7 @@
 
 import glob
 import os
+from rbnics.utils.cache.disk_cache_index import DiskCacheIndex
 from rbnics.utils.mpi import parallel_io
 from rbnics.utils.test import PatchInstanceMethod
 
@@ -61,6 +62,8 @@ def snapshot_links_to_cache(offline_method):
                                     for l in cache_file.readlines():
                                         snapshot_file.write(l.replace(cache_filename, filename))
                 parallel_io(create_links)
+                # Files in the cache folder must outlive the links, and thus they cannot be evicted by a bounded disk cache
+                DiskCacheIndex.get(cache_folder).pin(cache_filename)
             else:
                 original_export_solution(folder, filename, *args, **kwargs)
         return patched_export_solution_internal
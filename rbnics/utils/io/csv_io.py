@@ -32,6 +32,17 @@ class CSVIO(object):
                 writer.writerows(content)
         parallel_io(save_file_task)
         
+    # Append rows to file
+    @staticmethod
+    def append_file(content, directory, filename):
+        if not filename.endswith(".csv"):
+            filename = filename + ".csv"
+        def append_file_task():
+            with open(os.path.join(str(directory), filename), "a") as outfile:
+                writer = csv.writer(outfile, delimiter=";")
+                writer.writerows(content)
+        parallel_io(append_file_task)
+        
     # Load a variable from file
     @staticmethod
     def load_file(directory, filename):
@@ -37,6 +37,14 @@ class GreedySelectedParametersList(object):
         output.parameter_space_subset = self.parameter_space_subset.closest(M, mu)
         return output
         
+    def closest_batch(self, M, mus):
+        outputs = list()
+        for parameter_space_subset in self.parameter_space_subset.closest_batch(M, mus):
+            output = GreedySelectedParametersList()
+            output.parameter_space_subset = parameter_space_subset
+            outputs.append(output)
+        return outputs
+        
     @overload
     def __getitem__(self, key: int):
         return self.parameter_space_subset[key]
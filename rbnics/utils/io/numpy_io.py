@@ -30,12 +30,12 @@ class NumpyIO(object):
             numpy.save(os.path.join(str(directory), filename), content)
         parallel_io(save_file_task)
     
-    # Load a variable from file
+    # Load a variable from file, possibly memory mapping it rather than reading it in memory
     @staticmethod
-    def load_file(directory, filename):
+    def load_file(directory, filename, mmap_mode=None):
         if not filename.endswith(".npy"):
             filename = filename + ".npy"
-        return numpy.load(os.path.join(str(directory), filename))
+        return numpy.load(os.path.join(str(directory), filename), mmap_mode=mmap_mode)
             
     # Check if the file exists
     @staticmethod
@@ -45,3 +45,12 @@ class NumpyIO(object):
         def exists_file_task():
             return os.path.exists(os.path.join(str(directory), filename))
         return parallel_io(exists_file_task)
+        
+    # Remove a file
+    @staticmethod
+    def remove_file(directory, filename):
+        if not filename.endswith(".npy"):
+            filename = filename + ".npy"
+        def remove_file_task():
+            os.remove(os.path.join(str(directory), filename))
+        parallel_io(remove_file_task)
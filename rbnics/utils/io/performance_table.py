@@ -17,11 +17,14 @@
 #
 
 import os
+import re
 import sys
 import collections
-from numpy import exp, isnan, log, max, mean, min, nan, zeros as Content
+from numpy import exp, inf, isnan, log, maximum, minimum, nan, zeros as Content
+from numpy.ma import masked, masked_all
 from rbnics.utils.io.csv_io import CSVIO
 from rbnics.utils.io.folders import Folders
+from rbnics.utils.mpi import parallel_io
 
 class PerformanceTable(object):
     
@@ -30,15 +33,23 @@ class PerformanceTable(object):
     _preprocessor_setitem = dict()
     
     def __init__(self, testing_set):
-        self._columns = dict() # string to Content matrix
+        self._columns = list() # of strings
         self._columns_operations = dict() # string to tuple
         self._columns_not_implemented = dict() # string to bool
-        self._rows_not_implemented = dict() # string to dict of bool
+        self._rows_not_implemented = dict() # string to masked array of bools (masked if not set yet)
         self._groups = dict() # string to list
         self._group_names_sorted = list()
+        self._testing_set = testing_set
         self._len_testing_set = len(testing_set)
         self._Nmin = 1
         self._Nmax = 0
+        # Values are only stored for rows (i.e., entries of the testing set) which are being filled in,
+        # and are then accumulated in running aggregates, so that memory usage does not depend on the testing set size
+        self._open_rows = collections.OrderedDict() # from testing set index to dict from string to masked array
+        self._accumulated_rows = set() # of testing set indices
+        self._aggregates = dict() # string to dict from operation to Content array
+        self._completed_rows = set() # of testing set indices, only used when saving and loading rows
+        self._rows_files = set() # of (directory, filename) of the rows files which have been prepared for saving
         
     def set_Nmin(self, Nmin):
         self._Nmin = Nmin
@@ -50,9 +61,10 @@ class PerformanceTable(object):
         assert self._Nmax > 0
         assert self._Nmax >= self._Nmin
         assert column_name not in self._columns and column_name not in self._columns_operations
-        self._columns[column_name] = Content((self._Nmax - self._Nmin + 1, self._len_testing_set))
+        assert len(self._open_rows) == 0 and len(self._accumulated_rows) == 0
+        self._columns.append(column_name)
         self._columns_not_implemented[column_name] = None # will be set to a bool
-        self._rows_not_implemented[column_name] = {n: None for n in range(self._Nmax - self._Nmin + 1)} # will be set to a bool
+        self._rows_not_implemented[column_name] = masked_all((self._Nmax - self._Nmin + 1, ), dtype=bool) # will be set to bools
         if group_name not in self._groups:
             self._groups[group_name] = list()
             self._group_names_sorted.append(group_name) # preserve the ordering provided by the user
@@ -63,6 +75,14 @@ class PerformanceTable(object):
             self._columns_operations[column_name] = operations
         else:
             raise ValueError("Invalid operation in PerformanceTable")
+        size = self._Nmax - self._Nmin + 1
+        self._aggregates[column_name] = {
+            "min": Content((size, )) + inf,
+            "max": Content((size, )) - inf,
+            "sum_log": Content((size, )), # of values, where zeros are replaced by machine epsilon
+            "any_nonzero": Content((size, ), dtype=bool),
+            "count": Content((size, ), dtype=int)
+        }
     
     @classmethod
     def suppress_group(cls, group_name):
@@ -86,13 +106,14 @@ class PerformanceTable(object):
         N = args[1]
         mu_index = args[2]
         assert self._columns_not_implemented[column_name] in (True, False)
-        assert self._rows_not_implemented[column_name][N - self._Nmin] in (True, False)
+        assert self._rows_not_implemented[column_name][N - self._Nmin] is not masked
         if (
             not self._columns_not_implemented[column_name]
                 and
             not self._rows_not_implemented[column_name][N - self._Nmin]
         ):
-            return self._columns[column_name][N - self._Nmin, mu_index]
+            assert mu_index in self._open_rows, "Values can only be accessed while the corresponding row is being filled in"
+            return float(self._open_rows[mu_index][column_name][N - self._Nmin])
         else:
             return CustomNotImplementedAfterDiv
         
@@ -101,26 +122,52 @@ class PerformanceTable(object):
         column_name = args[0]
         N = args[1]
         mu_index = args[2]
+        self._setitem(column_name, N, mu_index, value, column_name in self._preprocessor_setitem)
+        
+    def _setitem(self, column_name, N, mu_index, value, preprocess):
+        rows_not_implemented = self._rows_not_implemented[column_name]
         if is_not_implemented(value):
             assert self._columns_not_implemented[column_name] in (None, True, False)
             if self._columns_not_implemented[column_name] is None:
                 self._columns_not_implemented[column_name] = True
-            assert self._rows_not_implemented[column_name][N - self._Nmin] in (None, True)
-            if self._rows_not_implemented[column_name][N - self._Nmin] is None:
-                self._rows_not_implemented[column_name][N - self._Nmin] = True
+            assert rows_not_implemented[N - self._Nmin] is masked or rows_not_implemented[N - self._Nmin]
+            rows_not_implemented[N - self._Nmin] = True
         else:
             assert self._columns_not_implemented[column_name] in (None, True, False)
             if self._columns_not_implemented[column_name] in (None, True):
                 self._columns_not_implemented[column_name] = False
-            assert self._rows_not_implemented[column_name][N - self._Nmin] in (None, False)
-            if self._rows_not_implemented[column_name][N - self._Nmin] is None:
-                self._rows_not_implemented[column_name][N - self._Nmin] = False
-            if column_name not in self._preprocessor_setitem:
-                self._columns[column_name][N - self._Nmin, mu_index] = value
-            else:
-                self._columns[column_name][N - self._Nmin, mu_index] = self._preprocessor_setitem[column_name](value)
+            assert rows_not_implemented[N - self._Nmin] is masked or not rows_not_implemented[N - self._Nmin]
+            rows_not_implemented[N - self._Nmin] = False
+            if preprocess:
+                value = self._preprocessor_setitem[column_name](value)
+            self._open_row(mu_index)[column_name][N - self._Nmin] = value
+            
+    def _open_row(self, mu_index):
+        if mu_index not in self._open_rows:
+            assert mu_index not in self._accumulated_rows, "Rows cannot be changed after being accumulated"
+            # Rows are filled in one after the other, hence any other row is complete
+            self._accumulate_rows()
+            self._open_rows[mu_index] = {column_name: masked_all((self._Nmax - self._Nmin + 1, )) for column_name in self._columns}
+        return self._open_rows[mu_index]
+        
+    def _accumulate_rows(self):
+        for (mu_index, row) in self._open_rows.items():
+            for (column_name, values) in row.items():
+                aggregates = self._aggregates[column_name]
+                available = ~values.mask
+                values = values.filled(0.)
+                aggregates["min"][available] = minimum(aggregates["min"][available], values[available])
+                aggregates["max"][available] = maximum(aggregates["max"][available], values[available])
+                nonzero_values = values.copy()
+                nonzero_values[nonzero_values == 0.] = sys.float_info.epsilon
+                aggregates["sum_log"][available] += log(nonzero_values[available])
+                aggregates["any_nonzero"][available] |= (values[available] != 0.)
+                aggregates["count"][available] += 1
+            self._accumulated_rows.add(mu_index)
+        self._open_rows.clear()
             
     def _process(self):
+        self._accumulate_rows()
         groups_content = collections.OrderedDict()
         for group in self._group_names_sorted:
             # Skip suppresed groups
@@ -146,6 +193,7 @@ class PerformanceTable(object):
             column_size["N"] = max([max([len(str(x)) for x in table_content["N"]]), len("N")])
             # Then fill in with postprocessed data
             for column in columns:
+                aggregates = self._aggregates[column]
                 for operation in self._columns_operations[column]:
                     # Set header
                     if operation in ("min", "max"):
@@ -158,22 +206,20 @@ class PerformanceTable(object):
                         raise ValueError("Invalid operation in PerformanceTable")
                     table_index.append(current_table_index)
                     table_header[current_table_index] = current_table_header
-                    # Compute the required operation of each column over the second index (testing set)
+                    # Get the required operation of each column over the second index (testing set) from running aggregates
                     table_content[current_table_index] = Content((self._Nmax - self._Nmin + 1,))
                     for n in range(self._Nmin, self._Nmax + 1):
-                        assert self._rows_not_implemented[column][n - self._Nmin] in (True, False)
-                        if self._rows_not_implemented[column][n - self._Nmin] is False:
+                        assert self._rows_not_implemented[column][n - self._Nmin] is not masked
+                        if not self._rows_not_implemented[column][n - self._Nmin]:
                             if operation == "min":
-                                current_table_content = min(self._columns[column][n - self._Nmin, :])
+                                current_table_content = aggregates["min"][n - self._Nmin]
                             elif operation == "mean":
-                                data = self._columns[column][n - self._Nmin, :]
-                                if not data.any(): # all zeros
+                                if not aggregates["any_nonzero"][n - self._Nmin]: # all zeros
                                     current_table_content = 0.
                                 else:
-                                    data[data == 0.] = sys.float_info.epsilon
-                                    current_table_content = exp(mean(log(data)))
+                                    current_table_content = exp(aggregates["sum_log"][n - self._Nmin]/aggregates["count"][n - self._Nmin])
                             elif operation == "max":
-                                current_table_content = max(self._columns[column][n - self._Nmin, :])
+                                current_table_content = aggregates["max"][n - self._Nmin]
                             else:
                                 raise ValueError("Invalid operation in PerformanceTable")
                             table_content[current_table_index][n - self._Nmin] = current_table_content
@@ -235,6 +281,100 @@ class PerformanceTable(object):
     def load(self, directory, filename):
         raise RuntimeError("PerformanceTable.load has not been implemented yet")
         
+    def save_row(self, directory, mu_index, mu, partition_index=0, key=""):
+        """
+        Append the values associated to the mu_index-th entry of the testing set to the rows file of the
+        provided partition, so that an interrupted analysis can be resumed, or partial tables can be merged.
+        The key should identify the settings (e.g. reduced dimensions and keyword arguments) which the values
+        have been computed with, and is stored in the header of the rows file.
+        """
+        size = self._Nmax - self._Nmin + 1
+        row = self._open_rows.get(mu_index, None)
+        filename = "rows_" + str(partition_index)
+        if (str(directory), filename) not in self._rows_files:
+            # Start a new rows file, unless the existing one has been saved with the same key and table layout
+            rows_key_and_header = [self._rows_key(key), self._rows_header()]
+            if not CSVIO.exists_file(directory, filename) or CSVIO.load_file(directory, filename)[:2] != rows_key_and_header:
+                CSVIO.save_file(rows_key_and_header, directory, filename)
+            self._rows_files.add((str(directory), filename))
+        line = [str(mu_index), str(mu)]
+        for column_name in self._columns:
+            for n in range(size):
+                row_not_implemented = self._rows_not_implemented[column_name][n]
+                if row_not_implemented is not masked and row_not_implemented:
+                    line.append("NotImplemented")
+                elif row is None or row[column_name][n] is masked:
+                    line.append("")
+                else:
+                    line.append(str(float(row[column_name][n])))
+        CSVIO.append_file([line], directory, filename)
+        self._completed_rows.add(mu_index)
+        
+    def load_rows(self, directory, key=""):
+        """
+        Load the rows saved in directory by any partition, if they were previously saved for the same
+        testing set, table layout and key, and have not been filled in yet.
+        """
+        size = self._Nmax - self._Nmin + 1
+        header = self._rows_header()
+        def list_rows_files_task():
+            return sorted(filename for filename in os.listdir(str(directory)) if re.match(r"^rows_[0-9]+\.csv$", filename))
+        for filename in parallel_io(list_rows_files_task):
+            content = CSVIO.load_file(directory, filename)
+            if len(content) < 2 or content[0] != self._rows_key(key) or content[1] != header:
+                continue
+            for line in content[2:]:
+                if len(line) != len(header): # e.g. a row which was being written when an analysis was interrupted
+                    continue
+                mu_index = int(line[0])
+                if (
+                    mu_index >= self._len_testing_set
+                        or
+                    line[1] != str(self._testing_set[mu_index])
+                        or
+                    mu_index in self._completed_rows
+                        or
+                    mu_index in self._open_rows
+                        or
+                    mu_index in self._accumulated_rows
+                ):
+                    continue
+                for (c, column_name) in enumerate(self._columns):
+                    for n in range(size):
+                        value = line[2 + c*size + n]
+                        if value == "NotImplemented":
+                            self._setitem(column_name, n + self._Nmin, mu_index, NotImplemented, False)
+                        elif value != "":
+                            self._setitem(column_name, n + self._Nmin, mu_index, float(value), False) # value has been already preprocessed
+                self._completed_rows.add(mu_index)
+                
+    @staticmethod
+    def _rows_key(key):
+        return ["key", key]
+        
+    def _rows_header(self):
+        return ["mu_index", "mu"] + [column_name + "_" + str(n) for column_name in self._columns for n in range(self._Nmin, self._Nmax + 1)]
+        
+    def has_row(self, mu_index):
+        """
+        Return True if the row associated to the mu_index-th entry of the testing set has been saved or loaded.
+        """
+        return mu_index in self._completed_rows
+        
+    def is_complete(self):
+        """
+        Return True if all rows of the table have been saved or loaded.
+        """
+        return len(self._completed_rows) == self._len_testing_set
+        
+    @staticmethod
+    def remove_rows(directory):
+        def remove_rows_task():
+            for filename in os.listdir(str(directory)):
+                if re.match(r"^rows_[0-9]+\.csv$", filename):
+                    os.remove(os.path.join(str(directory), filename))
+        parallel_io(remove_rows_task)
+        
         
 class CustomNotImplementedType(object):
     def __init__(self):
@@ -0,0 +1,174 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+from rbnics.backends import TimeSeries
+from rbnics.utils.cache import Cache, cache_statistics, TimeSeriesCache
+from rbnics.utils.cache.disk_cache_index import DiskCacheIndex
+from rbnics.utils.config import config
+from rbnics.utils.io import Folders
+
+def _create_cache(tempdir):
+    folder = Folders.Folder(os.path.join(tempdir, "cache"))
+    folder.create()
+    def key_generator(*args, **kwargs):
+        return args[0]
+    def import_(filename):
+        with open(os.path.join(str(folder), filename + ".txt"), "r") as infile:
+            return int(infile.read())
+    def export(filename):
+        with open(os.path.join(str(folder), filename + ".txt"), "w") as outfile:
+            outfile.write(str(exported_values[filename]))
+    def filename_generator(*args, **kwargs):
+        return "entry" + str(args[0])
+    exported_values = dict()
+    cache = Cache(
+        "problems",
+        key_generator=key_generator,
+        import_=import_,
+        export=export,
+        filename_generator=filename_generator,
+        folder_generator=lambda: folder
+    )
+    return (cache, folder, exported_values)
+
+# Test bounded disk cache with least recently used and least frequently used eviction policies
+def test_cache_disk_limit(tempdir):
+    disk_cache_limit = config.get("problems", "disk cache limit")
+    disk_cache_policy = config.get("problems", "disk cache policy")
+    for policy in ("LRU", "LFU"):
+        config.set("problems", "disk cache limit", "2")
+        config.set("problems", "disk cache policy", policy)
+        (cache, folder, exported_values) = _create_cache(os.path.join(tempdir, policy))
+        for i in range(2):
+            exported_values["entry" + str(i)] = i
+            cache[i] = i
+        # Access the oldest entry twice from disk, so that it is both the most recently and the most frequently used
+        for _ in range(2):
+            cache.clear()
+            assert cache[0] == 0
+        # Adding a third entry evicts the second one
+        exported_values["entry2"] = 2
+        cache[2] = 2
+        assert os.path.exists(os.path.join(str(folder), "entry0.txt"))
+        assert not os.path.exists(os.path.join(str(folder), "entry1.txt"))
+        assert os.path.exists(os.path.join(str(folder), "entry2.txt"))
+        assert os.path.exists(os.path.join(str(folder), "cache_index.pkl"))
+        cache.clear()
+        misses = cache_statistics["problems"]["misses"]
+        try:
+            cache[1]
+        except KeyError:
+            pass
+        else:
+            raise AssertionError("Evicted entry should not be found")
+        assert cache_statistics["problems"]["misses"] == misses + 1
+    config.set("problems", "disk cache limit", disk_cache_limit)
+    config.set("problems", "disk cache policy", disk_cache_policy)
+    
+# Test that eviction only removes the files of the evicted entry, even when other entries share its prefix,
+# and that accesses are recorded in the disk index, so that they are available to other processes
+def test_cache_disk_limit_index(tempdir):
+    disk_cache_limit = config.get("problems", "disk cache limit")
+    disk_cache_policy = config.get("problems", "disk cache policy")
+    config.set("problems", "disk cache limit", "2")
+    config.set("problems", "disk cache policy", "LRU")
+    (cache, folder, exported_values) = _create_cache(tempdir)
+    for i in (1, 10):
+        exported_values["entry" + str(i)] = i
+        cache[i] = i
+    # Access the oldest entry from disk, so that it becomes the most recently used one
+    cache.clear()
+    assert cache[1] == 1
+    # Emulate a new process, which loads the disk index from file saved at exit
+    DiskCacheIndex.save_all()
+    DiskCacheIndex._all_indices.clear()
+    (cache, _, exported_values) = _create_cache(tempdir)
+    exported_values["entry11"] = 11
+    cache[11] = 11
+    assert os.path.exists(os.path.join(str(folder), "entry1.txt"))
+    assert not os.path.exists(os.path.join(str(folder), "entry10.txt"))
+    assert os.path.exists(os.path.join(str(folder), "entry11.txt"))
+    # Evicting entry1 should not remove files of entry11
+    exported_values["entry12"] = 12
+    cache[12] = 12
+    assert not os.path.exists(os.path.join(str(folder), "entry1.txt"))
+    assert os.path.exists(os.path.join(str(folder), "entry11.txt"))
+    assert os.path.exists(os.path.join(str(folder), "entry12.txt"))
+    config.set("problems", "disk cache limit", disk_cache_limit)
+    config.set("problems", "disk cache policy", disk_cache_policy)
+    
+# Test that accesses are buffered before being saved to the disk index, and that pinned entries
+# (e.g. linked from the snapshots folder) are never evicted
+def test_cache_disk_limit_index_pin(tempdir):
+    disk_cache_limit = config.get("problems", "disk cache limit")
+    disk_cache_policy = config.get("problems", "disk cache policy")
+    config.set("problems", "disk cache limit", "2")
+    config.set("problems", "disk cache policy", "LRU")
+    (cache, folder, exported_values) = _create_cache(tempdir)
+    for i in range(2):
+        exported_values["entry" + str(i)] = i
+        cache[i] = i
+    disk_index = DiskCacheIndex.get(folder)
+    disk_index.pin("entry0")
+    assert disk_index.is_pinned("entry0")
+    index_timestamp = os.stat(os.path.join(str(folder), "cache_index.pkl")).st_mtime_ns
+    for _ in range(DiskCacheIndex.save_interval - 1):
+        cache.clear()
+        assert cache[1] == 1
+    assert os.stat(os.path.join(str(folder), "cache_index.pkl")).st_mtime_ns == index_timestamp
+    # Adding further entries evicts the unpinned ones only, even though entry0 is the least recently used one
+    for i in range(2, 4):
+        exported_values["entry" + str(i)] = i
+        cache[i] = i
+    assert os.path.exists(os.path.join(str(folder), "entry0.txt"))
+    assert not os.path.exists(os.path.join(str(folder), "entry1.txt"))
+    assert not os.path.exists(os.path.join(str(folder), "entry2.txt"))
+    assert os.path.exists(os.path.join(str(folder), "entry3.txt"))
+    # The pin is stored in the disk index, and thus it is available to other processes
+    DiskCacheIndex._all_indices.clear()
+    assert DiskCacheIndex.get(folder).is_pinned("entry0")
+    config.set("problems", "disk cache limit", disk_cache_limit)
+    config.set("problems", "disk cache policy", disk_cache_policy)
+    
+# Test buffered export of time series, which are written to disk every flush interval entries
+def test_time_series_cache_flush_interval(tempdir):
+    flush_interval = config.get("problems", "disk cache flush interval")
+    config.set("problems", "disk cache flush interval", "3")
+    folder = Folders.Folder(os.path.join(tempdir, "cache"))
+    folder.create()
+    exported_entries = list()
+    def export(filename, item, index):
+        exported_entries.append((filename, item, index))
+    cache = TimeSeriesCache(
+        "problems",
+        key_generator=lambda *args, **kwargs: args[0],
+        import_=lambda filename: None,
+        export=export,
+        filename_generator=lambda *args, **kwargs: "entry" + str(args[0]),
+        folder_generator=lambda: folder
+    )
+    cache[0] = TimeSeries((0., 1.), 0.25)
+    for i in range(4):
+        cache[0].append(float(i))
+    assert exported_entries == [("entry0", 0., 0), ("entry0", 1., 1), ("entry0", 2., 2)]
+    cache.flush()
+    assert exported_entries[3:] == [("entry0", 3., 3)]
+    cache[0].append(4.)
+    assert exported_entries[4:] == [("entry0", 4., 4)] # time series is complete
+    config.set("problems", "disk cache flush interval", flush_interval)
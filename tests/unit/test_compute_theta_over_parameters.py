@@ -0,0 +1,102 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import isclose
+from dolfin import Constant, DirichletBC, dx, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitIntervalMesh
+from rbnics import EllipticCoerciveProblem
+
+# Problem whose compute_theta only involves arithmetic operations on mu
+class Problem(EllipticCoerciveProblem):
+    def __init__(self, V, **kwargs):
+        EllipticCoerciveProblem.__init__(self, V, **kwargs)
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.vectorized_compute_theta = True
+        
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1., mu[0]*mu[1] + 2.)
+        elif term == "f":
+            return (1., )
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+            
+    def assemble_operator(self, term):
+        u = self.u
+        v = self.v
+        if term == "a":
+            return (inner(grad(u), grad(v))*dx, u*v*dx, inner(grad(u), grad(v))*dx)
+        elif term == "f":
+            return (v*dx, )
+        elif term == "dirichlet_bc":
+            return ([DirichletBC(self.V, Constant(0.0), "on_boundary")], )
+        elif term == "inner_product":
+            return (inner(grad(u), grad(v))*dx, )
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+            
+# Problem whose compute_theta branches on the value of mu, and thus cannot be evaluated for several parameters at once
+class BranchingProblem(Problem):
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            if mu[0] > 5.:
+                return (mu[0], 1., 2.)
+            else:
+                return (mu[0], 1., mu[1])
+        else:
+            return Problem.compute_theta(self, term)
+            
+def _create_problem(ProblemClass):
+    mesh = UnitIntervalMesh(4)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = ProblemClass(V)
+    problem.set_mu_range([(1.0, 10.0), (-1.0, 1.0)])
+    problem.init()
+    problem.set_mu((1.0, 0.0))
+    return problem
+    
+def _compute_theta_for_each_parameter(problem, term, parameters):
+    thetas = list()
+    for mu in parameters:
+        problem.set_mu(mu)
+        thetas.append(problem.compute_theta(term))
+    return thetas
+    
+# Test that thetas computed for all parameters at once agree with the ones computed for each parameter separately,
+# both when compute_theta can be evaluated on arrays and when it has to fall back to one evaluation for each parameter
+@pytest.mark.parametrize("ProblemClass", [Problem, BranchingProblem])
+def test_compute_theta_over_parameters(ProblemClass, tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir) # problem data are stored in a folder named after the problem
+    problem = _create_problem(ProblemClass)
+    training_set = [(1.0, -1.0), (2.5, 0.5), (7.0, 0.25), (10.0, 1.0)]
+    for term in ("a", "f"):
+        thetas = problem.compute_theta_over_parameters(term, training_set)
+        assert problem.mu == (1.0, 0.0) # current parameter is preserved
+        expected_thetas = _compute_theta_for_each_parameter(problem, term, training_set)
+        problem.set_mu((1.0, 0.0))
+        assert thetas.shape == (len(training_set), len(expected_thetas[0])) # also constant thetas are broadcast to all parameters
+        for (theta, expected_theta) in zip(thetas, expected_thetas):
+            assert isclose(theta, expected_theta).all()
+    if ProblemClass is BranchingProblem:
+        assert problem._vectorized_compute_theta_failed_terms == {"a"}
+    else:
+        assert len(problem._vectorized_compute_theta_failed_terms) == 0
+    # An empty set of parameters returns an empty array with the right number of columns
+    assert problem.compute_theta_over_parameters("a", []).shape == (0, 3)
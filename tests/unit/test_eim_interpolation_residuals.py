@@ -0,0 +1,86 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import isclose, pi
+from dolfin import dx, FunctionSpace, IntervalMesh, TestFunction
+from rbnics import EquispacedDistribution, ParametrizedExpression
+from rbnics.backends import abs, max, ParametrizedExpressionFactory, ParametrizedTensorFactory
+from rbnics.eim.problems.eim_approximation import EIMApproximation
+from rbnics.eim.reduction_methods.eim_approximation_reduction_method import EIMApproximationReductionMethod
+from rbnics.problems.base import ParametrizedProblem
+
+class MockProblem(ParametrizedProblem):
+    def __init__(self, V, **kwargs):
+        ParametrizedProblem.__init__(self, "")
+        self.V = V
+        
+    def name(self):
+        return "MockProblem"
+        
+class ParametrizedFunctionApproximation(EIMApproximation):
+    def __init__(self, V, expression_type):
+        self.V = V
+        # Parametrized function to be interpolated
+        mock_problem = MockProblem(V)
+        f = ParametrizedExpression(mock_problem, "(1-x[0])*cos(3*pi*mu[0]*(1+x[0]))*exp(-mu[0]*(1+x[0]))", mu=(1., ), element=V.ufl_element())
+        #
+        assert expression_type in ("Function", "Vector")
+        if expression_type == "Function":
+            EIMApproximation.__init__(self, mock_problem, ParametrizedExpressionFactory(f), "ParametrizedFunctionApproximation", "Greedy")
+        elif expression_type == "Vector":
+            v = TestFunction(V)
+            EIMApproximation.__init__(self, mock_problem, ParametrizedTensorFactory(f*v*dx), "ParametrizedFunctionApproximation", "Greedy")
+            
+# Test that the interpolation residuals updated by rank-one corrections during the greedy agree with the ones
+# obtained by interpolating each snapshot from scratch, and that the greedy selects the same parameters
+@pytest.mark.parametrize("expression_type", ["Function", "Vector"])
+def test_eim_interpolation_residuals(expression_type, tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir) # offline data are stored in a folder named after the approximation
+    mesh = IntervalMesh(100, -1., 1.)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    approximation = ParametrizedFunctionApproximation(V, expression_type)
+    approximation.set_mu_range([(1., pi), ])
+    reduction_method = EIMApproximationReductionMethod(approximation)
+    reduction_method.set_Nmax(10)
+    reduction_method.set_tolerance(0.)
+    reduction_method.initialize_training_set(51, sampling=EquispacedDistribution())
+    reduction_method.offline()
+    N = approximation.N
+    assert N == 10
+    
+    def compute_maximum_interpolation_error(mu, n):
+        approximation.set_mu(mu)
+        approximation.solve(n)
+        approximation.snapshot = reduction_method.load_snapshot()
+        return approximation.compute_maximum_interpolation_error(n)
+        
+    # Residuals with N basis functions
+    for (mu_index, mu) in enumerate(reduction_method.training_set):
+        (error, maximum_error, maximum_location) = compute_maximum_interpolation_error(mu, N)
+        (maximum_residual_difference, _) = max(abs(reduction_method._interpolation_residuals[mu_index] - error))
+        assert isclose(maximum_residual_difference, 0., atol=1.e-10)
+        assert isclose(reduction_method._interpolation_residuals_maximum[mu_index], maximum_error, rtol=1.e-6, atol=1.e-12) # with sign
+        
+    # Parameters selected by a greedy which interpolates each snapshot from scratch
+    for n in range(N):
+        (_, error_argmax) = reduction_method.training_set.max(lambda mu: abs(compute_maximum_interpolation_error(mu, n)[1]))
+        assert reduction_method.training_set[error_argmax] == reduction_method.greedy_selected_parameters[n]
+        
+    # Basis functions are normalized to one (and not minus one) at their interpolation location
+    for n in range(N):
+        assert isclose(approximation.interpolation_matrix[0][n, n], 1.)
@@ -0,0 +1,42 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+from numpy import isclose
+from dolfin import Constant, FunctionSpace, interpolate, UnitIntervalMesh
+from rbnics.backends import FunctionsList, SnapshotsMatrix
+
+# Test that products of functions lists by online vectors account for vectors modified in place
+def test_functions_list_mul_modified_in_place():
+    mesh = UnitIntervalMesh(10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    functions_list = FunctionsList(V)
+    functions_list.enrich([interpolate(Constant(1.), V), interpolate(Constant(2.), V)])
+    
+    assert isclose((functions_list*(1., 1.)).vector().get_local(), 3.).all()
+    assert functions_list._dense_storage is not None
+    functions_list[1].vector()[:] = 3.
+    assert isclose((functions_list*(1., 1.)).vector().get_local(), 4.).all()
+    
+# Test that snapshots matrices do not keep a dense copy of their content
+def test_snapshots_matrix_mul_dense_storage():
+    mesh = UnitIntervalMesh(10)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    snapshots_matrix = SnapshotsMatrix(V)
+    snapshots_matrix.enrich([interpolate(Constant(1.), V), interpolate(Constant(2.), V)])
+    
+    assert isclose((snapshots_matrix*(1., 1.)).vector().get_local(), 3.).all()
+    assert snapshots_matrix._dense_storage is None
@@ -0,0 +1,89 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import asarray, eye, isclose
+from numpy.random import rand, seed
+from dolfin import assemble, dx, Function as DolfinFunction, FunctionSpace, grad, inner, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics.backends.dolfin import BasisFunctionsMatrix, GramSchmidt as DolfinGramSchmidt, transpose as dolfin_transpose
+from rbnics.backends.online.numpy import Function as NumpyFunction, GramSchmidt as NumpyGramSchmidt, Matrix as NumpyMatrix, transpose as numpy_transpose
+
+# Orthonormalize basis functions as reduction methods do: functions associated to boundary conditions
+# and the first two functions are added one at a time, while three further functions are added at once
+# (as in time dependent RB reduction), the second of which being almost linearly dependent on the previous
+# functions which are not associated to boundary conditions
+def _orthonormalize(gram_schmidt, basis_functions, enrich, generate_function, generate_almost_dependent_function, N_bc):
+    for _ in range(N_bc + 2):
+        enrich(generate_function())
+        gram_schmidt.apply(basis_functions, N_bc)
+    new_functions = [generate_function(), generate_almost_dependent_function(), generate_function()]
+    for new_function in new_functions:
+        enrich(new_function)
+    gram_schmidt.apply(basis_functions, N_bc, N_new=3)
+    
+# Check that functions associated to boundary conditions are normalized, and that the remaining ones are orthonormal
+def _assert_orthonormal(gram_matrix, N_bc):
+    assert isclose(gram_matrix.diagonal(), 1.).all()
+    assert isclose(gram_matrix[N_bc:, N_bc:], eye(gram_matrix.shape[0] - N_bc), atol=1.e-10).all()
+    
+# Test Gram-Schmidt with the numpy online backend
+@pytest.mark.parametrize("N_bc", [0, 2])
+def test_gram_schmidt_numpy(N_bc):
+    seed(0)
+    N = 30
+    inner_product = NumpyMatrix(N, N)
+    inner_product_content = rand(N, N)
+    inner_product[:, :] = inner_product_content.T.dot(inner_product_content) + N*eye(N)
+    basis_functions = list()
+    def generate_function():
+        function = NumpyFunction(N)
+        function.vector()[:] = rand(N)
+        return function
+    def generate_almost_dependent_function():
+        function = NumpyFunction(N)
+        function.vector()[:] = 1.e-8*rand(N) + sum(asarray(basis_functions[n].vector()) for n in range(N_bc, len(basis_functions)))
+        return function
+    _orthonormalize(NumpyGramSchmidt(inner_product), basis_functions, basis_functions.append, generate_function, generate_almost_dependent_function, N_bc)
+    gram_matrix = asarray([[numpy_transpose(basis_function_i)*inner_product*basis_function_j for basis_function_j in basis_functions] for basis_function_i in basis_functions])
+    _assert_orthonormal(gram_matrix, N_bc)
+    
+# Test Gram-Schmidt with the dolfin backend
+@pytest.mark.parametrize("N_bc", [0, 2])
+def test_gram_schmidt_dolfin(N_bc):
+    seed(0)
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    inner_product = assemble(inner(grad(u), grad(v))*dx + inner(u, v)*dx)
+    basis_functions = BasisFunctionsMatrix(V)
+    basis_functions.init("u")
+    def generate_function():
+        function = DolfinFunction(V)
+        function.vector().set_local(rand(function.vector().local_size()))
+        function.vector().apply("insert")
+        return function
+    def generate_almost_dependent_function():
+        function = generate_function()
+        vector = function.vector()
+        vector *= 1.e-8
+        for n in range(N_bc, len(basis_functions)):
+            vector.axpy(1., basis_functions[n].vector())
+        return function
+    _orthonormalize(DolfinGramSchmidt(inner_product), basis_functions, basis_functions.enrich, generate_function, generate_almost_dependent_function, N_bc)
+    gram_matrix = asarray(dolfin_transpose(basis_functions)*inner_product*basis_functions)
+    _assert_orthonormal(gram_matrix, N_bc)
@@ -0,0 +1,35 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import subprocess
+import sys
+import pytest
+
+# Test that RBniCS can be imported starting from any of its entry points. Each import is carried out
+# in a new interpreter, since the order in which modules are imported for the first time matters
+@pytest.mark.parametrize("statement", [
+    "import rbnics",
+    "from rbnics import EllipticCoerciveProblem",
+    "from rbnics import ReducedBasis, PODGalerkin",
+    "from rbnics import EIM, DEIM, SCM, ShapeParametrization",
+    "from rbnics.backends import LinearSolver",
+    "import rbnics.backends.online.numpy",
+    "from rbnics.sampling import ParameterSpaceSubset",
+    "from rbnics.utils.cache import Cache",
+])
+def test_import(statement):
+    subprocess.check_call([sys.executable, "-c", statement])
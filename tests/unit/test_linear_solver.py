@@ -16,7 +16,8 @@
 # along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
 #
 
-from numpy import dot, isclose
+import pytest
+from numpy import asarray, dot, isclose
 from numpy.linalg import norm as monitor_norm
 import matplotlib
 import matplotlib.pyplot as plt
@@ -184,3 +185,112 @@ def test_linear_solver():
         error_dense = _test_linear_solver_dense(V, a, f, X, exact_solution)
         assert isclose(error_dense, error_sparse_tensor_callbacks)
         assert isclose(error_dense, error_sparse_form_callbacks)
+        
+# ~~~ Hierarchical dense case ~~~ #
+def test_linear_solver_hierarchical():
+    from numpy import eye
+    from numpy.linalg import solve
+    from numpy.random import rand, seed
+    from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+    
+    # Define a diagonally dominant system, whose leading principal submatrices are not singular
+    seed(0)
+    N = 10
+    A_array = rand(N, N) + N*eye(N)
+    F_array = rand(N)
+    A = Matrix(N, N)
+    A[:, :] = A_array
+    F = Vector(N)
+    F[:] = F_array
+    
+    # Solve all systems associated to leading principal submatrices at once
+    solver = LinearSolver(A, Function(N), F)
+    solutions = [Function(n) for n in range(1, N + 1)]
+    solver.solve_hierarchical(solutions)
+    
+    # Compare to separate solves
+    for (n, solution) in zip(range(1, N + 1), solutions):
+        assert isclose(solution.vector(), solve(A_array[:n, :n], F_array[:n])).all()
+        
+# Test hierarchical solves with symmetric positive definite systems (Cholesky factorization) and with
+# non symmetric systems larger than the block size of the LU factorization
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_linear_solver_hierarchical_large(symmetric):
+    from numpy import eye
+    from numpy.linalg import solve
+    from numpy.random import rand, seed
+    from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+    
+    seed(0)
+    N = 70
+    A_array = rand(N, N) + N*eye(N)
+    if symmetric:
+        A_array = A_array + A_array.T
+    F_array = rand(N)
+    A = Matrix(N, N)
+    A[:, :] = A_array
+    F = Vector(N)
+    F[:] = F_array
+    
+    solver = LinearSolver(A, Function(N), F)
+    solutions = [Function(n) for n in range(1, N + 1)]
+    solver.solve_hierarchical(solutions)
+    
+    for (n, solution) in zip(range(1, N + 1), solutions):
+        assert isclose(solution.vector(), solve(A_array[:n, :n], F_array[:n])).all()
+        
+# Test hierarchical solves when a leading principal submatrix is nearly, but not exactly, singular
+def test_linear_solver_hierarchical_small_pivot():
+    from numpy import array
+    from numpy.linalg import solve
+    from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+    
+    A_array = array([[1.e-20, 1.], [1., 1.]])
+    F_array = array([1., 2.])
+    A = Matrix(2, 2)
+    A[:, :] = A_array
+    F = Vector(2)
+    F[:] = F_array
+    
+    # The factorization without pivoting would be inaccurate: each system is solved separately instead
+    solver = LinearSolver(A, Function(2), F)
+    solutions = [Function(n) for n in (1, 2)]
+    solver.solve_hierarchical(solutions)
+    assert isclose(solutions[1].vector(), solve(A_array, F_array)).all()
+    
+# ~~~ Singular dense case ~~~ #
+def test_linear_solver_singular():
+    import pytest
+    from numpy import array
+    from numpy.linalg import LinAlgError
+    from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+    
+    # Define a system whose second row is a multiple of the first one
+    A = Matrix(2, 2)
+    A[:, :] = array([[1., 2.], [2., 4.]])
+    F = Vector(2)
+    F[:] = array([1., 1.])
+    
+    # Solution should fail as in numpy.linalg.solve, rather than returning inf or nan
+    solver = LinearSolver(A, Function(2), F)
+    with pytest.raises(LinAlgError):
+        solver.solve()
+    
+# Test that boundary conditions do not modify the left-hand and right-hand sides, which may be stored in a cache
+def test_linear_solver_bcs():
+    from numpy import array
+    from rbnics.backends.online.numpy import Function, LinearSolver, Matrix, Vector
+    
+    A = Matrix(2, 2)
+    A[:, :] = array([[2., 1.], [1., 2.]])
+    F = Vector(2)
+    F[:] = array([1., 1.])
+    solution = Function(2)
+    
+    # Solve with a boundary condition on the first basis function
+    solver = LinearSolver(A, solution, F, (3., ))
+    solver.solve()
+    assert isclose(solution.vector()[0], 3.)
+    assert isclose(solution.vector()[1], -1.)
+    assert isclose(asarray(A), [[2., 1.], [1., 2.]]).all()
+    assert isclose(asarray(F), [1., 1.]).all()
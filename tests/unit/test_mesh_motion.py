@@ -0,0 +1,73 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import allclose, isclose
+from dolfin import ALE, cells, FunctionSpace, MeshFunction, UnitSquareMesh
+from rbnics.backends.dolfin import MeshMotion
+
+# Piecewise affine shape parametrization on three vertical strips, continuous across the interfaces x = 0.25 and x = 0.75
+shape_parametrization_expression = [
+    ("mu[0]*x[0]", "x[1]"),
+    ("0.25*mu[0] + mu[1]*(x[0] - 0.25)", "x[1] + mu[2]*(x[0] - 0.25)"),
+    ("0.25*mu[0] + 0.5*mu[1] + (x[0] - 0.75)", "x[1] + 0.5*mu[2]")
+]
+
+# Only set the attributes of the problem which are required by the mesh motion
+class Problem(object):
+    def __init__(self):
+        self.mu = (1., 1., 0.)
+        
+    def set_mu(self, mu):
+        self.mu = mu
+        
+# Test that moving vertex coordinates by the affine maps of each subdomain provides the same mesh as
+# the interpolation of the displacement followed by ALE.move, also at vertices on subdomain interfaces
+@pytest.mark.parametrize("mu", [(1., 1., 0.), (2., 0.5, 0.3), (0.5, 1.5, -0.2)])
+def test_mesh_motion_affine_coordinates(mu):
+    mesh = UnitSquareMesh(8, 8)
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim(), 0)
+    for cell in cells(mesh):
+        midpoint_x = cell.midpoint().x()
+        if midpoint_x < 0.25:
+            subdomains[cell] = 1
+        elif midpoint_x < 0.75:
+            subdomains[cell] = 2
+        else:
+            subdomains[cell] = 3
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    mesh_motion = MeshMotion(V, subdomains, shape_parametrization_expression)
+    problem = Problem()
+    mesh_motion.init(problem)
+    assert mesh_motion.affine_maps is not None
+    problem.set_mu(mu)
+    
+    # Vertex coordinates moved by affine maps
+    affine_coordinates = mesh_motion.compute_affine_coordinates()
+    mesh_motion.move_mesh()
+    assert allclose(mesh.coordinates(), affine_coordinates)
+    mesh_motion.reset_reference()
+    assert allclose(mesh.coordinates(), mesh_motion.reference_coordinates)
+    
+    # Vertex coordinates moved by the interpolated displacement
+    ALE.move(mesh, mesh_motion.compute_displacement())
+    assert allclose(mesh.coordinates(), affine_coordinates)
+    
+    # The comparison includes vertices on both interfaces
+    for interface_x in (0.25, 0.75):
+        assert isclose(mesh_motion.reference_coordinates[:, 0], interface_x).any()
+    mesh_motion.reset_reference()
@@ -0,0 +1,74 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+from numpy import asarray, einsum, isclose, ix_
+from numpy.random import rand, seed
+from rbnics.backends.online.numpy import Function
+from rbnics.problems.navier_stokes import NavierStokesPODGalerkinReducedProblem
+from rbnics.utils.io import OnlineSizeDict
+
+def _create_reduced_problem(theta_dc, components, convection_tensor):
+    # Only set the attributes of the reduced problem which are required by the contraction
+    class TruthProblem(object):
+        def compute_theta(self, term):
+            assert term == "dc"
+            return theta_dc
+    reduced_problem = NavierStokesPODGalerkinReducedProblem.__new__(NavierStokesPODGalerkinReducedProblem)
+    reduced_problem.truth_problem = TruthProblem()
+    reduced_problem.components = list(components.keys())
+    reduced_problem.basis_functions = {component: [None]*Nmax_component for (component, Nmax_component) in components.items()}
+    reduced_problem.convection_tensor = convection_tensor
+    return reduced_problem
+
+# Test the contraction of the trilinear convection tensor with the reduced solution, also when the
+# reduced solution employs less basis functions than the ones stored in the tensor
+def test_navier_stokes_convection_jacobian():
+    seed(0)
+    Nmax = 6
+    theta_dc = (2., -0.5)
+    Q_dc = len(theta_dc)
+    convection_tensor = rand(Q_dc, Nmax, Nmax, Nmax)
+    reduced_problem = _create_reduced_problem(theta_dc, {"u": Nmax}, convection_tensor)
+    
+    # Compare to the contraction computed by numpy
+    for N in range(1, Nmax + 1):
+        solution_array = rand(N)
+        solution = Function(N)
+        solution.vector()[:] = solution_array
+        jacobian = reduced_problem._assemble_convection_jacobian(solution, N)
+        expected_jacobian = einsum("q,k,qkij->ij", theta_dc, solution_array, convection_tensor[:, :N, :N, :N])
+        assert isclose(asarray(jacobian), expected_jacobian).all()
+        
+# Test the contraction for a problem with several components, in which case the basis functions which are
+# currently employed are not contiguous in the tensor
+def test_navier_stokes_convection_jacobian_components():
+    seed(0)
+    Nmax = OnlineSizeDict([("u", 4), ("p", 3)])
+    theta_dc = (2., -0.5, 1.5)
+    Q_dc = len(theta_dc)
+    convection_tensor = rand(Q_dc, 7, 7, 7)
+    reduced_problem = _create_reduced_problem(theta_dc, Nmax, convection_tensor)
+    
+    # Compare to the contraction computed by numpy on the restricted tensor
+    N = OnlineSizeDict([("u", 2), ("p", 3)])
+    indices = [0, 1, 4, 5, 6]
+    solution_array = rand(len(indices))
+    solution = Function(N)
+    solution.vector()[:] = solution_array
+    jacobian = reduced_problem._assemble_convection_jacobian(solution, N)
+    expected_jacobian = einsum("q,k,qkij->ij", theta_dc, solution_array, convection_tensor[ix_(range(Q_dc), indices, indices, indices)])
+    assert isclose(asarray(jacobian), expected_jacobian).all()
@@ -0,0 +1,120 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import asarray, isclose, memmap
+from numpy.random import rand, seed
+from rbnics.backends import product, sum
+from rbnics.backends.online import OnlineAffineExpansionStorage
+from rbnics.backends.online.numpy import Matrix, Vector
+from rbnics.utils.config import config
+from rbnics.utils.io import OnlineSizeDict
+
+# Create two storages with the same random content, the first one with list-based storage and the second one with stacked storage
+def _create_storages(Q, N, tensor_type):
+    stacked_storage_option = config.get("backends", "online stacked affine expansion storage")
+    storages = list()
+    for stacked in (False, True):
+        config.set("backends", "online stacked affine expansion storage", stacked)
+        storages.append(OnlineAffineExpansionStorage(*Q))
+    config.set("backends", "online stacked affine expansion storage", stacked_storage_option)
+    size = N["u"] + N["p"]
+    for q in _indices(Q):
+        if tensor_type == "Matrix":
+            content = rand(size, size)
+        else:
+            content = rand(size)
+        for storage in storages:
+            if tensor_type == "Matrix":
+                item = Matrix(N, N)
+            else:
+                item = Vector(N)
+            item.content[:] = content
+            storage[q] = item
+    return storages
+    
+def _indices(Q):
+    if len(Q) == 1:
+        return range(Q[0])
+    else:
+        return [(q0, q1) for q0 in range(Q[0]) for q1 in range(Q[1])]
+        
+def _slice(storage, N, tensor_type):
+    if tensor_type == "Matrix":
+        return storage[:N, :N]
+    else:
+        return storage[:N]
+        
+# Test that linear combinations of stacked storages agree with the ones of list-based storages,
+# both for leading slices and for slices of several components, which are not contiguous
+@pytest.mark.parametrize("tensor_type", ["Matrix", "Vector"])
+@pytest.mark.parametrize("Q", [(3, ), (2, 3)])
+def test_online_affine_expansion_storage_stacked_product(tensor_type, Q):
+    seed(0)
+    N = OnlineSizeDict()
+    N["u"] = 4
+    N["p"] = 3
+    (list_storage, stacked_storage) = _create_storages(Q, N, tensor_type)
+    theta = tuple(rand(Q[0]))
+    theta2 = tuple(rand(Q[-1])) if len(Q) == 2 else None
+    N_sub = OnlineSizeDict()
+    N_sub["u"] = 2
+    N_sub["p"] = 1
+    for N_slice in (N, N_sub):
+        list_output = sum(product(theta, _slice(list_storage, N_slice, tensor_type), theta2))
+        stacked_output = sum(product(theta, _slice(stacked_storage, N_slice, tensor_type), theta2))
+        assert stacked_storage.stacked_content() is not None
+        assert asarray(stacked_output).shape == asarray(list_output).shape
+        assert isclose(asarray(stacked_output), asarray(list_output)).all()
+    # Changing an item of the stacked storage invalidates its stacked content
+    changed_storages = _create_storages(Q, N, tensor_type)
+    for (storage, changed_storage) in zip((list_storage, stacked_storage), changed_storages):
+        storage[_indices(Q)[0]] = changed_storage[_indices(Q)[-1]]
+    list_output = sum(product(theta, list_storage, theta2))
+    stacked_output = sum(product(theta, stacked_storage, theta2))
+    assert isclose(asarray(stacked_output), asarray(list_output)).all()
+    
+# Test that a storage saved with stacked storage is loaded with memory mapping, and that a later save without
+# stacked storage is not shadowed by the stacked file saved previously
+@pytest.mark.parametrize("tensor_type", ["Matrix", "Vector"])
+def test_online_affine_expansion_storage_memory_mapped_load(tensor_type, tempdir):
+    seed(0)
+    N = OnlineSizeDict()
+    N["u"] = 4
+    N["p"] = 3
+    (list_storage, stacked_storage) = _create_storages((3, ), N, tensor_type)
+    memory_mapped_storage_option = config.get("backends", "online memory mapped affine expansion storage")
+    config.set("backends", "online memory mapped affine expansion storage", True)
+    try:
+        # Save stacked content, and load it with memory mapping
+        stacked_storage.save(tempdir, "storage")
+        loaded_storage = OnlineAffineExpansionStorage(3)
+        assert loaded_storage.load(tempdir, "storage")
+        for q in range(3):
+            assert isinstance(loaded_storage[q].content, memmap)
+            assert isclose(asarray(loaded_storage[q]), asarray(stacked_storage[q])).all()
+        # Save different content without stacking, which should be the one loaded afterwards
+        list_storage[0] = _create_storages((3, ), N, tensor_type)[0][0]
+        list_storage.save(tempdir, "storage") # list_storage was created with memory mapping disabled
+        loaded_storage = OnlineAffineExpansionStorage(3)
+        assert loaded_storage.load(tempdir, "storage")
+        for q in range(3):
+            assert not isinstance(loaded_storage[q].content, memmap)
+            assert isclose(asarray(loaded_storage[q]), asarray(list_storage[q])).all()
+        assert not isclose(asarray(loaded_storage[0]), asarray(stacked_storage[0])).all()
+    finally:
+        config.set("backends", "online memory mapped affine expansion storage", memory_mapped_storage_option)
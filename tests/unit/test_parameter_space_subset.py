@@ -0,0 +1,62 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from math import sqrt
+from rbnics.sampling import ParameterSpaceSubset
+from rbnics.sampling.distributions import EquispacedDistribution
+
+# Common data
+box = [(2., 5.), (10., 1000.)]
+n = 500
+
+# Reference implementation of closest, based on sorting the whole set (ties are sorted by position)
+def _closest_reference(set_, M, mu):
+    distances = [sqrt(sum([(x - y)**2 for (x, y) in zip(mu, xi_i)])) for xi_i in set_]
+    return [xi_i for (_, xi_i) in sorted(zip(distances, set_), key=lambda pair: pair[0])[:M]]
+
+# Test closest parameters, both with brute force search (first query) and with nearest neighbour search tree
+def test_parameter_space_subset_closest():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n)
+    queries = ParameterSpaceSubset()
+    queries.generate(box, 10)
+    for mu in queries:
+        assert list(parameter_space_subset.closest(5, mu)) == _closest_reference(parameter_space_subset, 5, mu)
+    for (mu, closest) in zip(queries, parameter_space_subset.closest_batch(5, list(queries))):
+        assert list(closest) == _closest_reference(parameter_space_subset, 5, mu)
+    # Changing the set should update the nearest neighbour search tree
+    parameter_space_subset.append(queries[0])
+    assert parameter_space_subset.closest(1, queries[0])[0] == queries[0]
+
+# Test that ties are broken in the same way by brute force search and nearest neighbour search tree
+def test_parameter_space_subset_closest_ties():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate([(0., 1.), (0., 1.)], 25, sampling=EquispacedDistribution())
+    for mu in ((0.5, 0.5), (0., 0.), (0.375, 0.5)):
+        for M in (1, 3, 5):
+            for _ in range(3): # the first query uses brute force search, the following ones the tree
+                assert list(parameter_space_subset.closest(M, mu)) == _closest_reference(parameter_space_subset, M, mu)
+        for closest in parameter_space_subset.closest_batch(3, [mu, mu]):
+            assert list(closest) == _closest_reference(parameter_space_subset, 3, mu)
+    
+# Test difference between parameter space subsets
+def test_parameter_space_subset_diff():
+    parameter_space_subset = ParameterSpaceSubset()
+    parameter_space_subset.generate(box, n)
+    diff = parameter_space_subset.diff(parameter_space_subset[:n//2])
+    assert list(diff) == list(parameter_space_subset[n//2:])
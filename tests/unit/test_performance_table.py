@@ -0,0 +1,120 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+import os
+import sys
+from numpy import exp, isclose, isnan, log
+from rbnics.utils.io import ErrorAnalysisTable, Folders
+
+def _create_table(testing_set):
+    table = ErrorAnalysisTable(testing_set)
+    table.set_Nmax(2)
+    table.add_column("error", group_name="test", operations=("mean", "max"))
+    return table
+    
+def _fill_row(table, mu_index, mu):
+    table["error", 1, mu_index] = mu[0]
+    table["error", 2, mu_index] = NotImplemented
+    
+def test_performance_table_merge_rows(tempdir):
+    testing_set = [(1., ), (2., ), (3., )]
+    folder = Folders.Folder(os.path.join(tempdir, "rows"))
+    folder.create()
+    # Fill the table in two separate partitions
+    for partition in (0, 1):
+        table = _create_table(testing_set)
+        for (mu_index, mu) in enumerate(testing_set):
+            if mu_index % 2 == partition:
+                _fill_row(table, mu_index, mu)
+                table.save_row(folder, mu_index, mu, partition)
+        assert not table.is_complete()
+    # Merge all rows into a new table
+    table = _create_table(testing_set)
+    table.load_rows(folder)
+    assert table.is_complete()
+    for (mu_index, mu) in enumerate(testing_set):
+        assert table.has_row(mu_index)
+    # Aggregates should be the same as the ones of a table filled in by a single run
+    reference_table = _create_table(testing_set)
+    for (mu_index, mu) in enumerate(testing_set):
+        _fill_row(reference_table, mu_index, mu)
+    assert str(table) == str(reference_table)
+    # Rows are not loaded if the testing set has changed
+    table = _create_table([(4., ), (2., ), (3., )])
+    table.load_rows(folder)
+    assert not table.has_row(0)
+    assert table.has_row(1)
+    # Remove rows
+    ErrorAnalysisTable.remove_rows(folder)
+    assert len(os.listdir(str(folder))) == 0
+    
+def test_performance_table_rows_key(tempdir):
+    testing_set = [(1., ), (2., )]
+    folder = Folders.Folder(os.path.join(tempdir, "rows"))
+    folder.create()
+    # Save the first row with a key
+    table = _create_table(testing_set)
+    _fill_row(table, 0, testing_set[0])
+    table.save_row(folder, 0, testing_set[0], 0, "N=[1, 2]")
+    # Rows are only loaded with the same key
+    table = _create_table(testing_set)
+    table.load_rows(folder, "N=[1, 2]")
+    assert table.has_row(0)
+    table = _create_table(testing_set)
+    table.load_rows(folder, "N=[1, None]")
+    assert not table.has_row(0)
+    # Saving a row with a different key discards the rows saved with the previous key
+    _fill_row(table, 1, testing_set[1])
+    table.save_row(folder, 1, testing_set[1], 0, "N=[1, None]")
+    table = _create_table(testing_set)
+    table.load_rows(folder, "N=[1, None]")
+    assert not table.has_row(0)
+    assert table.has_row(1)
+    table = _create_table(testing_set)
+    table.load_rows(folder, "N=[1, 2]")
+    assert not table.has_row(0)
+    assert not table.has_row(1)
+    
+# Rows keys of the error analysis identify the reduced order model by a hash of its reduced operators folder
+def test_performance_table_rows_key_reduced_operators(tempdir):
+    from rbnics.reduction_methods.base.reduction_method import _hash_folder_content
+    folder = Folders.Folder(os.path.join(tempdir, "reduced_operators"))
+    folder.create()
+    with open(os.path.join(str(folder), "operator_a.npy"), "wb") as f:
+        f.write(b"1")
+    hash_1 = _hash_folder_content(folder)
+    assert _hash_folder_content(folder) == hash_1
+    with open(os.path.join(str(folder), "operator_a.npy"), "wb") as f:
+        f.write(b"2")
+    hash_2 = _hash_folder_content(folder)
+    assert hash_2 != hash_1
+    with open(os.path.join(str(folder), "operator_f.npy"), "wb") as f:
+        f.write(b"3")
+    assert _hash_folder_content(folder) != hash_2
+    
+def test_performance_table_running_aggregates():
+    testing_set = [(0., ), (1., ), (2., ), (4., )]
+    table = _create_table(testing_set)
+    for (mu_index, mu) in enumerate(testing_set):
+        _fill_row(table, mu_index, mu)
+        assert table["error", 1, mu_index] == mu[0]
+    groups_content = table._process()
+    (_, _, table_content, _) = groups_content["test"]
+    assert isclose(table_content["max_error"][0], 4.)
+    assert isclose(table_content["gmean_error"][0], exp((log(sys.float_info.epsilon) + log(1.) + log(2.) + log(4.))/4.))
+    assert isnan(table_content["max_error"][1])
@@ -0,0 +1,51 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from rbnics import PODGalerkin
+from rbnics.utils.cache import cache_statistics
+from rbnics.utils.config import config
+from thermal_block import create_thermal_block_problem
+
+# Create a new problem and reduction method, as each task of the snapshot farm would do in its own job
+def _create_reduction_method():
+    problem = create_thermal_block_problem()
+    reduction_method = PODGalerkin(problem)
+    reduction_method.set_Nmax(3)
+    reduction_method.initialize_training_set(10) # the first task generates it, the other ones load it from file
+    return reduction_method
+    
+# Test that snapshots farmed by two tasks in the same folder are all loaded by the offline stage
+def test_pod_galerkin_snapshot_farm(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir) # offline data are stored in a folder named after the problem
+    for task_index in range(2):
+        _create_reduction_method().farm_snapshots(task_index, 2)
+    statistics = dict(cache_statistics["problems"])
+    reduction_method = _create_reduction_method()
+    reduction_method.offline()
+    assert cache_statistics["problems"]["misses"] == statistics["misses"]
+    assert cache_statistics["problems"]["disk hits"] >= statistics["disk hits"] + len(reduction_method.training_set)
+    
+# Test that a bounded disk cache, which would be shared among tasks, is not allowed
+def test_pod_galerkin_snapshot_farm_disk_limit(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    disk_cache_limit = config.get("problems", "disk cache limit")
+    config.set("problems", "disk cache limit", "100")
+    reduction_method = _create_reduction_method()
+    with pytest.raises(AssertionError):
+        reduction_method.farm_snapshots(0, 2)
+    config.set("problems", "disk cache limit", disk_cache_limit)
@@ -0,0 +1,77 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import isclose
+from numpy.random import rand, seed
+from dolfin import assemble, dx, Expression, Function, FunctionSpace, grad, inner, interpolate, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics.backends import ProperOrthogonalDecomposition, transpose
+from rbnics.utils.config import config
+
+# Compute the POD of a set of snapshots with the provided method
+def _apply_POD(method, V, inner_product, snapshots, Nmax):
+    POD_method = config.get("POD", "method")
+    config.set("POD", "method", method)
+    try:
+        POD = ProperOrthogonalDecomposition(V, inner_product)
+    finally:
+        config.set("POD", "method", POD_method)
+    for snapshot in snapshots:
+        POD.store_snapshot(snapshot)
+    (eigenvalues, _, basis_functions, N) = POD.apply(Nmax, 0.)
+    return (eigenvalues, basis_functions, N)
+    
+# Test that randomized and incremental POD provide the same eigenvalues and the same space spanned by the modes as the eigensolver,
+# on a set of snapshots of low rank
+@pytest.mark.parametrize("method", ["randomized", "incremental"])
+def test_proper_orthogonal_decomposition(method):
+    mesh = UnitSquareMesh(8, 8)
+    V = FunctionSpace(mesh, "Lagrange", 2)
+    u = TrialFunction(V)
+    v = TestFunction(V)
+    inner_product = assemble(inner(grad(u), grad(v))*dx + u*v*dx)
+    
+    # Generate snapshots as random combinations of three functions
+    seed(0)
+    rank = 3
+    generators = [interpolate(Expression(expression, degree=2), V) for expression in ("1 + x[0]", "x[0]*x[1]", "sin(pi*x[1])")]
+    snapshots = list()
+    for _ in range(10):
+        snapshot = Function(V)
+        for (coefficient, generator) in zip(rand(rank), generators):
+            snapshot.vector().axpy(coefficient, generator.vector())
+        snapshots.append(snapshot)
+    
+    # Compute decompositions
+    (reference_eigenvalues, reference_basis_functions, reference_N) = _apply_POD("eigensolver", V, inner_product, snapshots, rank)
+    (eigenvalues, basis_functions, N) = _apply_POD(method, V, inner_product, snapshots, rank)
+    assert reference_N == rank
+    assert N == rank
+    
+    # Compare eigenvalues
+    for n in range(rank):
+        assert isclose(eigenvalues[n], reference_eigenvalues[n], rtol=1.e-6)
+        
+    # Compare spans: modes should be orthonormal, and their projection on the reference modes should be the identity
+    for n in range(rank):
+        residual = Function(V)
+        residual.vector().axpy(1., basis_functions[n].vector())
+        for m in range(rank):
+            assert isclose(transpose(basis_functions[n])*inner_product*basis_functions[m], 1. if n == m else 0., atol=1.e-8)
+            coefficient = transpose(reference_basis_functions[m])*inner_product*basis_functions[n]
+            residual.vector().axpy(- coefficient, reference_basis_functions[m].vector())
+        assert isclose(transpose(residual)*inner_product*residual, 0., atol=1.e-8)
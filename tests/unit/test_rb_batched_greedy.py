@@ -0,0 +1,59 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+import pytest
+from numpy import isclose
+from rbnics import ExactParametrizedFunctions, ReducedBasis
+from thermal_block import create_thermal_block_problem, ThermalBlock
+
+# Test that the batched greedy search provides the same error estimators, and thus the same maximizer, of the default one
+def test_rb_batched_greedy(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir) # offline data are stored in a folder named after the problem
+    problem = create_thermal_block_problem(ThermalBlock)
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(3)
+    reduction_method.initialize_training_set(50)
+    reduced_problem = reduction_method.offline()
+    training_set = reduction_method.training_set
+    
+    def solve_and_estimate_error(mu):
+        reduced_problem.set_mu(mu)
+        reduced_problem.solve()
+        return reduced_problem.estimate_error()
+    
+    error_estimators = reduced_problem.solve_and_estimate_error_batch(list(training_set))
+    assert len(error_estimators) == len(training_set)
+    for (mu, error_estimator) in zip(training_set, error_estimators):
+        assert isclose(error_estimator, solve_and_estimate_error(mu))
+    (error_estimator_max, error_estimator_argmax) = training_set.max(solve_and_estimate_error)
+    (batched_error_estimator_max, batched_error_estimator_argmax) = training_set.max_batch(reduced_problem.solve_and_estimate_error_batch)
+    assert isclose(batched_error_estimator_max, error_estimator_max)
+    assert batched_error_estimator_argmax == error_estimator_argmax
+    
+    # Processing parameters in several chunks, and vectorizing thetas over parameters, provides the same error estimators
+    reduced_problem.batch_size = 7
+    problem.vectorized_compute_theta = True
+    assert isclose(reduced_problem.solve_and_estimate_error_batch(list(training_set)), error_estimators).all()
+    
+# Test that the batched greedy search cannot be enabled when operators are not affine
+def test_rb_batched_greedy_exact(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir)
+    ExactThermalBlock = ExactParametrizedFunctions()(ThermalBlock)
+    problem = create_thermal_block_problem(ExactThermalBlock)
+    reduction_method = ReducedBasis(problem)
+    with pytest.raises(AssertionError):
+        reduction_method.set_batched_greedy(True)
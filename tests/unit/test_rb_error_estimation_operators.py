@@ -0,0 +1,54 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+from numpy import asarray, isclose
+from rbnics import ReducedBasis
+from rbnics.backends import transpose
+from thermal_block import create_thermal_block_problem
+
+# Compare error estimation operators, assembled incrementally during the offline stage, to the ones assembled from scratch
+def assert_error_estimation_operators_equal_to_full_assembly(reduced_problem):
+    X = reduced_problem._error_estimation_inner_product
+    riesz = reduced_problem.riesz
+    for (q0, q1) in ((0, 0), (0, 1), (1, 0), (1, 1)):
+        full_operator = transpose(riesz["a"][q0])*X*riesz["a"][q1]
+        assert isclose(asarray(reduced_problem.error_estimation_operator["a", "a"][q0, q1]), asarray(full_operator)).all()
+    for q0 in (0, 1):
+        full_operator = transpose(riesz["a"][q0])*X*riesz["f"][0][0]
+        assert isclose(asarray(reduced_problem.error_estimation_operator["a", "f"][q0, 0]), asarray(full_operator)).all()
+        
+# Test that incremental assembly of error estimation operators agrees with the assembly from scratch, also after Riesz representors are cleared
+def test_rb_error_estimation_operators(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir) # offline data are stored in a folder named after the problem
+    problem = create_thermal_block_problem()
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(3)
+    reduction_method.initialize_training_set(10)
+    reduced_problem = reduction_method.offline()
+    assert len(reduced_problem.riesz["a"][0]) == 3
+    assert_error_estimation_operators_equal_to_full_assembly(reduced_problem)
+    
+    # Mimic a non hierarchical update of the basis, as in POD-Greedy: Riesz representors are cleared,
+    # and then computed again for a basis with the same size, so that previous operators cannot be reused
+    previous_operator = asarray(reduced_problem.error_estimation_operator["a", "a"][0, 0]).copy()
+    reduced_problem.clear_riesz_representation("a")
+    assert len(reduced_problem.riesz["a"][0]) == 0
+    reduced_problem.basis_functions[0].vector()[:] *= 2.
+    reduced_problem.build_error_estimation_operators()
+    assert len(reduced_problem.riesz["a"][0]) == 3
+    assert_error_estimation_operators_equal_to_full_assembly(reduced_problem)
+    assert not isclose(asarray(reduced_problem.error_estimation_operator["a", "a"][0, 0]), previous_operator).all()
@@ -0,0 +1,78 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+from numpy import asarray, isclose
+from rbnics import ReducedBasis
+from thermal_block import create_thermal_block_problem
+
+# Test that reduced operators are reused for the same parameter and reduced dimension, and recomputed otherwise
+def test_reduced_operators_cache(tempdir, monkeypatch):
+    monkeypatch.chdir(tempdir) # offline data are stored in a folder named after the problem
+    problem = create_thermal_block_problem()
+    reduction_method = ReducedBasis(problem)
+    reduction_method.set_Nmax(3)
+    reduction_method.initialize_training_set(10)
+    reduced_problem = reduction_method.offline()
+    
+    def expected_operator(mu, N):
+        return mu[0]*asarray(reduced_problem.operator["a"][0])[:N, :N] + asarray(reduced_problem.operator["a"][1])[:N, :N]
+        
+    # First call is a cache miss, second call is a cache hit
+    reduced_problem.set_mu((1.0, 0.0))
+    number_of_avoided_assemblies = reduced_problem.number_of_avoided_assemblies
+    operator_1_3 = reduced_problem._assemble_reduced_operator("a", 3)
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies
+    assert reduced_problem._assemble_reduced_operator("a", 3) is operator_1_3
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 1
+    assert isclose(asarray(operator_1_3), expected_operator((1.0, 0.0), 3)).all()
+    
+    # A different reduced dimension is a cache miss
+    operator_1_2 = reduced_problem._assemble_reduced_operator("a", 2)
+    assert operator_1_2 is not operator_1_3
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 1
+    assert isclose(asarray(operator_1_2), expected_operator((1.0, 0.0), 2)).all()
+    
+    # A different parameter is a cache miss, and does not evict the previous ones
+    reduced_problem.set_mu((5.0, 0.0))
+    operator_5_3 = reduced_problem._assemble_reduced_operator("a", 3)
+    assert operator_5_3 is not operator_1_3
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 1
+    assert isclose(asarray(operator_5_3), expected_operator((5.0, 0.0), 3)).all()
+    reduced_problem.set_mu((1.0, 0.0))
+    assert reduced_problem._assemble_reduced_operator("a", 3) is operator_1_3
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 2
+    
+    # Rebuilding reduced operators invalidates the cache
+    reduced_problem._build_reduced_operators("offline")
+    operator_1_3_rebuilt = reduced_problem._assemble_reduced_operator("a", 3)
+    assert operator_1_3_rebuilt is not operator_1_3
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 2
+    assert isclose(asarray(operator_1_3_rebuilt), asarray(operator_1_3)).all()
+    
+    # Initializing the reduced problem invalidates the cache as well
+    reduced_problem.init("online")
+    assert reduced_problem._assemble_reduced_operator("a", 3) is not operator_1_3_rebuilt
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 2
+    
+    # Online solvers are reused as well, so that the reduced system is factorized only once for each parameter and size
+    reduced_problem.set_mu((1.0, 0.0))
+    reduced_problem._solution_cache.clear()
+    solution = asarray(reduced_problem.solve(3).vector()).copy()
+    number_of_avoided_assemblies = reduced_problem.number_of_avoided_assemblies
+    reduced_problem._solution_cache.clear()
+    assert isclose(asarray(reduced_problem.solve(3).vector()), solution).all()
+    assert reduced_problem.number_of_avoided_assemblies == number_of_avoided_assemblies + 1
@@ -0,0 +1,64 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+
+from numpy import isclose
+from rbnics.backends import TimeQuadrature, TimeSeries
+from rbnics.backends.online import OnlineFunction
+
+# Test contiguous storage of online functions, with slices sharing storage with the original time series
+def test_time_series_online_functions():
+    time_series = TimeSeries((0., 1.), 0.1)
+    for k in range(11):
+        function = OnlineFunction(3)
+        function.vector()[:] = k
+        time_series.append(function)
+    assert len(time_series) == 11
+    assert time_series.array().shape == (11, 3)
+    assert time_series.at(0.5).vector()[0] == 5.
+    assert time_series[-1].vector()[2] == 10.
+    time_series_slice = time_series[1:]
+    assert len(time_series_slice) == 10
+    assert time_series_slice.array().base is not None
+    assert time_series_slice[0].vector()[0] == 1.
+    integral = TimeQuadrature((0., 1.), time_series).integrate()
+    assert isclose(integral.vector()[0], 5.)
+    
+# Test contiguous storage of numbers, and fallback to a list when storing other objects
+def test_time_series_numbers():
+    time_series = TimeSeries((0., 1.), 0.5)
+    time_series.extend([1., 2., 3.])
+    assert list(time_series) == [1., 2., 3.]
+    assert time_series.stored_times() == [0., 0.5, 1.]
+    assert time_series.expected_times() == [0., 0.5, 1.]
+    time_series.append(NotImplemented)
+    assert time_series.array() is None
+    assert list(time_series) == [1., 2., 3., NotImplemented]
+    time_series.clear()
+    assert len(time_series) == 0
+    
+# Test that slices and items are not affected by clearing and refilling the original time series
+def test_time_series_clear():
+    time_series = TimeSeries((0., 1.), 0.5)
+    time_series.extend([1., 2., 3.])
+    time_series_slice = time_series[0:2]
+    array = time_series.array()
+    time_series.clear()
+    time_series.extend([7., 8., 9.])
+    assert list(time_series_slice) == [1., 2.]
+    assert list(array) == [1., 2., 3.]
+    assert list(time_series) == [7., 8., 9.]
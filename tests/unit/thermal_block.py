@@ -0,0 +1,69 @@
+# Copyright (C) 2015-2018 by the RBniCS authors
+#
+# This file is part of RBniCS.
+#
+# RBniCS is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# RBniCS is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with RBniCS. If not, see <http://www.gnu.org/licenses/>.
+#
+from dolfin import CompiledSubDomain, Constant, DirichletBC, FunctionSpace, grad, inner, Measure, MeshFunction, TestFunction, TrialFunction, UnitSquareMesh
+from rbnics import EllipticCoerciveCompliantProblem
+
+# Thermal block problem on the unit square, with two subdomains, shared by tests which require a small reduced order model
+class ThermalBlock(EllipticCoerciveCompliantProblem):
+    def __init__(self, V, **kwargs):
+        EllipticCoerciveCompliantProblem.__init__(self, V, **kwargs)
+        self.subdomains, self.boundaries = kwargs["subdomains"], kwargs["boundaries"]
+        self.u = TrialFunction(V)
+        self.v = TestFunction(V)
+        self.dx = Measure("dx")(subdomain_data=self.subdomains)
+        self.ds = Measure("ds")(subdomain_data=self.boundaries)
+        
+    def get_stability_factor(self):
+        return min(self.compute_theta("a"))
+    
+    def compute_theta(self, term):
+        mu = self.mu
+        if term == "a":
+            return (mu[0], 1.)
+        elif term == "f":
+            return (mu[1], )
+        else:
+            raise ValueError("Invalid term for compute_theta().")
+            
+    def assemble_operator(self, term):
+        u = self.u
+        v = self.v
+        dx = self.dx
+        ds = self.ds
+        if term == "a":
+            return (inner(grad(u), grad(v))*dx(1), inner(grad(u), grad(v))*dx(2))
+        elif term == "f":
+            return (v*ds(1), )
+        elif term == "dirichlet_bc":
+            return ([DirichletBC(self.V, Constant(0.0), self.boundaries, 3)], )
+        elif term == "inner_product":
+            return (inner(grad(u), grad(v))*dx, )
+        else:
+            raise ValueError("Invalid term for assemble_operator().")
+            
+def create_thermal_block_problem(ProblemClass=ThermalBlock):
+    mesh = UnitSquareMesh(8, 8)
+    subdomains = MeshFunction("size_t", mesh, mesh.topology().dim(), 2)
+    CompiledSubDomain("x[0] <= 0.5").mark(subdomains, 1)
+    boundaries = MeshFunction("size_t", mesh, mesh.topology().dim() - 1, 0)
+    CompiledSubDomain("on_boundary && near(x[1], 0.)").mark(boundaries, 1)
+    CompiledSubDomain("on_boundary && near(x[1], 1.)").mark(boundaries, 3)
+    V = FunctionSpace(mesh, "Lagrange", 1)
+    problem = ProblemClass(V, subdomains=subdomains, boundaries=boundaries)
+    problem.set_mu_range([(0.1, 10.0), (-1.0, 1.0)])
+    return problem